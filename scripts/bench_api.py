@@ -0,0 +1,116 @@
+from __future__ import annotations
+
+import asyncio
+import time
+from collections import Counter
+from typing import Optional
+from urllib.parse import urlsplit
+
+import numpy as np
+import typer
+
+app = typer.Typer(help="Load-test the read-only opportunities API with concurrent keep-alive connections.")
+
+
+def _synthetic_board(players: int, books: int, bankroll: float):
+    from arbitrage_model.api import OpportunityBoard
+    from arbitrage_model.vectorized import decode_offers, synthetic_board
+
+    board = OpportunityBoard(bankroll)
+    board.update("synthetic", decode_offers(synthetic_board(players, markets=2, lines=2, books=books)))
+    return board
+
+
+async def _client(
+    host: str, port: int, request: bytes, deadline: float, latencies: list[float], statuses: Counter
+) -> None:
+    reader, writer = await asyncio.open_connection(host, port)
+    try:
+        while time.perf_counter() < deadline:
+            started = time.perf_counter()
+            writer.write(request)
+            head = await reader.readuntil(b"\r\n\r\n")
+            status_line, *header_lines = head.decode("latin-1").split("\r\n")
+            length = next(
+                (int(line.split(":", 1)[1]) for line in header_lines if line.lower().startswith("content-length:")), 0
+            )
+            if length:
+                await reader.readexactly(length)
+            latencies.append(time.perf_counter() - started)
+            statuses[int(status_line.split(" ")[1])] += 1
+    finally:
+        writer.close()
+
+
+async def _load(
+    host: str, port: int, path: str, connections: int, duration: float, etag: Optional[str]
+) -> tuple[list[float], Counter, float]:
+    lines = [f"GET {path} HTTP/1.1", f"Host: {host}:{port}"]
+    if etag:
+        lines.append(f"If-None-Match: {etag}")
+    request = ("\r\n".join(lines) + "\r\n\r\n").encode("latin-1")
+    latencies: list[float] = []
+    statuses: Counter = Counter()
+    started = time.perf_counter()
+    deadline = started + duration
+    await asyncio.gather(*(_client(host, port, request, deadline, latencies, statuses) for _ in range(connections)))
+    return latencies, statuses, time.perf_counter() - started
+
+
+@app.command()
+def bench(
+    url: Optional[str] = typer.Option(
+        None, help="Running `serve_api` to target, e.g. http://127.0.0.1:8765 (default: in-process synthetic board)."
+    ),
+    path: str = typer.Option("/opportunities?min_edge=1", help="Request target, with query."),
+    connections: int = typer.Option(32, help="Concurrent keep-alive connections."),
+    duration: float = typer.Option(5.0, help="Seconds to run."),
+    etag: bool = typer.Option(False, help="Send If-None-Match with the current ETag (measures the 304 path)."),
+    players: int = typer.Option(2_000, help="Synthetic board size (in-process mode)."),
+    books: int = typer.Option(6, help="Books on the synthetic board (in-process mode)."),
+    bankroll: float = typer.Option(100.0, help="Bankroll for the synthetic board (in-process mode)."),
+) -> None:
+    """Report requests/s, latency percentiles and status counts. In-process mode shares one
+    event loop between server and clients, so it understates what a separate server sustains."""
+
+    async def _run() -> tuple[list[float], Counter, float]:
+        server = None
+        if url is None:
+            from arbitrage_model.api import ApiServer
+
+            board = _synthetic_board(players, books, bankroll)
+            typer.echo(f"Board: {len(board.scanner.quotes):,} lines, {len(board.scanner.arbs):,} opportunities")
+            server = await ApiServer(board).start("127.0.0.1", 0)
+            host, port = server.sockets[0].getsockname()[:2]
+        else:
+            parts = urlsplit(url)
+            host, port = parts.hostname or "127.0.0.1", parts.port or 80
+        tag = None
+        if etag:
+            reader, writer = await asyncio.open_connection(host, port)
+            writer.write(f"HEAD {path} HTTP/1.1\r\nHost: {host}\r\nConnection: close\r\n\r\n".encode("latin-1"))
+            head = (await reader.readuntil(b"\r\n\r\n")).decode("latin-1")
+            writer.close()
+            tag = next((line.split(":", 1)[1].strip() for line in head.split("\r\n")
+                        if line.lower().startswith("etag:")), None)
+        try:
+            return await _load(host, port, path, connections, duration, tag)
+        finally:
+            if server is not None:
+                server.close()
+                await server.wait_closed()
+
+    latencies, statuses, elapsed = asyncio.run(_run())
+    if not latencies:
+        typer.echo("No responses received.")
+        raise typer.Exit(code=1)
+    ms = np.array(latencies) * 1000
+    typer.echo(
+        f"{len(ms):,} requests in {elapsed:.2f}s over {connections} connections: {len(ms) / elapsed:,.0f} req/s; "
+        f"p50 {np.percentile(ms, 50):.2f} ms, p99 {np.percentile(ms, 99):.2f} ms"
+    )
+    typer.echo("Statuses: " + ", ".join(f"{code}={count:,}" for code, count in sorted(statuses.items())))
+
+
+if __name__ == "__main__":
+    app()
@@ -0,0 +1,60 @@
+from __future__ import annotations
+
+import os
+import statistics
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+import typer
+
+app = typer.Typer(help="Benchmark interpreter startup + import time for each CLI entry point.")
+
+ENTRY_POINTS = {
+    "run_arbitrage_scan": "scripts.run_arbitrage_scan",
+    "run_backtest": "scripts.run_backtest",
+    "scrape_books": "scripts.scrape_books",
+}
+HEAVY_MODULES = ("pandas", "numpy", "selenium", "tabulate")
+
+_PROBE = (
+    "import importlib, sys, time;"
+    "t = time.perf_counter();"
+    "importlib.import_module({module!r});"
+    "elapsed = time.perf_counter() - t;"
+    "heavy = [m for m in {heavy!r} if m in sys.modules];"
+    "print(f'{{elapsed:.6f}}|{{\",\".join(heavy)}}')"
+)
+
+
+@app.command()
+def imports(
+    repeat: int = typer.Option(7, help="Fresh interpreters to spawn per entry point."),
+    root: Path = typer.Option(Path("."), help="Repository root (must contain src/ and scripts/)."),
+) -> None:
+    """Report median wall time (interpreter + imports) and import-only time per entry point."""
+    env = dict(os.environ)
+    env["PYTHONPATH"] = os.pathsep.join(filter(None, [str(root / "src"), str(root), env.get("PYTHONPATH")]))
+
+    typer.echo(f"{'entry point':<22} {'wall ms':>9} {'import ms':>10}  heavy modules loaded")
+    for name, module in ENTRY_POINTS.items():
+        walls, imports_ = [], []
+        heavy = ""
+        for _ in range(repeat):
+            code = _PROBE.format(module=module, heavy=HEAVY_MODULES)
+            start = time.perf_counter()
+            out = subprocess.run(
+                [sys.executable, "-c", code], env=env, cwd=root, capture_output=True, text=True, check=True
+            ).stdout.strip()
+            walls.append(time.perf_counter() - start)
+            elapsed, heavy = out.rsplit("\n", 1)[-1].split("|")
+            imports_.append(float(elapsed))
+        typer.echo(
+            f"{name:<22} {statistics.median(walls) * 1000:>9.1f} {statistics.median(imports_) * 1000:>10.1f}  "
+            f"{heavy or '-'}"
+        )
+
+
+if __name__ == "__main__":
+    app()
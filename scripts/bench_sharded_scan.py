@@ -0,0 +1,52 @@
+from __future__ import annotations
+
+import os
+import time
+
+import typer
+
+from arbitrage_model.sharding import ShardedScanner
+from arbitrage_model.vectorized import scan_arrays, synthetic_board
+
+app = typer.Typer(help="Benchmark sharded multi-process arbitrage scanning on a synthetic board.")
+
+
+@app.command()
+def scan(
+    players: int = typer.Option(20_000, help="Distinct players on the board."),
+    markets: int = typer.Option(8, help="Markets per player."),
+    lines: int = typer.Option(3, help="Alternate lines per market."),
+    books: int = typer.Option(6, help="Books quoting every line."),
+    max_workers: int = typer.Option(os.cpu_count() or 1, help="Largest worker count to test."),
+    repeat: int = typer.Option(3, help="Timed scans per worker count (best is reported)."),
+) -> None:
+    """Report quotes/sec for the single-process kernel and for 1..max_workers shards."""
+    board = synthetic_board(players, markets, lines, books)
+    typer.echo(f"Board: {len(board):,} quotes; cores available: {os.cpu_count()}")
+
+    best = min(_time(lambda: scan_arrays(board.player_code, board.market_code, board.line,
+                                         board.over_odds, board.under_odds)) for _ in range(repeat))
+    typer.echo(f"{'in-process':<12} {best * 1000:>9.1f} ms {len(board) / best:>14,.0f} quotes/s")
+
+    baseline = None
+    workers = 1
+    while workers <= max_workers:
+        with ShardedScanner(workers=workers) as scanner:
+            scanner.scan_arrays(board)  # warm the pool
+            best = min(_time(lambda: scanner.scan_arrays(board)) for _ in range(repeat))
+        baseline = baseline or best
+        typer.echo(
+            f"{f'{workers} worker(s)':<12} {best * 1000:>9.1f} ms {len(board) / best:>14,.0f} quotes/s "
+            f"speedup {baseline / best:>5.2f}x"
+        )
+        workers = workers * 2 if workers * 2 <= max_workers or workers == max_workers else max_workers
+
+
+def _time(fn) -> float:
+    start = time.perf_counter()
+    fn()
+    return time.perf_counter() - start
+
+
+if __name__ == "__main__":
+    app()
@@ -0,0 +1,53 @@
+from __future__ import annotations
+
+import asyncio
+import time
+from pathlib import Path
+from typing import Optional
+
+import typer
+
+from arbitrage_model.aggregator import opportunities_to_rows
+from arbitrage_model.bus import ArbSubscriber, subscribe_unix
+from arbitrage_model.tables import to_markdown
+
+app = typer.Typer(help="Scan quote batches streamed by `scrape_books watch --bus-socket` from another process.")
+
+
+@app.command()
+def listen(
+    socket: Path = typer.Argument(..., help="Unix socket passed to `scrape_books watch --bus-socket`."),
+    bankroll: float = typer.Option(100.0, help="Bankroll for stake sizing."),
+    limit: Optional[int] = typer.Option(None, help="Stop after this many batches (default: until the feed closes)."),
+) -> None:
+    """Print new arbitrage opportunities as boards arrive, with publish-to-detection latency."""
+
+    def _print(opportunities, batch) -> None:
+        lag_ms = (time.time() - batch.published_at) * 1000
+        typer.echo(f"#{batch.seq} {batch.book}: {len(opportunities)} new ({lag_ms:.1f} ms after publish)")
+        typer.echo(to_markdown(opportunities_to_rows(opportunities)))
+
+    scanner = ArbSubscriber(bankroll, on_new=_print)
+
+    async def _run() -> int:
+        received = 0
+        async for batch in subscribe_unix(socket):
+            scanner(batch)
+            received += 1
+            if limit is not None and received >= limit:
+                break
+        return received
+
+    try:
+        received = asyncio.run(_run())
+    except (ConnectionError, FileNotFoundError) as exc:
+        typer.echo(f"Cannot read {socket}: {exc}")
+        raise typer.Exit(code=1)
+    except KeyboardInterrupt:
+        received = None
+    if received is not None:
+        typer.echo(f"Feed closed after {received} batches; {len(scanner.opportunities)} open opportunities.")
+
+
+if __name__ == "__main__":
+    app()
@@ -0,0 +1,65 @@
+from __future__ import annotations
+
+import time
+from pathlib import Path
+
+import typer
+
+app = typer.Typer(help="Re-parse saved sportsbook page HTML offline with the live scrapers' extraction rules.")
+
+
+@app.command()
+def parse(
+    book: str = typer.Argument(..., help="Book parser: draftkings, fanduel, bovada, prizepicks, rotowire, espn_boxscore."),
+    input_dir: Path = typer.Option(..., "--input-dir", "-i", help="Directory of saved pages."),
+    pattern: str = typer.Option("*.html", help="Glob (recursive) selecting page files."),
+    output: Path = typer.Option(..., "--output", "-o", help="CSV to write combined rows to."),
+    workers: int = typer.Option(0, help="Worker processes (0 = one per CPU)."),
+) -> None:
+    from arbitrage_model.scrapers.offline import parse_html_files
+
+    paths = sorted(input_dir.rglob(pattern))
+    if not paths:
+        typer.echo(f"No files matching {pattern!r} under {input_dir}")
+        raise typer.Exit(code=1)
+
+    errors: list[tuple[Path, str]] = []
+    start = time.perf_counter()
+    df = parse_html_files(paths, book, workers=workers or None, errors=errors)
+    elapsed = time.perf_counter() - start
+
+    output.parent.mkdir(parents=True, exist_ok=True)
+    df.to_csv(output, index=False)
+    for path, error in errors:
+        typer.echo(f"Warning: failed to parse {path}: {error}")
+    typer.echo(
+        f"Parsed {len(paths) - len(errors)}/{len(paths)} pages into {len(df)} rows in {elapsed:.2f}s "
+        f"({len(paths) / elapsed * 60:,.0f} pages/min) -> {output}"
+    )
+
+
+@app.command()
+def archive(
+    book: str = typer.Argument(..., help="Book key used when archiving (e.g. draftkings)."),
+    archive_dir: Path = typer.Option(..., "--archive-dir", "-a", help="Snapshot archive root (contains index.jsonl)."),
+    output: Path = typer.Option(..., "--output", "-o", help="CSV to write combined rows to."),
+    workers: int = typer.Option(0, help="Worker processes (0 = one per CPU)."),
+) -> None:
+    """Re-parse archived snapshots (see `scrape_books --archive-dir`) instead of loose HTML files."""
+    from arbitrage_model.scrapers.offline import parse_archive
+
+    errors: list[tuple[Path, str]] = []
+    start = time.perf_counter()
+    df = parse_archive(archive_dir, book, workers=workers or None, errors=errors)
+    elapsed = time.perf_counter() - start
+
+    output.parent.mkdir(parents=True, exist_ok=True)
+    df.to_csv(output, index=False)
+    for path, error in errors:
+        typer.echo(f"Warning: failed to parse {path}: {error}")
+    captures = df["captured_at"].nunique() if "captured_at" in df else 0
+    typer.echo(f"Parsed {captures} captures into {len(df)} rows in {elapsed:.2f}s -> {output}")
+
+
+if __name__ == "__main__":
+    app()
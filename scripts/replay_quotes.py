@@ -0,0 +1,98 @@
+from __future__ import annotations
+
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from typing import List, Optional
+
+import numpy as np
+import typer
+
+from arbitrage_model.replay import (
+    DATED_PATTERN,
+    SCANNERS,
+    Snapshot,
+    format_replay,
+    load_snapshot_archive,
+    load_snapshot_dir,
+    replay,
+    snapshot_events,
+)
+from arbitrage_model.tables import to_markdown
+from arbitrage_model.vectorized import synthetic_board
+
+app = typer.Typer(help="Replay quote snapshots through the arbitrage scanner to measure latency and throughput.")
+
+
+def synthetic_snapshots(
+    players: int, books: int, snapshots: int, change_fraction: float, interval_s: float, seed: int = 7
+) -> List[Snapshot]:
+    """A multi-book board where `change_fraction` of each book's prices move between captures."""
+    rng = np.random.default_rng(seed)
+    board = synthetic_board(players, markets=2, lines=2, books=books, seed=seed)
+    over, under = board.over_odds.copy(), board.under_odds.copy()
+    keys = [
+        (board.players[p], board.markets[m], float(line))
+        for p, m, line in zip(board.player_code.tolist(), board.market_code.tolist(), board.line.tolist())
+    ]
+    start = datetime(2025, 5, 9, 18, tzinfo=timezone.utc)
+    result = []
+    for step in range(snapshots):
+        if step:
+            moved = rng.random(len(board)) < change_fraction
+            over[moved] = rng.integers(-135, 125, size=int(moved.sum()))
+            under[moved] = rng.integers(-135, 125, size=int(moved.sum()))
+            over[(over > -100) & (over < 100)] = -110
+            under[(under > -100) & (under < 100)] = -110
+        for b, book in enumerate(board.books):
+            rows = np.flatnonzero(board.book_code == b)
+            quotes = {keys[i]: (int(over[i]), int(under[i])) for i in rows.tolist()}
+            # Books capture a few seconds apart, like a scraper working through them.
+            captured = start + timedelta(seconds=step * interval_s + b * 2)
+            result.append(Snapshot(book=book, captured_at=captured, quotes=quotes))
+    return result
+
+
+@app.command()
+def run(
+    data_dir: Path = typer.Option(Path("data/raw"), help="Directory of dated snapshot CSVs."),
+    pattern: str = typer.Option(DATED_PATTERN, help="Glob for snapshot files in --data-dir."),
+    archive_dir: Optional[Path] = typer.Option(None, help="Replay a page archive instead of CSV snapshots."),
+    book: List[str] = typer.Option([], help="Book(s) to replay from --archive-dir (repeatable)."),
+    synthetic: int = typer.Option(0, help="Generate this many synthetic multi-book captures instead."),
+    players: int = typer.Option(2_000, help="Players on the synthetic board."),
+    books: int = typer.Option(6, help="Books on the synthetic board."),
+    change_fraction: float = typer.Option(0.05, help="Share of synthetic prices that move per capture."),
+    scanner: str = typer.Option("incremental", help=f"Scanner under test: {', '.join(SCANNERS)}."),
+    speed: float = typer.Option(60.0, help="Replay speed multiple (1 = real time)."),
+    max_gap: Optional[float] = typer.Option(60.0, help="Cap idle gaps between captures at N seconds (pre speed-up)."),
+    per_event: bool = typer.Option(False, help="Feed the scanner one event at a time instead of whole captures."),
+    bankroll: float = typer.Option(100.0, help="Bankroll for stake sizing."),
+) -> None:
+    """Paced replay for latency percentiles, then a flat-out replay for maximum sustainable throughput."""
+    if scanner not in SCANNERS:
+        raise typer.BadParameter(f"expected one of {sorted(SCANNERS)}", param_hint="--scanner")
+    if synthetic:
+        snapshots = synthetic_snapshots(players, books, synthetic, change_fraction, interval_s=30.0)
+    elif archive_dir is not None:
+        if not book:
+            raise typer.BadParameter("pass at least one --book with --archive-dir", param_hint="--book")
+        snapshots = load_snapshot_archive(archive_dir, book)
+    else:
+        snapshots = load_snapshot_dir(data_dir, pattern=pattern)
+    events = snapshot_events(snapshots)
+    if not events:
+        typer.echo("No snapshots found; nothing to replay.")
+        raise typer.Exit(code=1)
+    typer.echo(f"{len(snapshots)} snapshots -> {len(events):,} quote events")
+
+    runs = []
+    if speed > 0:
+        runs.append((f"{scanner} @ {speed:g}x", replay(events, SCANNERS[scanner](bankroll), speed, max_gap, per_event)))
+    runs.append((f"{scanner} flat-out", replay(events, SCANNERS[scanner](bankroll), 0.0, max_gap, per_event)))
+    typer.echo(to_markdown(format_replay(runs)))
+    if len(runs) == 2 and runs[0][1].offered_rate > runs[1][1].throughput:
+        typer.echo("Offered rate exceeds maximum throughput: the scanner falls behind at this speed.")
+
+
+if __name__ == "__main__":
+    app()
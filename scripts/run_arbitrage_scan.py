@@ -4,7 +4,8 @@ from pathlib import Path
 
 import typer
 
-from arbitrage_model.aggregator import detect_arbitrage_from_dir, opportunities_to_frame
+from arbitrage_model.aggregator import detect_arbitrage_from_dir, load_offers_from_dir, opportunities_to_rows
+from arbitrage_model.tables import to_markdown
 
 app = typer.Typer(help="Scan sportsbook CSVs for two-way arbitrage opportunities.")
 
@@ -15,13 +16,20 @@ def scan(
         Path("data/raw"), "--data-dir", "-d", help="Directory containing sportsbook CSVs."
     ),
     bankroll: float = typer.Option(100.0, "--bankroll", "-b", help="Total stake to deploy per market."),
+    workers: int = typer.Option(
+        0, "--workers", "-w", help="Shard the scan across N processes (0 = single-process scan)."
+    ),
 ) -> None:
-    opportunities = detect_arbitrage_from_dir(data_dir, bankroll=bankroll)
+    if workers:
+        from arbitrage_model.sharding import find_two_way_arbs_sharded
+
+        opportunities = find_two_way_arbs_sharded(load_offers_from_dir(data_dir), bankroll=bankroll, workers=workers)
+    else:
+        opportunities = detect_arbitrage_from_dir(data_dir, bankroll=bankroll)
     if not opportunities:
         typer.echo("No arbitrage opportunities detected with current inputs.")
         raise typer.Exit()
-    frame = opportunities_to_frame(opportunities)
-    typer.echo(frame.to_markdown(index=False))
+    typer.echo(to_markdown(opportunities_to_rows(opportunities)))
 
 
 if __name__ == "__main__":
@@ -5,7 +5,8 @@ from pathlib import Path
 import typer
 
 from arbitrage_model.backtesting.loader import align_predictions_to_quotes, load_predictions, load_quotes_from_dir
-from arbitrage_model.backtesting.simulator import simulate_expected_value, to_frame
+from arbitrage_model.backtesting.simulator import simulate_expected_value, to_rows
+from arbitrage_model.tables import to_markdown
 
 app = typer.Typer(help="Backtest model predictions against historical sportsbook quotes (expected-value only).")
 
@@ -31,7 +32,183 @@ def expected_value(
     typer.echo(f"Expected profit: {result.expected_profit:.2f}")
     typer.echo(f"Notes: {result.notes}")
     typer.echo("\nTop bets (expected-value):")
-    typer.echo(to_frame(result).head(25).to_markdown(index=False))
+    typer.echo(to_markdown(to_rows(result)[:25]))
+
+
+@app.command()
+def monte_carlo(
+    predictions_csv: Path = typer.Option(..., help="CSV with columns: player, market, line, prob_over."),
+    quotes_dir: Path = typer.Option(Path("data/raw"), help="Directory of sportsbook CSVs (players,line,over,under)."),
+    bankroll: float = typer.Option(1000.0, help="Starting bankroll."),
+    kelly_clip: float = typer.Option(0.25, help="Max Kelly fraction to stake per bet."),
+    min_edge_pct: float = typer.Option(0.5, help="Minimum edge %% to place a bet."),
+    flat_stake: float = typer.Option(None, help="Override Kelly with a fixed stake amount."),
+    paths: int = typer.Option(100_000, help="Number of simulated seasons."),
+    compounding: bool = typer.Option(True, help="Re-size stakes as a fraction of the current bankroll."),
+    ruin_fraction: float = typer.Option(0.1, help="Ruin when bankroll touches this fraction of the start."),
+    workers: int = typer.Option(0, help="Processes to spread path chunks over (0 = one per CPU)."),
+    seed: int = typer.Option(None, help="Random seed for reproducible runs."),
+) -> None:
+    """Sample outcomes for the selected bets to report bankroll percentiles, drawdown and risk of ruin."""
+    import time
+
+    from arbitrage_model.backtesting.montecarlo import simulate_bankroll_paths
+
+    preds = load_predictions(predictions_csv)
+    quotes = load_quotes_from_dir(quotes_dir)
+    index = align_predictions_to_quotes(preds, quotes)
+    result = simulate_expected_value(
+        preds, index, bankroll=bankroll, kelly_clip=kelly_clip, min_edge_pct=min_edge_pct, flat_stake=flat_stake
+    )
+    if not result.bets:
+        typer.echo("No bets cleared the edge threshold; nothing to simulate.")
+        raise typer.Exit()
+
+    start = time.perf_counter()
+    mc = simulate_bankroll_paths(
+        result.bets, bankroll, paths=paths, compounding=compounding, ruin_fraction=ruin_fraction,
+        workers=workers, seed=seed,
+    )
+    elapsed = time.perf_counter() - start
+    typer.echo(f"Simulated {mc.paths:,} paths x {len(result.bets):,} bets in {elapsed:.2f}s")
+    typer.echo(f"Mean ending bankroll: {mc.mean_final:.2f} (expected-value sim: {result.bankroll_end:.2f})")
+    typer.echo(f"Risk of ruin (<= {mc.ruin_level:.2f}): {mc.ruin_probability:.4%}")
+    finals, drawdowns = mc.final_percentiles(), mc.drawdown_percentiles()
+    typer.echo(
+        "\n"
+        + to_markdown(
+            [
+                {
+                    "percentile": q,
+                    "ending_bankroll": round(finals[q], 2),
+                    "max_drawdown_pct": round(drawdowns[q] * 100, 2),
+                }
+                for q in mc.percentiles
+            ]
+        )
+    )
+    typer.echo("\nBankroll path percentiles by bets placed:")
+    typer.echo(
+        to_markdown(
+            [
+                {"bets": int(n), **{f"p{q:g}": round(float(v), 2) for q, v in zip(mc.percentiles, column)}}
+                for n, column in zip(mc.checkpoints, mc.percentile_paths.T)
+            ]
+        )
+    )
+
+
+@app.command()
+def clv(
+    predictions_csv: Path = typer.Option(..., help="CSV with columns: player, market, line, prob_over."),
+    quotes_dir: Path = typer.Option(Path("data/raw"), help="Directory of sportsbook CSVs (players,line,over,under)."),
+    history_dir: Path = typer.Option(
+        None, help="Dated snapshots (<book>_props_YYYY-MM-DD[THHMM].csv) for closing lines; defaults to quotes-dir."
+    ),
+    game_time: str = typer.Option(None, help="ISO tip-off; closing line = last snapshot before it (default: latest)."),
+    outcomes_csv: Path = typer.Option(
+        None, help="Realized stats (player, market, actual[, game_date]) for calibration and Brier score."
+    ),
+    outcomes_db: Path = typer.Option(
+        None, help="Outcome store (scrape_books boxscores) to settle against instead of --outcomes-csv."
+    ),
+    game_date: str = typer.Option(
+        None, help="Slate date to settle from --outcomes-db (default: tip-off date, else each player's latest game)."
+    ),
+    bins: int = typer.Option(10, help="Probability bins for the calibration table."),
+    bankroll: float = typer.Option(1000.0, help="Starting bankroll."),
+    kelly_clip: float = typer.Option(0.25, help="Max Kelly fraction to stake per bet."),
+    min_edge_pct: float = typer.Option(0.5, help="Minimum edge %% to place a bet."),
+) -> None:
+    """Score selected bets against closing lines, and model probabilities against outcomes."""
+    import pandas as pd
+
+    from arbitrage_model.backtesting.analytics import (
+        attach_closing_lines,
+        bets_frame,
+        brier_score,
+        calibration_curve,
+        clv_summary,
+        label_outcomes,
+        load_quote_history,
+    )
+
+    preds = load_predictions(predictions_csv)
+    quotes = load_quotes_from_dir(quotes_dir)
+    result = simulate_expected_value(
+        preds, align_predictions_to_quotes(preds, quotes), bankroll=bankroll, kelly_clip=kelly_clip,
+        min_edge_pct=min_edge_pct,
+    )
+    history = load_quote_history(history_dir or quotes_dir)
+    with_close = attach_closing_lines(bets_frame(result, game_times=game_time and pd.Timestamp(game_time)), history)
+    typer.echo(f"Quote history: {len(history):,} quotes from {history['captured_at'].nunique()} snapshots")
+    typer.echo(to_markdown([{k: round(v, 4) for k, v in clv_summary(with_close).items()}]))
+    if len(with_close):
+        typer.echo("\nBets vs closing line:")
+        columns = ["player", "line", "side", "book", "odds", "close_odds", "clv_pct", "clv_ev"]
+        typer.echo(to_markdown(with_close[columns].round(4).to_dict("records")[:25]))
+
+    if outcomes_csv is None and outcomes_db is None:
+        return
+    predictions = pd.DataFrame(
+        {"player": p.player, "market": p.market, "line": p.line, "prob_over": p.prob_over} for p in preds
+    )
+    if outcomes_db is not None:
+        from arbitrage_model.outcomes import MARKET_STATS, OutcomeStore
+
+        slate = game_date or (game_time and pd.Timestamp(game_time).date())
+        with OutcomeStore(outcomes_db) as store:
+            markets = [m for m in predictions["market"].unique() if m in MARKET_STATS]
+            outcomes = store.outcomes(markets, game_date=slate or None, latest=not slate)
+        outcomes = outcomes.drop(columns="game_date")
+    else:
+        outcomes = pd.read_csv(outcomes_csv)
+    labeled = label_outcomes(predictions, outcomes)
+    brier = brier_score(labeled["prob_over"], labeled["over_hit"])
+    typer.echo(f"\nBrier score (prob_over, n={len(labeled)}): {brier:.4f}")
+    curve = calibration_curve(labeled["prob_over"], labeled["over_hit"], bins=bins)
+    typer.echo(to_markdown(curve.round(4).to_dict("records")))
+
+
+@app.command()
+def project(
+    db: Path = typer.Option(Path("data/outcomes.sqlite"), help="Box-score store filled by `scrape_books boxscores`."),
+    quotes_dir: Path = typer.Option(Path("data/raw"), help="Directory of sportsbook CSVs to predict every line of."),
+    state: Path = typer.Option(
+        Path("data/player_form.json"), help="Rolling-form cache, updated incrementally from --db."
+    ),
+    output: Path = typer.Option(Path("data/predictions.csv"), help="Predictions CSV for the other commands."),
+    window: int = typer.Option(10, help="Games in the rolling window."),
+    short_window: int = typer.Option(3, help="Recent games for the minutes trend."),
+    min_games: int = typer.Option(3, help="Skip players with fewer games in the window."),
+    rebuild: bool = typer.Option(False, help="Ignore --state and rebuild form from the whole store."),
+) -> None:
+    """Project prob_over for every quoted line from rolling box-score form (negative binomial model)."""
+    import time
+
+    from arbitrage_model.outcomes import MARKET_STATS, OutcomeStore
+    from arbitrage_model.projections import FormState, predict_lines
+
+    start = time.perf_counter()
+    form_state = FormState.load(state) if state.exists() and not rebuild else FormState(window=window)
+    if form_state.window != window:
+        form_state = FormState(window=window)
+    with OutcomeStore(db) as store:
+        new_rows = form_state.update(store)
+    form_state.save(state)
+    quotes = [q for q in load_quotes_from_dir(quotes_dir) if q.market in MARKET_STATS]
+    form = form_state.form({q.market for q in quotes}, short_window=short_window)
+    predictions = predict_lines(quotes, form, min_games=min_games)
+    elapsed = time.perf_counter() - start
+
+    output.parent.mkdir(parents=True, exist_ok=True)
+    predictions.assign(source="rolling").round({"prob_over": 4, "projection": 2}).to_csv(output, index=False)
+    lines = {(q.player, q.market, q.line) for q in quotes}
+    typer.echo(
+        f"Form: {form_state.games['player'].nunique()} players ({new_rows} new box-score rows). "
+        f"Predicted {len(predictions)}/{len(lines)} quoted lines in {elapsed:.2f}s -> {output}"
+    )
+    typer.echo(to_markdown(predictions.round(3).head(25).to_dict("records")))
 
 
 if __name__ == "__main__":
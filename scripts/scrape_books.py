@@ -1,17 +1,19 @@
 from __future__ import annotations
 
+from contextlib import nullcontext
 from pathlib import Path
-from typing import Optional
+from typing import TYPE_CHECKING, ContextManager, Iterable, List, Optional
 
-import pandas as pd
 import typer
 
-from arbitrage_model.scrapers.base import chrome_driver
-from arbitrage_model.scrapers.bovada import scrape_bovada
-from arbitrage_model.scrapers.draftkings import scrape_draftkings
-from arbitrage_model.scrapers.fanduel import scrape_fanduel
-from arbitrage_model.scrapers.prizepicks import scrape_prizepicks
-from arbitrage_model.scrapers.rotowire import scrape_rotowire
+if TYPE_CHECKING:
+    import pandas as pd
+
+    from arbitrage_model.scrapers.archive import SnapshotArchiver
+    from arbitrage_model.scrapers.base import PageTiming
+
+# Scraper modules (and Selenium/pandas behind them) are imported inside each command so
+# `--help` and single-book runs only load what they use.
 
 app = typer.Typer(help="Scrape sportsbook lines into normalized CSVs.")
 
@@ -25,15 +27,34 @@ def all(
     bovada_url: str = typer.Option(..., help="Bovada player props URL."),
     prizepicks_url: str = typer.Option(..., help="PrizePicks board URL."),
     rotowire_url: str = typer.Option(..., help="Rotowire props page URL."),
+    block_resources: bool = typer.Option(True, help="Block images, fonts, media and ad/tracker hosts via CDP."),
+    archive_dir: Optional[Path] = typer.Option(
+        None, help="Also archive raw page source (compressed, deduplicated) under this directory."
+    ),
 ) -> None:
+    from arbitrage_model.scrapers.base import chrome_driver
+    from arbitrage_model.scrapers.bovada import scrape_bovada
+    from arbitrage_model.scrapers.draftkings import scrape_draftkings
+    from arbitrage_model.scrapers.fanduel import scrape_fanduel
+    from arbitrage_model.scrapers.prizepicks import scrape_prizepicks
+    from arbitrage_model.scrapers.rotowire import scrape_rotowire
+
+    jobs = [
+        ("draftkings", scrape_draftkings, dk_url),
+        ("fanduel", scrape_fanduel, fd_url),
+        ("bovada", scrape_bovada, bovada_url),
+        ("prizepicks", scrape_prizepicks, prizepicks_url),
+        ("rotowire", scrape_rotowire, rotowire_url),
+    ]
     output_dir.mkdir(parents=True, exist_ok=True)
-    with chrome_driver(headless=headless) as driver:
-        _write(scrape_draftkings(driver, url=dk_url), output_dir / "draftkings_props_latest.csv")
-        _write(scrape_fanduel(driver, url=fd_url), output_dir / "fanduel_props_latest.csv")
-        _write(scrape_bovada(driver, url=bovada_url), output_dir / "bovada_props_latest.csv")
-        _write(scrape_prizepicks(driver, url=prizepicks_url), output_dir / "prizepicks_props_latest.csv")
-        _write(scrape_rotowire(driver, url=rotowire_url), output_dir / "rotowire_props_latest.csv")
+    timings = []
+    with chrome_driver(headless=headless) as driver, _archiver(archive_dir) as archiver:
+        for book, scrape, url in jobs:
+            df = scrape(driver, url=url, archiver=archiver, block_resources=block_resources)
+            _write(df, output_dir / f"{book}_props_latest.csv")
+            timings.append(df.attrs["timing"])
     typer.echo(f"Wrote scraped props to {output_dir}")
+    _echo_timings(timings)
 
 
 @app.command()
@@ -41,11 +62,19 @@ def draftkings(
     output: Path = typer.Option(Path("data/raw/draftkings_props_latest.csv"), "--output", "-o"),
     headless: bool = typer.Option(True),
     url: str = typer.Option(..., help="DraftKings NBA props URL."),
+    block_resources: bool = typer.Option(True, help="Block images, fonts, media and ad/tracker hosts via CDP."),
+    archive_dir: Optional[Path] = typer.Option(
+        None, help="Also archive raw page source (compressed, deduplicated) under this directory."
+    ),
 ) -> None:
-    with chrome_driver(headless=headless) as driver:
-        df = scrape_draftkings(driver, url=url)
+    from arbitrage_model.scrapers.base import chrome_driver
+    from arbitrage_model.scrapers.draftkings import scrape_draftkings
+
+    with chrome_driver(headless=headless) as driver, _archiver(archive_dir) as archiver:
+        df = scrape_draftkings(driver, url=url, archiver=archiver, block_resources=block_resources)
         _write(df, output)
         typer.echo(f"Wrote DraftKings props to {output}")
+        _echo_timings([df.attrs["timing"]])
 
 
 @app.command()
@@ -53,11 +82,19 @@ def fanduel(
     output: Path = typer.Option(Path("data/raw/fanduel_props_latest.csv"), "--output", "-o"),
     headless: bool = typer.Option(True),
     url: str = typer.Option(..., help="FanDuel NBA props URL."),
+    block_resources: bool = typer.Option(True, help="Block images, fonts, media and ad/tracker hosts via CDP."),
+    archive_dir: Optional[Path] = typer.Option(
+        None, help="Also archive raw page source (compressed, deduplicated) under this directory."
+    ),
 ) -> None:
-    with chrome_driver(headless=headless) as driver:
-        df = scrape_fanduel(driver, url=url)
+    from arbitrage_model.scrapers.base import chrome_driver
+    from arbitrage_model.scrapers.fanduel import scrape_fanduel
+
+    with chrome_driver(headless=headless) as driver, _archiver(archive_dir) as archiver:
+        df = scrape_fanduel(driver, url=url, archiver=archiver, block_resources=block_resources)
         _write(df, output)
         typer.echo(f"Wrote FanDuel props to {output}")
+        _echo_timings([df.attrs["timing"]])
 
 
 @app.command()
@@ -65,11 +102,19 @@ def bovada(
     output: Path = typer.Option(Path("data/raw/bovada_props_latest.csv"), "--output", "-o"),
     headless: bool = typer.Option(True),
     url: str = typer.Option(..., help="Bovada player props URL."),
+    block_resources: bool = typer.Option(True, help="Block images, fonts, media and ad/tracker hosts via CDP."),
+    archive_dir: Optional[Path] = typer.Option(
+        None, help="Also archive raw page source (compressed, deduplicated) under this directory."
+    ),
 ) -> None:
-    with chrome_driver(headless=headless) as driver:
-        df = scrape_bovada(driver, url=url)
+    from arbitrage_model.scrapers.base import chrome_driver
+    from arbitrage_model.scrapers.bovada import scrape_bovada
+
+    with chrome_driver(headless=headless) as driver, _archiver(archive_dir) as archiver:
+        df = scrape_bovada(driver, url=url, archiver=archiver, block_resources=block_resources)
         _write(df, output)
         typer.echo(f"Wrote Bovada props to {output}")
+        _echo_timings([df.attrs["timing"]])
 
 
 @app.command()
@@ -77,11 +122,19 @@ def prizepicks(
     output: Path = typer.Option(Path("data/raw/prizepicks_props_latest.csv"), "--output", "-o"),
     headless: bool = typer.Option(True),
     url: str = typer.Option(..., help="PrizePicks board URL."),
+    block_resources: bool = typer.Option(True, help="Block images, fonts, media and ad/tracker hosts via CDP."),
+    archive_dir: Optional[Path] = typer.Option(
+        None, help="Also archive raw page source (compressed, deduplicated) under this directory."
+    ),
 ) -> None:
-    with chrome_driver(headless=headless) as driver:
-        df = scrape_prizepicks(driver, url=url)
+    from arbitrage_model.scrapers.base import chrome_driver
+    from arbitrage_model.scrapers.prizepicks import scrape_prizepicks
+
+    with chrome_driver(headless=headless) as driver, _archiver(archive_dir) as archiver:
+        df = scrape_prizepicks(driver, url=url, archiver=archiver, block_resources=block_resources)
         _write(df, output)
         typer.echo(f"Wrote PrizePicks props to {output}")
+        _echo_timings([df.attrs["timing"]])
 
 
 @app.command()
@@ -89,11 +142,274 @@ def rotowire(
     output: Path = typer.Option(Path("data/raw/rotowire_props_latest.csv"), "--output", "-o"),
     headless: bool = typer.Option(True),
     url: str = typer.Option(..., help="Rotowire props page URL."),
+    block_resources: bool = typer.Option(True, help="Block images, fonts, media and ad/tracker hosts via CDP."),
+    archive_dir: Optional[Path] = typer.Option(
+        None, help="Also archive raw page source (compressed, deduplicated) under this directory."
+    ),
 ) -> None:
-    with chrome_driver(headless=headless) as driver:
-        df = scrape_rotowire(driver, url=url)
+    from arbitrage_model.scrapers.base import chrome_driver
+    from arbitrage_model.scrapers.rotowire import scrape_rotowire
+
+    with chrome_driver(headless=headless) as driver, _archiver(archive_dir) as archiver:
+        df = scrape_rotowire(driver, url=url, archiver=archiver, block_resources=block_resources)
         _write(df, output)
         typer.echo(f"Wrote Rotowire props to {output}")
+        _echo_timings([df.attrs["timing"]])
+
+
+@app.command()
+def rotowire_compare(
+    output: Path = typer.Option(Path("data/raw/rotowire_compare_props_latest.csv"), "--output", "-o"),
+    headless: bool = typer.Option(True),
+    url: str = typer.Option(..., help="Rotowire player-props comparison URL (no ?book= filter)."),
+    book: List[str] = typer.Option([], help="Book column groups left to right, if the header shows logos."),
+    block_resources: bool = typer.Option(True, help="Block images, fonts, media and ad/tracker hosts via CDP."),
+    archive_dir: Optional[Path] = typer.Option(
+        None, help="Also archive raw page source (compressed, deduplicated) under this directory."
+    ),
+) -> None:
+    """Read every book's lines and prices from Rotowire's comparison grid in a single page load."""
+    from arbitrage_model.scrapers.base import chrome_driver
+    from arbitrage_model.scrapers.rotowire import scrape_rotowire_comparison
+
+    with chrome_driver(headless=headless) as driver, _archiver(archive_dir) as archiver:
+        df = scrape_rotowire_comparison(
+            driver, url=url, archiver=archiver, block_resources=block_resources, books=book or None
+        )
+        _write(df, output)
+        counts = df["book"].value_counts().to_dict() if not df.empty else {}
+        typer.echo(f"Wrote Rotowire comparison props to {output}: {counts}")
+        _echo_timings([df.attrs["timing"]])
+
+
+@app.command()
+def watch(
+    output_dir: Path = typer.Option(Path("data/raw"), "--output-dir", "-o"),
+    headless: bool = typer.Option(True, help="Run Chrome in headless mode."),
+    dk_url: Optional[str] = typer.Option(None, help="DraftKings NBA props URL."),
+    fd_url: Optional[str] = typer.Option(None, help="FanDuel NBA props URL."),
+    bovada_url: Optional[str] = typer.Option(None, help="Bovada player props URL."),
+    prizepicks_url: Optional[str] = typer.Option(None, help="PrizePicks board URL."),
+    rotowire_url: Optional[str] = typer.Option(None, help="Rotowire props page URL."),
+    polls_per_minute: float = typer.Option(6.0, help="Total scrape budget across all books."),
+    max_browsers: int = typer.Option(1, help="Concurrent Chrome instances (scrapes in flight)."),
+    min_interval: float = typer.Option(20.0, help="Never poll one book more often than this (seconds)."),
+    max_interval: float = typer.Option(900.0, help="Never poll one book less often than this (seconds)."),
+    tipoff: Optional[str] = typer.Option(None, help="ISO time of first tip-off (UTC if no offset); ramps polling."),
+    duration: Optional[float] = typer.Option(None, help="Stop after this many seconds (default: run forever)."),
+    report_every: float = typer.Option(60.0, help="Print a freshness report every N seconds."),
+    block_resources: bool = typer.Option(True, help="Block images, fonts, media and ad/tracker hosts via CDP."),
+    archive_dir: Optional[Path] = typer.Option(
+        None, help="Also archive raw page source (compressed, deduplicated) under this directory."
+    ),
+    scan: bool = typer.Option(True, help="Scan each published board for arbitrage and print new opportunities."),
+    bankroll: float = typer.Option(100.0, help="Bankroll for arbitrage stake sizing."),
+    predictions_csv: Optional[Path] = typer.Option(None, help="Also report +EV bets against these predictions."),
+    snapshot_dir: Optional[Path] = typer.Option(
+        None, help="Also keep dated per-capture CSVs (`<book>_props_YYYY-MM-DDTHHMM.csv`) for replay/CLV."
+    ),
+    bus_socket: Optional[Path] = typer.Option(
+        None, help="Stream published boards as NDJSON on this Unix socket (see scripts.listen_quotes)."
+    ),
+    queue_size: int = typer.Option(64, help="Per-subscriber queue bound on the quote bus."),
+) -> None:
+    """
+    Poll books continuously, scraping fast-moving boards more often than idle ones.
+
+    Each scraped board is published once to an in-process quote bus; the latest-CSV writer,
+    the arbitrage and +EV scanners, the dated snapshot writer and the socket bridge are
+    subscribers with their own bounded queues.
+    """
+    import threading
+    import time
+    from datetime import datetime, timezone
+
+    from arbitrage_model.aggregator import opportunities_to_rows
+    from arbitrage_model.bus import ArbSubscriber, CsvSink, EVSubscriber, format_bus_stats, frame_to_batch, threaded_bus
+    from arbitrage_model.markets import CODEBOOK
+    from arbitrage_model.scheduler import AdaptiveScheduler, PollTarget, format_freshness
+    from arbitrage_model.scrapers.base import build_chrome
+    from arbitrage_model.tables import to_markdown
+
+    scrapers = {
+        "draftkings": ("arbitrage_model.scrapers.draftkings", "scrape_draftkings", dk_url),
+        "fanduel": ("arbitrage_model.scrapers.fanduel", "scrape_fanduel", fd_url),
+        "bovada": ("arbitrage_model.scrapers.bovada", "scrape_bovada", bovada_url),
+        "prizepicks": ("arbitrage_model.scrapers.prizepicks", "scrape_prizepicks", prizepicks_url),
+        "rotowire": ("arbitrage_model.scrapers.rotowire", "scrape_rotowire", rotowire_url),
+    }
+    selected = {book: spec for book, spec in scrapers.items() if spec[2]}
+    if not selected:
+        typer.echo("Pass at least one --*-url to watch.")
+        raise typer.Exit(code=1)
+
+    tip = None
+    if tipoff:
+        tip = datetime.fromisoformat(tipoff)
+        tip = tip if tip.tzinfo else tip.replace(tzinfo=timezone.utc)
+
+    output_dir.mkdir(parents=True, exist_ok=True)
+    local = threading.local()
+    drivers = []
+    drivers_lock = threading.Lock()
+
+    def _driver():
+        # One browser per poll thread; the scheduler keeps --max-browsers threads for its lifetime.
+        if getattr(local, "driver", None) is None:
+            local.driver = build_chrome(headless=headless)
+            with drivers_lock:
+                drivers.append(local.driver)
+        return local.driver
+
+    timings = {}
+
+    def _print_arbs(opportunities, batch) -> None:
+        lag_ms = (time.time() - batch.published_at) * 1000
+        typer.echo(f"{len(opportunities)} new opportunities from {batch.book} ({lag_ms:.1f} ms after publish)")
+        typer.echo(to_markdown(opportunities_to_rows(opportunities)))
+
+    def _print_bets(bets, batch) -> None:
+        from arbitrage_model.backtesting.schemas import SimResult
+        from arbitrage_model.backtesting.simulator import to_rows
+
+        typer.echo(f"{len(bets)} +EV bets on {batch.book}")
+        typer.echo(to_markdown(to_rows(SimResult(0.0, 0.0, 0.0, 0.0, bets))))
+
+    with _archiver(archive_dir) as archiver, threaded_bus() as bus:
+        # Latest-CSV and scanner subscribers only care about each book's newest board, so a
+        # queued board is replaced by a newer one; dated snapshots are history and never dropped.
+        bus.call_threadsafe(bus.attach, "latest_csv", CsvSink(output_dir), queue_size, "coalesce")
+        if scan:
+            bus.call_threadsafe(bus.attach, "arb", ArbSubscriber(bankroll, on_new=_print_arbs), queue_size, "coalesce")
+        if predictions_csv is not None:
+            from arbitrage_model.backtesting.loader import load_predictions
+
+            ev = EVSubscriber(load_predictions(predictions_csv), on_bets=_print_bets)
+            bus.call_threadsafe(bus.attach, "ev", ev, queue_size, "coalesce")
+        if snapshot_dir is not None:
+            bus.call_threadsafe(bus.attach, "snapshots", CsvSink(snapshot_dir, dated=True), queue_size, "block")
+        if bus_socket is not None:
+            from arbitrage_model.bus import serve_unix
+
+            bus.call_threadsafe(serve_unix, bus, bus_socket)
+            typer.echo(f"Streaming quote batches on {bus_socket}")
+
+        def _on_snapshot(book: str, df: pd.DataFrame, captured_at: datetime) -> None:
+            if df.empty:
+                typer.echo(f"Warning: no rows scraped for {book}")
+            if "timing" in df.attrs:
+                timings[book] = df.attrs["timing"]
+            # Title-case like aggregator.book_name_from_path so bus and CSV-scan output agree.
+            bus.publish_threadsafe(frame_to_batch(book.title(), df, captured_at=captured_at))
+
+        def _target(book: str, module_name: str, func_name: str, url: str) -> PollTarget:
+            import importlib
+
+            scrape = getattr(importlib.import_module(module_name), func_name)
+            return PollTarget(
+                book=book,
+                scrape=lambda: scrape(_driver(), url=url, archiver=archiver, block_resources=block_resources),
+                tipoff=tip,
+                min_interval=min_interval,
+                max_interval=max_interval,
+            )
+
+        scheduler = AdaptiveScheduler(
+            targets=[_target(book, *spec) for book, spec in selected.items()],
+            polls_per_minute=polls_per_minute,
+            max_concurrency=max_browsers,
+            on_snapshot=_on_snapshot,
+        )
+        elapsed = 0.0
+        try:
+            while duration is None or elapsed < duration:
+                chunk = report_every if duration is None else min(report_every, duration - elapsed)
+                scheduler.run(duration=chunk)
+                CODEBOOK.trim()  # between chunks no scrape is in flight; stale codes are re-encoded
+                elapsed += chunk
+                typer.echo(to_markdown(format_freshness(scheduler.freshness())))
+                _echo_timings(timings.values())
+                typer.echo(to_markdown(format_bus_stats(bus.stats())))
+        except KeyboardInterrupt:
+            typer.echo(to_markdown(format_freshness(scheduler.freshness())))
+        finally:
+            scheduler.close()  # wait for in-flight scrapes before their browsers are quit
+            for driver in drivers:
+                driver.quit()
+
+
+@app.command()
+def boxscores(
+    games_csv: Path = typer.Option(..., help="CSV of games: game_url, game_date (YYYY-MM-DD)[, game_id]."),
+    db: Path = typer.Option(Path("data/outcomes.sqlite"), help="Outcome store to ingest into."),
+    headless: bool = typer.Option(True, help="Run Chrome in headless mode."),
+    max_browsers: int = typer.Option(2, help="Games scraped concurrently (one Chrome each)."),
+    force: bool = typer.Option(False, help="Re-scrape games that are already stored."),
+    block_resources: bool = typer.Option(True, help="Block images, fonts, media and ad/tracker hosts via CDP."),
+    archive_dir: Optional[Path] = typer.Option(
+        None, help="Also archive raw page source (compressed, deduplicated) under this directory."
+    ),
+) -> None:
+    """Bulk-ingest ESPN box scores into the outcome store, skipping games already stored."""
+    import threading
+    import time
+
+    from arbitrage_model.outcomes import OutcomeStore, ingest_games, load_game_list
+    from arbitrage_model.scrapers.base import build_chrome
+    from arbitrage_model.scrapers.espn_boxscore import scrape_boxscore
+
+    games = load_game_list(games_csv)
+    local = threading.local()
+    drivers = []
+    drivers_lock = threading.Lock()
+
+    def _scrape(url: str) -> pd.DataFrame:
+        # One browser per worker thread, as in `watch`.
+        if getattr(local, "driver", None) is None:
+            local.driver = build_chrome(headless=headless)
+            with drivers_lock:
+                drivers.append(local.driver)
+        return scrape_boxscore(local.driver, url, archiver=archiver, block_resources=block_resources)
+
+    start = time.perf_counter()
+    with _archiver(archive_dir) as archiver, OutcomeStore(db) as store:
+        try:
+            summary = ingest_games(
+                store,
+                games,
+                _scrape,
+                workers=max_browsers,
+                force=force,
+                on_game=lambda game, rows: typer.echo(f"{game.game_date} {game.game_id}: {rows} players"),
+            )
+        finally:
+            for driver in drivers:
+                driver.quit()
+    elapsed = time.perf_counter() - start
+    for game, error in summary.failed:
+        typer.echo(f"Warning: failed to ingest {game.url}: {error}")
+    typer.echo(
+        f"Ingested {summary.ingested} games ({summary.rows} player rows), skipped {summary.skipped} already stored, "
+        f"{len(summary.failed)} failed in {elapsed:.1f}s -> {db}"
+    )
+
+
+def _archiver(archive_dir: Optional[Path]) -> ContextManager[Optional[SnapshotArchiver]]:
+    if archive_dir is None:
+        return nullcontext(None)
+    from arbitrage_model.scrapers.archive import SnapshotArchiver
+
+    return SnapshotArchiver(archive_dir)
+
+
+def _echo_timings(timings: Iterable[PageTiming]) -> None:
+    from arbitrage_model.scrapers.base import format_timings
+    from arbitrage_model.tables import to_markdown
+
+    rows = format_timings(timings)
+    if rows:
+        typer.echo("Page load timings (latest per book):")
+        typer.echo(to_markdown(rows))
 
 
 def _write(df: pd.DataFrame, path: Path) -> None:
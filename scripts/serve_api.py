@@ -0,0 +1,54 @@
+from __future__ import annotations
+
+import asyncio
+from pathlib import Path
+from typing import Optional
+
+import typer
+
+from arbitrage_model.api import LATEST_PATTERN, ApiServer, OpportunityBoard, follow_bus, watch_directory
+
+app = typer.Typer(help="Serve live arbitrage opportunities as JSON over a local, read-only HTTP API.")
+
+
+@app.command()
+def serve(
+    data_dir: Optional[Path] = typer.Option(
+        Path("data/raw"), "--data-dir", "-d", help="`scrape_books watch` output directory."
+    ),
+    pattern: str = typer.Option(
+        LATEST_PATTERN, help="Glob for CSVs in --data-dir; only the newest match per book and market is served."
+    ),
+    poll_interval: float = typer.Option(2.0, help="Seconds between directory checks."),
+    bus_socket: Optional[Path] = typer.Option(
+        None, help="Follow `scrape_books watch --bus-socket` instead of (or as well as) the directory."
+    ),
+    no_data_dir: bool = typer.Option(False, "--no-data-dir", help="Only follow --bus-socket."),
+    host: str = typer.Option("127.0.0.1", help="Interface to bind (keep local; there is no auth)."),
+    port: int = typer.Option(8765, help="Port to listen on."),
+    bankroll: float = typer.Option(100.0, "--bankroll", "-b", help="Total stake to deploy per market."),
+) -> None:
+    """Endpoints: /opportunities, /quotes, /health, /changes (long poll) and /events (SSE); see arbitrage_model.api."""
+    if no_data_dir and bus_socket is None:
+        raise typer.BadParameter("nothing to serve without --data-dir or --bus-socket", param_hint="--no-data-dir")
+
+    async def _run() -> None:
+        board = OpportunityBoard(bankroll)
+        server = await ApiServer(board).start(host, port)
+        feeds = []
+        if not no_data_dir:
+            feeds.append(asyncio.ensure_future(watch_directory(board, data_dir, pattern, poll_interval)))
+        if bus_socket is not None:
+            feeds.append(asyncio.ensure_future(follow_bus(board, bus_socket)))
+        typer.echo(f"Serving http://{host}:{port}/opportunities")
+        async with server:
+            await asyncio.gather(server.serve_forever(), *feeds)
+
+    try:
+        asyncio.run(_run())
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    app()
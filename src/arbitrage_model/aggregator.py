@@ -1,45 +1,88 @@
 from __future__ import annotations
 
+import csv
 from collections import defaultdict
 from pathlib import Path
-from typing import Iterable, List, Sequence
-
-import pandas as pd
-
+from typing import TYPE_CHECKING, Iterable, List, Optional, Sequence
+
+from arbitrage_model.markets import (
+    CODEBOOK,
+    DEFAULT_MARKET,
+    MARKET_COLUMNS,
+    canonical_market,
+    market_from_path,
+    quote_key,
+    split_market_from_stem,
+)
 from arbitrage_model.models import ArbitrageOpportunity, BookOffer
 from arbitrage_model.odds import american_to_decimal, normalize_american_odds
 
+if TYPE_CHECKING:
+    import pandas as pd
+
+_REQUIRED_COLUMNS = {"players", "line", "over", "under"}
+
+
+def book_name_from_path(csv_path: Path) -> str:
+    """Derive a display book name from a CSV filename (e.g. fanduel_props_sample.csv -> Fanduel)."""
+    stem, _ = split_market_from_stem(csv_path.stem)
+    return stem.replace("_props_sample", "").replace("_", " ").title()
 
-def load_book_quotes(csv_path: Path, book: str, market: str = "points") -> List[BookOffer]:
+
+def load_book_quotes(csv_path: Path, book: str, market: Optional[str] = None) -> List[BookOffer]:
     """
     Load a sportsbook CSV into normalized BookOffer objects.
 
-    Expected columns: players, line, over, under
+    Expected columns: players, line, over, under. An optional `book` column (multi-book
+    sources such as the Rotowire comparison view) overrides `book` per row. Rows without
+    both prices (line-only exports such as `scrape_books rotowire`) are skipped.
+
+    The market comes from a `market`/`stat`/`prop` column when present, else from `market`,
+    else from the filename (`draftkings_rebounds_props_....csv`), else points; labels are
+    mapped onto the canonical taxonomy in arbitrage_model.markets using book aliases.
+    Player, market and book codes are stamped from the shared CODEBOOK.
+
+    Parsed with the stdlib csv module so the scan path does not pay pandas' import cost.
     """
-    df = pd.read_csv(csv_path)
-    missing = {"players", "line", "over", "under"} - set(df.columns)
-    if missing:
-        raise ValueError(f"{csv_path} missing required columns: {missing}")
-
-    offers: List[BookOffer] = []
-    for _, row in df.iterrows():
-        offers.append(
-            BookOffer(
-                book=book,
-                player=str(row["players"]).strip(),
-                market=market,
-                line=float(row["line"]),
-                over_odds=normalize_american_odds(row["over"]),
-                under_odds=normalize_american_odds(row["under"]),
+    file_market = canonical_market(market, book) if market else market_from_path(csv_path) or DEFAULT_MARKET
+    with open(csv_path, newline="", encoding="utf-8") as fh:
+        reader = csv.DictReader(fh)
+        columns = set(reader.fieldnames or ())
+        missing = _REQUIRED_COLUMNS - columns
+        if missing:
+            raise ValueError(f"{csv_path} missing required columns: {missing}")
+        market_column = next((c for c in MARKET_COLUMNS if c in columns), None)
+
+        players, markets, books = CODEBOOK.players, CODEBOOK.markets, CODEBOOK.books
+        offers: List[BookOffer] = []
+        for row in reader:
+            if not (row["over"] or "").strip() or not (row["under"] or "").strip():
+                continue
+            row_book = row.get("book") or book
+            raw_market = row[market_column] if market_column else None
+            row_market = canonical_market(raw_market, row_book) if raw_market else file_market
+            player = row["players"].strip()
+            offers.append(
+                BookOffer(
+                    book=row_book,
+                    player=player,
+                    market=row_market,
+                    line=float(row["line"]),
+                    over_odds=normalize_american_odds(row["over"]),
+                    under_odds=normalize_american_odds(row["under"]),
+                    player_code=players.code(player),
+                    market_code=markets.code(row_market),
+                    book_code=books.code(row_book),
+                )
             )
-        )
     return offers
 
 
 def group_by_player_line(offers: Sequence[BookOffer]):
-    grouped: dict[tuple[str, float], list[BookOffer]] = defaultdict(list)
+    """Group offers by (player_code, market_code, line); markets never mix."""
+    grouped: dict[tuple[int, int, float], list[BookOffer]] = defaultdict(list)
     for offer in offers:
-        grouped[(offer.player, offer.line)].append(offer)
+        grouped[quote_key(offer)].append(offer)
     return grouped
 
 
@@ -58,7 +101,7 @@ def find_two_way_arbs(
 ) -> List[ArbitrageOpportunity]:
     """Identify two-way arbitrage opportunities across books for each player line."""
     opportunities: List[ArbitrageOpportunity] = []
-    for (player, line), quotes in group_by_player_line(offers).items():
+    for quotes in group_by_player_line(offers).values():
         if len(quotes) < 2:
             continue
 
@@ -80,9 +123,9 @@ def find_two_way_arbs(
 
         opportunities.append(
             ArbitrageOpportunity(
-                player=player,
+                player=quotes[0].player,
                 market=quotes[0].market,
-                line=line,
+                line=quotes[0].line,
                 over_book=best_over.book,
                 under_book=best_under.book,
                 over_odds=best_over.over_odds,
@@ -96,31 +139,40 @@ def find_two_way_arbs(
     return sorted(opportunities, key=lambda o: o.edge_pct, reverse=True)
 
 
-def detect_arbitrage_from_dir(data_dir: Path, bankroll: float = 100.0) -> List[ArbitrageOpportunity]:
-    """Load every CSV in a directory and run arbitrage detection."""
+def load_offers_from_dir(data_dir: Path) -> List[BookOffer]:
+    """Load every CSV in a directory into BookOffer objects."""
     all_offers: List[BookOffer] = []
     for csv_file in data_dir.glob("*.csv"):
-        book_name = csv_file.stem.replace("_props_sample", "").replace("_", " ").title()
-        all_offers.extend(load_book_quotes(csv_file, book=book_name))
-    return find_two_way_arbs(all_offers, bankroll=bankroll)
+        all_offers.extend(load_book_quotes(csv_file, book=book_name_from_path(csv_file)))
+    return all_offers
+
+
+def detect_arbitrage_from_dir(data_dir: Path, bankroll: float = 100.0) -> List[ArbitrageOpportunity]:
+    """Load every CSV in a directory and run arbitrage detection."""
+    return find_two_way_arbs(load_offers_from_dir(data_dir), bankroll=bankroll)
+
+
+def opportunities_to_rows(opportunities: Sequence[ArbitrageOpportunity]) -> list[dict]:
+    """Flatten opportunities into display rows (rounded) for tables or JSON."""
+    return [
+        {
+            "player": o.player,
+            "market": o.market,
+            "line": o.line,
+            "over_book": o.over_book,
+            "under_book": o.under_book,
+            "over_odds": o.over_odds,
+            "under_odds": o.under_odds,
+            "edge_pct": round(o.edge_pct, 2),
+            "stake_over": round(o.stake_over, 2),
+            "stake_under": round(o.stake_under, 2),
+            "expected_profit": round(o.expected_profit, 2),
+        }
+        for o in opportunities
+    ]
 
 
 def opportunities_to_frame(opportunities: Sequence[ArbitrageOpportunity]) -> pd.DataFrame:
-    return pd.DataFrame(
-        [
-            {
-                "player": o.player,
-                "market": o.market,
-                "line": o.line,
-                "over_book": o.over_book,
-                "under_book": o.under_book,
-                "over_odds": o.over_odds,
-                "under_odds": o.under_odds,
-                "edge_pct": round(o.edge_pct, 2),
-                "stake_over": round(o.stake_over, 2),
-                "stake_under": round(o.stake_under, 2),
-                "expected_profit": round(o.expected_profit, 2),
-            }
-            for o in opportunities
-        ]
-    )
+    import pandas as pd
+
+    return pd.DataFrame(opportunities_to_rows(opportunities))
@@ -0,0 +1,376 @@
+from __future__ import annotations
+
+import asyncio
+import json
+import uuid
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Iterable, Optional, Sequence
+from urllib.parse import parse_qsl, urlsplit
+
+from arbitrage_model.aggregator import load_book_quotes, opportunities_to_rows
+from arbitrage_model.markets import CODEBOOK, canonical_market, split_market_from_stem
+from arbitrage_model.models import ArbitrageOpportunity, BookOffer
+from arbitrage_model.replay import IncrementalScanner, QuoteKey, diff_quotes
+
+MAX_HEADER_BYTES = 16 * 1024
+MAX_CACHED_BODIES = 1024
+MAX_WAIT_S = 60.0
+SSE_KEEPALIVE_S = 15.0
+LATEST_PATTERN = "*_props_latest.csv"  # what `scrape_books watch` overwrites each capture
+
+_REASONS = {
+    200: "OK",
+    204: "No Content",
+    304: "Not Modified",
+    400: "Bad Request",
+    404: "Not Found",
+    405: "Method Not Allowed",
+    431: "Request Header Fields Too Large",
+}
+
+
+class OpportunityBoard:
+    """
+    Current quotes and arbitrage set, updated incrementally and versioned for HTTP caching.
+
+    Each source (a CSV file, or a book on the quote bus) replaces its own boards; the
+    change is diffed into quote events and only touched lines are rescanned. A book's
+    market belongs to the first source that feeds it until that source drops it; other
+    sources' quotes for it are ignored and their books listed under `rejected`. Every
+    change bumps `version`, the cursor for long polls; the ETag adds a per-board `boot` id
+    so a restarted server never reuses one. Rendered responses are cached per query until
+    the next change, and the shared codebook is trimmed after it (markets.Codebook.trim) so
+    a server that runs for weeks does not keep every name it has ever seen. Use from one
+    event loop.
+    """
+
+    def __init__(self, bankroll: float = 100.0) -> None:
+        self.scanner = IncrementalScanner(bankroll)
+        self.version = 0
+        self.boot = uuid.uuid4().hex[:8]
+        self.updated_at: Optional[datetime] = None
+        self.rejected: dict[str, list[str]] = {}  # source -> books another source already feeds
+        self._sources: dict[str, dict[str, dict[QuoteKey, tuple[int, int]]]] = {}
+        self._owners: dict[tuple[str, str], str] = {}  # (casefolded book, market) -> source
+        self._cache: dict[str, bytes] = {}
+        self._changed: Optional[asyncio.Future] = None
+
+    def update(self, source: str, offers: Iterable[BookOffer]) -> bool:
+        """Replace `source`'s quotes; True if anything changed."""
+        previous = self._sources.get(source, {})
+        for book, quotes in previous.items():  # released here, re-claimed below if still fed
+            for market in {market for _, market, _ in quotes}:
+                self._owners.pop((book.casefold(), market), None)
+        boards: dict[str, dict[QuoteKey, tuple[int, int]]] = {}
+        claimed: set[str] = set()
+        for o in offers:
+            if self._owners.setdefault((o.book.casefold(), o.market), source) != source:
+                claimed.add(o.book)
+                continue
+            boards.setdefault(o.book, {})[(o.player, o.market, o.line)] = (o.over_odds, o.under_odds)
+        rejected = sorted(claimed)
+        rejections_changed = self.rejected.get(source, []) != rejected
+        if rejected:
+            self.rejected[source] = rejected
+        else:
+            self.rejected.pop(source, None)
+        events = []
+        for book in boards.keys() | previous.keys():
+            events.extend(diff_quotes(book, previous.get(book, {}), boards.get(book, {}), at=0.0))
+        if boards:
+            self._sources[source] = boards
+        else:
+            self._sources.pop(source, None)
+        if not events and not rejections_changed:
+            return False
+        self.scanner.apply(events)
+        CODEBOOK.trim()
+        self.version += 1
+        self.updated_at = datetime.now(timezone.utc)
+        self._cache.clear()
+        if self._changed is not None and not self._changed.done():
+            self._changed.set_result(self.version)
+        self._changed = None
+        return True
+
+    async def wait_for_change(self, since: int, timeout: float) -> bool:
+        """Wait until `version` passes `since`; False on timeout."""
+        if self.version > since:
+            return True
+        if self._changed is None:
+            self._changed = asyncio.get_running_loop().create_future()
+        try:
+            await asyncio.wait_for(asyncio.shield(self._changed), timeout)
+        except asyncio.TimeoutError:
+            return False
+        return True
+
+    @property
+    def etag(self) -> str:
+        return f'"{self.boot}-{self.version}"'
+
+    def opportunities(
+        self,
+        player: Optional[str] = None,
+        market: Optional[str] = None,
+        book: Optional[str] = None,
+        min_edge: Optional[float] = None,
+    ) -> list[ArbitrageOpportunity]:
+        """Current opportunities by edge, filtered (player/book case-insensitive; book matches either side)."""
+        player = player.casefold() if player else None
+        market = canonical_market(market) if market else None
+        book = book.casefold() if book else None
+        return [
+            o
+            for o in self.scanner.opportunities
+            if (player is None or o.player.casefold() == player)
+            and (market is None or o.market == market)
+            and (book is None or book in (o.over_book.casefold(), o.under_book.casefold()))
+            and (min_edge is None or o.edge_pct >= min_edge)
+        ]
+
+    def quotes(
+        self, player: Optional[str] = None, market: Optional[str] = None, book: Optional[str] = None
+    ) -> list[BookOffer]:
+        player = player.casefold() if player else None
+        market = canonical_market(market) if market else None
+        book = book.casefold() if book else None
+        return [
+            offer
+            for (p, m, _), books in self.scanner.quotes.items()
+            if (player is None or p.casefold() == player) and (market is None or m == market)
+            for name, offer in books.items()
+            if book is None or name.casefold() == book
+        ]
+
+    def render(self, path: str, query: str) -> bytes:
+        """JSON body for `path` + normalized `query`, cached until the next change."""
+        key = f"{path}?{query}"
+        body = self._cache.get(key)
+        if body is None:
+            if len(self._cache) >= MAX_CACHED_BODIES:
+                self._cache.clear()
+            body = self._cache[key] = self._render(path, dict(parse_qsl(query)))
+        return body
+
+    def _render(self, path: str, params: dict[str, str]) -> bytes:
+        filters = {k: params.get(k) for k in ("player", "market", "book")}
+        meta = {
+            "version": self.version,
+            "updated_at": self.updated_at.isoformat() if self.updated_at else None,
+        }
+        if path == "/quotes":
+            offers = self.quotes(**filters)
+            payload = {
+                **meta,
+                "count": len(offers),
+                "quotes": [
+                    {
+                        "book": o.book,
+                        "player": o.player,
+                        "market": o.market,
+                        "line": o.line,
+                        "over_odds": o.over_odds,
+                        "under_odds": o.under_odds,
+                    }
+                    for o in offers
+                ],
+            }
+        elif path == "/health":
+            books = {book for boards in self._sources.values() for book in boards}
+            payload = {
+                **meta,
+                "books": sorted(books),
+                "lines": len(self.scanner.quotes),
+                "opportunities": len(self.scanner.arbs),
+                "rejected": self.rejected,
+            }
+        else:
+            min_edge = float(params["min_edge"]) if params.get("min_edge") else None
+            opportunities = self.opportunities(**filters, min_edge=min_edge)
+            payload = {**meta, "count": len(opportunities), "opportunities": opportunities_to_rows(opportunities)}
+        return json.dumps(payload, separators=(",", ":")).encode("utf-8")
+
+
+def _response(
+    status: int, body: bytes = b"", headers: Sequence[tuple[str, str]] = (), keep_alive: bool = True
+) -> bytes:
+    lines = [f"HTTP/1.1 {status} {_REASONS.get(status, '')}"]
+    lines.extend(f"{name}: {value}" for name, value in headers)
+    lines.append(f"Content-Length: {len(body)}")
+    lines.append("Connection: keep-alive" if keep_alive else "Connection: close")
+    return ("\r\n".join(lines) + "\r\n\r\n").encode("latin-1") + body
+
+
+def _error(status: int, message: str, keep_alive: bool = True) -> bytes:
+    body = json.dumps({"error": message}).encode("utf-8")
+    return _response(status, body, [("Content-Type", "application/json")], keep_alive)
+
+
+class ApiServer:
+    """
+    Read-only HTTP/1.1 JSON API over an OpportunityBoard, on asyncio streams (stdlib only).
+
+    GET /opportunities?player=&market=&book=&min_edge=  current arbitrage set
+    GET /quotes?player=&market=&book=                   current quotes
+    GET /health                                         version, books, counts
+    GET /changes?since=N&timeout=S[&filters]            long poll: opportunities once version > N, else 204
+    GET /events[?filters]                               Server-Sent Events, one `opportunities` event per change
+
+    Responses carry `ETag: "<boot>-<version>"` and honor If-None-Match with 304. Connections
+    are kept alive, and rendered bodies are cached per query until the board changes.
+    """
+
+    def __init__(self, board: OpportunityBoard) -> None:
+        self.board = board
+        self.requests = 0
+
+    async def start(self, host: str = "127.0.0.1", port: int = 8765) -> asyncio.AbstractServer:
+        return await asyncio.start_server(self._connection, host, port, limit=MAX_HEADER_BYTES)
+
+    async def _connection(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        try:
+            while True:
+                try:
+                    head = await reader.readuntil(b"\r\n\r\n")
+                except asyncio.LimitOverrunError:
+                    writer.write(_error(431, "request headers too large", keep_alive=False))
+                    break
+                except asyncio.IncompleteReadError:
+                    break
+                keep_alive = await self._request(head, reader, writer)
+                await writer.drain()
+                if not keep_alive:
+                    break
+        except ConnectionError:
+            pass
+        finally:
+            writer.close()
+
+    async def _request(self, head: bytes, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> bool:
+        self.requests += 1
+        request_line, *header_lines = head.decode("latin-1").split("\r\n")
+        try:
+            method, target, version = request_line.split(" ")
+        except ValueError:
+            writer.write(_error(400, "malformed request line", keep_alive=False))
+            return False
+        headers = {}
+        for line in header_lines:
+            name, sep, value = line.partition(":")
+            if sep:
+                headers[name.strip().lower()] = value.strip()
+        connection = headers.get("connection", "").lower()
+        keep_alive = connection != "close" and (version == "HTTP/1.1" or connection == "keep-alive")
+        length = headers.get("content-length", "0")
+        if not length.isdigit():
+            writer.write(_error(400, "bad Content-Length", keep_alive=False))
+            return False
+        if int(length):
+            await reader.readexactly(int(length))  # request bodies are ignored
+
+        if method not in ("GET", "HEAD"):
+            writer.write(_error(405, "read-only API", keep_alive))
+            return keep_alive
+        url = urlsplit(target)
+        query = "&".join(sorted(url.query.split("&"))) if url.query else ""
+        params = dict(parse_qsl(query))
+        try:
+            if url.path == "/events":
+                await self._events(url.path, params, writer)
+                return False
+            if url.path == "/changes":
+                since = int(params.pop("since", -1))
+                timeout = min(float(params.pop("timeout", 30)), MAX_WAIT_S)
+                if not await self.board.wait_for_change(since, timeout):
+                    writer.write(_response(204, headers=[("ETag", self.board.etag)], keep_alive=keep_alive))
+                    return keep_alive
+                path, query = "/opportunities", "&".join(f"{k}={v}" for k, v in sorted(params.items()))
+            elif url.path in ("/opportunities", "/quotes", "/health"):
+                path = url.path
+            else:
+                writer.write(_error(404, f"no route {url.path}", keep_alive))
+                return keep_alive
+            etag = self.board.etag
+            cache_headers = [("ETag", etag), ("Cache-Control", "no-cache")]
+            if headers.get("if-none-match") == etag:
+                writer.write(_response(304, headers=cache_headers, keep_alive=keep_alive))
+                return keep_alive
+            body = self.board.render(path, query)
+        except ValueError as exc:
+            writer.write(_error(400, str(exc), keep_alive))
+            return keep_alive
+        response_headers = [("Content-Type", "application/json"), *cache_headers]
+        writer.write(_response(200, b"" if method == "HEAD" else body, response_headers, keep_alive))
+        return keep_alive
+
+    async def _events(self, path: str, params: dict[str, str], writer: asyncio.StreamWriter) -> None:
+        query = "&".join(f"{k}={v}" for k, v in sorted(params.items()))
+        writer.write(
+            b"HTTP/1.1 200 OK\r\nContent-Type: text/event-stream\r\nCache-Control: no-cache\r\n"
+            b"Connection: close\r\n\r\n"
+        )
+        seen = -1
+        while True:
+            if self.board.version > seen:
+                seen = self.board.version
+                body = self.board.render("/opportunities", query)
+                writer.write(b"event: opportunities\nid: %d\ndata: %s\n\n" % (seen, body))
+            elif not await self.board.wait_for_change(seen, SSE_KEEPALIVE_S):
+                writer.write(b": keep-alive\n\n")
+            await writer.drain()
+
+
+async def watch_directory(
+    board: OpportunityBoard, data_dir: Path, pattern: str = LATEST_PATTERN, interval: float = 2.0
+) -> None:
+    """
+    Keep `board` in sync with a directory of sportsbook CSVs (by default the
+    `<book>_props_latest.csv` files `scrape_books watch` overwrites). Files are grouped by
+    book (analytics.canonical_book) and market, and only the newest capture of each group
+    is live, so dated snapshots of one book never quote against each other. It is re-read
+    only when its mtime or size changes; a group whose files are all deleted drops its
+    quotes. Parsing runs in a worker thread.
+    """
+    from arbitrage_model.backtesting.analytics import canonical_book
+
+    data_dir = Path(data_dir)
+    seen: dict[tuple[str, Optional[str]], tuple[Path, int, int]] = {}
+    while True:
+        current: dict[tuple[str, Optional[str]], tuple[Path, int, int]] = {}
+        for path in data_dir.glob(pattern):
+            try:
+                stat = path.stat()
+            except FileNotFoundError:
+                continue
+            key = (canonical_book(path.stem), split_market_from_stem(path.stem)[1])
+            newest = current.get(key)
+            if newest is None or (stat.st_mtime_ns, path.name) > (newest[1], newest[0].name):
+                current[key] = (path, stat.st_mtime_ns, stat.st_size)
+        for key in seen.keys() - current.keys():
+            board.update(_file_source(data_dir, key), ())
+            del seen[key]
+        for key, signature in current.items():
+            if seen.get(key) == signature:
+                continue
+            seen[key] = signature
+            try:
+                offers = await asyncio.to_thread(load_book_quotes, signature[0], key[0])
+            except (OSError, ValueError):
+                continue  # half-written or malformed; re-read when it changes again
+            board.update(_file_source(data_dir, key), offers)
+        await asyncio.sleep(interval)
+
+
+def _file_source(data_dir: Path, key: tuple[str, Optional[str]]) -> str:
+    book, market = key
+    return f"{data_dir}:{book}" if market is None else f"{data_dir}:{book}:{market}"
+
+
+async def follow_bus(board: OpportunityBoard, socket: Path) -> None:
+    """Keep `board` in sync with a `scrape_books watch --bus-socket` feed (one source per book)."""
+    from arbitrage_model.bus import subscribe_unix
+
+    async for batch in subscribe_unix(socket):
+        board.update(f"bus:{batch.book}", batch.offers)
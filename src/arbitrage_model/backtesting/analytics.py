@@ -0,0 +1,260 @@
+from __future__ import annotations
+
+import re
+from datetime import datetime
+from pathlib import Path
+from typing import Mapping, Optional, Union
+
+import numpy as np
+import pandas as pd
+
+from arbitrage_model.backtesting.schemas import SimResult
+from arbitrage_model.markets import (
+    DEFAULT_MARKET,
+    MARKET_COLUMNS,
+    canonical_market,
+    market_from_path,
+    split_market_from_stem,
+)
+
+_SNAPSHOT_NAME = re.compile(
+    r"^(?P<book>.+?)(?:_props)?(?:_(?P<date>\d{4}-\d{2}-\d{2})(?:T(?P<time>\d{4}))?|_sample|_latest)?$"
+)
+QUOTE_KEYS = ["book", "player", "market", "line"]
+
+GameTimes = Union[None, datetime, pd.Timestamp, Mapping[str, datetime]]
+
+
+def parse_snapshot_name(path: Path) -> tuple[str, Optional[pd.Timestamp]]:
+    """
+    Split a snapshot filename into (book, captured_at).
+
+    `draftkings_props_2025-05-09.csv` -> ("Draftkings", 2025-05-09 00:00 UTC);
+    `fanduel_props_2025-05-09T1830.csv` adds a time; undated files fall back to mtime.
+    """
+    match = _SNAPSHOT_NAME.match(split_market_from_stem(path.stem)[0])
+    book = canonical_book(path.stem)
+    if match and match.group("date"):
+        clock = match.group("time")
+        stamp = match.group("date") + (f" {clock[:2]}:{clock[2:]}" if clock else "")
+        return book, pd.Timestamp(stamp, tz="UTC")
+    return book, pd.Timestamp(path.stat().st_mtime, unit="s", tz="UTC") if path.exists() else None
+
+
+def canonical_book(name: str) -> str:
+    """
+    Book name with snapshot suffixes removed, so `Draftkings Props 2025-05-09` (as named by
+    aggregator.book_name_from_path) and `draftkings_props_2025-05-11` both map to `Draftkings`.
+    """
+    stem, _ = split_market_from_stem(name.strip().lower().replace(" ", "_"))
+    match = _SNAPSHOT_NAME.match(stem)
+    return (match.group("book") if match else stem).replace("_", " ").title()
+
+
+def load_quote_history(data_dir: Path, market: Optional[str] = None, pattern: str = "*.csv") -> pd.DataFrame:
+    """
+    Stack every dated snapshot in a directory into one long quote frame.
+
+    Columns: book, player, market, line, over_odds, under_odds, captured_at (UTC), sorted by
+    captured_at so it can feed an as-of join directly. Markets are detected and
+    canonicalized, and rows without both prices (line-only Rotowire boards) skipped, as
+    in aggregator.load_book_quotes.
+    """
+    frames = []
+    for csv_file in sorted(Path(data_dir).glob(pattern)):
+        book, captured_at = parse_snapshot_name(csv_file)
+        df = pd.read_csv(csv_file, dtype={"players": str, "over": str, "under": str})
+        missing = {"players", "line", "over", "under"} - set(df.columns)
+        if missing:
+            raise ValueError(f"{csv_file} missing required columns: {missing}")
+        priced = df["over"].fillna("").str.strip().ne("") & df["under"].fillna("").str.strip().ne("")
+        df = df[priced]
+        if df.empty:
+            continue
+        file_market = canonical_market(market, book) if market else market_from_path(csv_file) or DEFAULT_MARKET
+        market_column = next((c for c in MARKET_COLUMNS if c in df.columns), None)
+        if market_column:
+            labels = df[market_column].fillna("").astype(str)
+            markets = labels.map({v: canonical_market(v, book) if v else file_market for v in labels.unique()})
+        else:
+            markets = file_market
+        frames.append(
+            pd.DataFrame(
+                {
+                    "book": df["book"].map(canonical_book) if "book" in df.columns else book,
+                    "player": df["players"].str.strip(),
+                    "market": markets,
+                    "line": df["line"].astype(float),
+                    "over_odds": normalize_american_odds_series(df["over"]),
+                    "under_odds": normalize_american_odds_series(df["under"]),
+                    "captured_at": captured_at,
+                }
+            )
+        )
+    if not frames:
+        return pd.DataFrame(columns=[*QUOTE_KEYS, "over_odds", "under_odds", "captured_at"])
+    history = pd.concat(frames, ignore_index=True)
+    return history.sort_values("captured_at", kind="stable", ignore_index=True)
+
+
+def normalize_american_odds_series(raw: pd.Series) -> pd.Series:
+    """Vectorized normalize_american_odds (unicode minus, leading '+'); bad values raise."""
+    cleaned = raw.astype(str).str.strip().str.replace("−", "-", regex=False).str.lstrip("+")
+    values = pd.to_numeric(cleaned, errors="coerce")
+    bad = values.isna() | (values % 1 != 0)
+    if bad.any():
+        raise ValueError(f"Unable to parse American odds value: {raw[bad].iloc[0]!r}")
+    return values.astype(np.int64)
+
+
+def american_to_decimal_series(odds: pd.Series | np.ndarray) -> np.ndarray:
+    odds = np.asarray(odds, dtype=np.float64)
+    return np.where(odds > 0, odds / 100 + 1, 100 / np.abs(odds) + 1)
+
+
+def bets_frame(result: SimResult, game_times: GameTimes = None) -> pd.DataFrame:
+    """
+    Unrounded SimBet frame with a `game_time` cutoff per bet for closing-line lookups.
+
+    `game_times` may be one timestamp for every bet, a {player: tip-off} mapping, or None
+    (closing line = latest snapshot available).
+    """
+    frame = pd.DataFrame(
+        {
+            "player": [b.player for b in result.bets],
+            "market": [b.market for b in result.bets],
+            "line": np.array([b.line for b in result.bets], dtype=np.float64),
+            "side": [b.side for b in result.bets],
+            "book": [b.book for b in result.bets],
+            "stake": np.array([b.stake for b in result.bets], dtype=np.float64),
+            "odds": np.array([b.odds for b in result.bets], dtype=np.int64),
+            "prob": np.array([b.prob for b in result.bets], dtype=np.float64),
+        }
+    )
+    if isinstance(game_times, Mapping):
+        frame["game_time"] = pd.to_datetime(frame["player"].map(game_times), utc=True)
+    else:
+        # Naive times are taken as UTC; aware ones (`...Z`, `-04:00`) are converted.
+        cutoff = pd.to_datetime(game_times, utc=True) if game_times is not None else pd.NaT
+        frame["game_time"] = pd.Series(cutoff, index=frame.index, dtype="datetime64[ns, UTC]")
+    return frame
+
+
+def attach_closing_lines(bets: pd.DataFrame, history: pd.DataFrame) -> pd.DataFrame:
+    """
+    As-of join each bet to the last quote strictly before its `game_time` for the same
+    book/player/market/line (sort-merge via `pd.merge_asof`, no per-bet scans).
+
+    Adds close_over_odds, close_under_odds, close_captured_at, close_odds (bet side),
+    clv_pct (bet price vs closing price on the same side) and clv_ev (expected return of
+    the bet price against the closing line with vig removed). Bets without a closing
+    quote keep NaNs.
+    """
+    history = history.assign(captured_at=pd.to_datetime(history["captured_at"], utc=True))
+    latest = history["captured_at"].max() + pd.Timedelta(microseconds=1) if len(history) else pd.Timestamp.now(tz="UTC")
+    left = bets.assign(_row=np.arange(len(bets)), _book=bets["book"].map(canonical_book))
+    left["_cutoff"] = pd.to_datetime(left["game_time"], utc=True).fillna(latest).astype(history["captured_at"].dtype)
+    left = left.sort_values("_cutoff", kind="stable")
+
+    right = history.rename(
+        columns={
+            "book": "_book",
+            "over_odds": "close_over_odds",
+            "under_odds": "close_under_odds",
+            "captured_at": "_cutoff",
+        }
+    )[["_book", "player", "market", "line", "close_over_odds", "close_under_odds", "_cutoff"]]
+    right = right.assign(close_captured_at=right["_cutoff"])
+    # Empty frames infer float64 for string keys; merge_asof needs matching key dtypes.
+    for key in ("_book", "player", "market"):
+        left[key] = left[key].astype(right[key].dtype)
+    merged = pd.merge_asof(
+        left,
+        right,
+        on="_cutoff",
+        by=["_book", "player", "market", "line"],
+        direction="backward",
+        allow_exact_matches=False,
+    )
+    merged = merged.sort_values("_row", kind="stable").drop(columns=["_row", "_book", "_cutoff"])
+    merged = merged.reset_index(drop=True)
+
+    is_over = merged["side"].to_numpy() == "over"
+    close_same = np.where(is_over, merged["close_over_odds"], merged["close_under_odds"]).astype(np.float64)
+    close_other = np.where(is_over, merged["close_under_odds"], merged["close_over_odds"]).astype(np.float64)
+    bet_dec = american_to_decimal_series(merged["odds"])
+    with np.errstate(invalid="ignore"):
+        close_dec = american_to_decimal_series(close_same)
+        other_dec = american_to_decimal_series(close_other)
+        fair_prob = (1 / close_dec) / (1 / close_dec + 1 / other_dec)
+    merged["close_odds"] = close_same
+    merged["clv_pct"] = (bet_dec / close_dec - 1) * 100
+    merged["clv_ev"] = fair_prob * bet_dec - 1
+    return merged
+
+
+def clv_summary(with_close: pd.DataFrame) -> dict[str, float]:
+    """Headline closing-line-value stats over bets that found a closing quote."""
+    matched = with_close.dropna(subset=["clv_pct"])
+    stake = matched["stake"].to_numpy()
+    return {
+        "bets": float(len(with_close)),
+        "matched": float(len(matched)),
+        "mean_clv_pct": float(matched["clv_pct"].mean()) if len(matched) else float("nan"),
+        "stake_weighted_clv_pct": (
+            float(np.average(matched["clv_pct"], weights=stake)) if stake.sum() else float("nan")
+        ),
+        "beat_close_rate": float((matched["clv_pct"] > 0).mean()) if len(matched) else float("nan"),
+        "mean_clv_ev": float(matched["clv_ev"].mean()) if len(matched) else float("nan"),
+    }
+
+
+def label_outcomes(predictions: pd.DataFrame, outcomes: pd.DataFrame) -> pd.DataFrame:
+    """
+    Join realized stats onto predictions and label `over_hit` (1/0; pushes dropped).
+
+    `outcomes` needs player, market, actual (and game_date if predictions carry one).
+    Players are joined by outcomes.player_key, so ESPN's `J. Tatum` settles a quoted
+    `Jayson Tatum`; keys shared by two names on either side are left unlabeled.
+    """
+    from arbitrage_model.outcomes import player_key
+
+    outcomes = outcomes.assign(
+        market=outcomes["market"].astype(str).map(canonical_market), _key=outcomes["player"].map(player_key)
+    )
+    predictions = predictions.assign(_key=predictions["player"].map(player_key))
+    keys = ["_key", "market"] + (["game_date"] if "game_date" in predictions and "game_date" in outcomes else [])
+    outcomes = outcomes.drop_duplicates(keys, keep=False)
+    predictions = predictions[predictions.groupby("_key")["player"].transform("nunique") == 1]
+    merged = predictions.merge(outcomes[[*keys, "actual"]], on=keys, how="inner", validate="many_to_one")
+    merged = merged[merged["actual"] != merged["line"]].drop(columns="_key")
+    return merged.assign(over_hit=(merged["actual"] > merged["line"]).astype(np.int8))
+
+
+def brier_score(prob: pd.Series | np.ndarray, outcome: pd.Series | np.ndarray) -> float:
+    prob = np.asarray(prob, dtype=np.float64)
+    outcome = np.asarray(outcome, dtype=np.float64)
+    return float(np.mean((prob - outcome) ** 2)) if prob.size else float("nan")
+
+
+def calibration_curve(
+    prob: pd.Series | np.ndarray, outcome: pd.Series | np.ndarray, bins: int = 10
+) -> pd.DataFrame:
+    """Reliability table: per probability bin, mean predicted vs observed hit rate (bincount-based)."""
+    prob = np.clip(np.asarray(prob, dtype=np.float64), 0.0, 1.0)
+    outcome = np.asarray(outcome, dtype=np.float64)
+    idx = np.minimum((prob * bins).astype(np.intp), bins - 1)
+    count = np.bincount(idx, minlength=bins)
+    pred_sum = np.bincount(idx, weights=prob, minlength=bins)
+    hit_sum = np.bincount(idx, weights=outcome, minlength=bins)
+    with np.errstate(invalid="ignore", divide="ignore"):
+        frame = pd.DataFrame(
+            {
+                "bin_low": np.arange(bins) / bins,
+                "bin_high": (np.arange(bins) + 1) / bins,
+                "count": count,
+                "mean_prob": pred_sum / count,
+                "observed_rate": hit_sum / count,
+            }
+        )
+    return frame[frame["count"] > 0].reset_index(drop=True)
@@ -1,47 +1,53 @@
 from __future__ import annotations
 
+import csv
 from pathlib import Path
-from typing import Iterable, List
+from typing import Iterable, List, Optional
 
-import pandas as pd
-
-from arbitrage_model.aggregator import load_book_quotes
+from arbitrage_model.aggregator import book_name_from_path, load_book_quotes
 from arbitrage_model.backtesting.schemas import MarketQuote, PredictionInput
+from arbitrage_model.markets import CODEBOOK, canonical_market, quote_key
 
 
 def load_predictions(path: Path) -> List[PredictionInput]:
     """
     Load model predictions from CSV.
     Expected columns: player, market, line, prob_over (0-1), source (optional).
+    Market labels are canonicalized (e.g. `PRA` -> points_rebounds_assists) and codes stamped.
     """
-    df = pd.read_csv(path)
-    required = {"player", "market", "line", "prob_over"}
-    missing = required - set(df.columns)
-    if missing:
-        raise ValueError(f"{path} missing required columns: {missing}")
-    preds: List[PredictionInput] = []
-    for _, row in df.iterrows():
-        preds.append(
-            PredictionInput(
-                player=str(row["player"]).strip(),
-                market=str(row["market"]).strip(),
-                line=float(row["line"]),
-                prob_over=float(row["prob_over"]),
-                source=str(row.get("source", "model")),
+    with open(path, newline="", encoding="utf-8") as fh:
+        reader = csv.DictReader(fh)
+        required = {"player", "market", "line", "prob_over"}
+        missing = required - set(reader.fieldnames or ())
+        if missing:
+            raise ValueError(f"{path} missing required columns: {missing}")
+        preds: List[PredictionInput] = []
+        for row in reader:
+            player = row["player"].strip()
+            market = canonical_market(row["market"])
+            preds.append(
+                PredictionInput(
+                    player=player,
+                    market=market,
+                    line=float(row["line"]),
+                    prob_over=float(row["prob_over"]),
+                    source=row.get("source") or "model",
+                    player_code=CODEBOOK.players.code(player),
+                    market_code=CODEBOOK.markets.code(market),
+                )
             )
-        )
     return preds
 
 
-def load_quotes_from_dir(data_dir: Path, market: str = "points") -> List[MarketQuote]:
+def load_quotes_from_dir(data_dir: Path, market: Optional[str] = None) -> List[MarketQuote]:
     """
     Load all sportsbook quotes in a directory into MarketQuote objects.
-    Reuses aggregator.load_book_quotes to keep a single CSV schema.
+    Reuses aggregator.load_book_quotes to keep a single CSV schema (and market detection
+    when `market` is None).
     """
     quotes: List[MarketQuote] = []
     for csv_file in data_dir.glob("*.csv"):
-        book_name = csv_file.stem.replace("_props_sample", "").replace("_", " ").title()
-        offers = load_book_quotes(csv_file, book=book_name, market=market)
+        offers = load_book_quotes(csv_file, book=book_name_from_path(csv_file), market=market)
         for o in offers:
             quotes.append(
                 MarketQuote(
@@ -51,6 +57,9 @@ def load_quotes_from_dir(data_dir: Path, market: str = "points") -> List[MarketQ
                     line=o.line,
                     over_odds=o.over_odds,
                     under_odds=o.under_odds,
+                    player_code=o.player_code,
+                    market_code=o.market_code,
+                    book_code=o.book_code,
                 )
             )
     return quotes
@@ -58,12 +67,12 @@ def load_quotes_from_dir(data_dir: Path, market: str = "points") -> List[MarketQ
 
 def align_predictions_to_quotes(
     predictions: Iterable[PredictionInput], quotes: Iterable[MarketQuote]
-) -> dict[tuple[str, float, str], list[MarketQuote]]:
+) -> dict[tuple[int, int, float], list[MarketQuote]]:
     """
-    Index quotes by (player, line, market) for quick matching during simulation.
+    Index quotes by (player_code, market_code, line) for quick matching during simulation;
+    look predictions up with `markets.quote_key(pred)`.
     """
-    index: dict[tuple[str, float, str], list[MarketQuote]] = {}
+    index: dict[tuple[int, int, float], list[MarketQuote]] = {}
     for q in quotes:
-        key = (q.player, q.line, q.market)
-        index.setdefault(key, []).append(q)
+        index.setdefault(quote_key(q), []).append(q)
     return index
@@ -0,0 +1,161 @@
+from __future__ import annotations
+
+import os
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from typing import Optional, Sequence
+
+import numpy as np
+
+from arbitrage_model.backtesting.schemas import SimBet
+from arbitrage_model.vectorized import american_to_decimal_array
+
+DEFAULT_PERCENTILES = (5.0, 25.0, 50.0, 75.0, 95.0)
+_ALL_IN_FLOOR = 1e-9
+
+
+@dataclass(frozen=True)
+class MonteCarloResult:
+    """Distribution of bankroll outcomes over sampled seasons of the same bet sequence."""
+
+    paths: int
+    bankroll_start: float
+    compounding: bool
+    ruin_level: float
+    percentiles: tuple[float, ...]
+    checkpoints: np.ndarray  # bet counts at which path percentiles are reported
+    percentile_paths: np.ndarray  # (len(percentiles), len(checkpoints)) bankroll values
+    final_bankroll: np.ndarray  # (paths,)
+    max_drawdown: np.ndarray  # (paths,) peak-to-trough fraction in [0, 1]
+    ruin_probability: float
+
+    @property
+    def mean_final(self) -> float:
+        return float(self.final_bankroll.mean())
+
+    def final_percentiles(self) -> dict[float, float]:
+        return dict(zip(self.percentiles, np.percentile(self.final_bankroll, self.percentiles).tolist()))
+
+    def drawdown_percentiles(self) -> dict[float, float]:
+        return dict(zip(self.percentiles, np.percentile(self.max_drawdown, self.percentiles).tolist()))
+
+
+def simulate_bankroll_paths(
+    bets: Sequence[SimBet],
+    bankroll_start: float,
+    paths: int = 100_000,
+    compounding: bool = True,
+    ruin_fraction: float = 0.1,
+    percentiles: Sequence[float] = DEFAULT_PERCENTILES,
+    checkpoints: int = 25,
+    chunk_size: int = 2048,
+    workers: int = 1,
+    seed: Optional[int] = None,
+) -> MonteCarloResult:
+    """
+    Monte Carlo bankroll risk for a bet sequence, using each bet's `prob` as the true win rate.
+
+    Every chunk of paths is one matrix operation: a (paths x bets) uniform draw decides
+    wins, per-bet returns are accumulated with cumsum, and drawdowns come from a running
+    maximum. With `compounding`, each bet risks the same fraction of the *current*
+    bankroll that its stake was of `bankroll_start` (log-space cumsum); otherwise stakes
+    are flat and P&L adds up. A path is ruined if it ever touches `ruin_fraction *
+    bankroll_start`. Chunks run across `workers` processes with independent seeds.
+    """
+    if not bets:
+        raise ValueError("No bets to simulate")
+    if paths <= 0:
+        raise ValueError("paths must be positive")
+    prob = np.array([b.prob for b in bets], dtype=np.float64)
+    payout = american_to_decimal_array(np.array([b.odds for b in bets])) - 1
+    stake = np.array([b.stake for b in bets], dtype=np.float64)
+
+    if compounding:
+        fraction = stake / bankroll_start
+        win_step = np.log1p(fraction * payout)
+        # An all-in loss leaves ~1e-9 of the bankroll (log stays finite), which counts as ruin.
+        loss_step = np.log1p(-np.minimum(fraction, 1 - _ALL_IN_FLOOR))
+    else:
+        win_step = stake * payout
+        loss_step = -stake
+
+    n_bets = len(bets)
+    cp = np.unique(np.linspace(0, n_bets, num=min(checkpoints, n_bets) + 1).round().astype(np.intp))
+    ruin_level = ruin_fraction * bankroll_start
+    params = (prob, win_step, loss_step, cp, compounding, bankroll_start, ruin_level)
+
+    sizes = [chunk_size] * (paths // chunk_size) + ([paths % chunk_size] if paths % chunk_size else [])
+    seeds = np.random.SeedSequence(seed).spawn(len(sizes))
+    workers = workers or os.cpu_count() or 1
+    if workers == 1 or len(sizes) == 1:
+        parts = [_simulate_chunk(size, s, *params) for size, s in zip(sizes, seeds)]
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            parts = list(pool.map(_simulate_chunk, sizes, seeds, *([p] * len(sizes) for p in params)))
+
+    final = np.concatenate([p[0] for p in parts])
+    drawdown = np.concatenate([p[1] for p in parts])
+    ruined = sum(int(p[2]) for p in parts)
+    at_checkpoints = np.concatenate([p[3] for p in parts])
+    pct = tuple(float(q) for q in percentiles)
+    return MonteCarloResult(
+        paths=paths,
+        bankroll_start=bankroll_start,
+        compounding=compounding,
+        ruin_level=ruin_level,
+        percentiles=pct,
+        checkpoints=cp,
+        percentile_paths=np.percentile(at_checkpoints, pct, axis=0),
+        final_bankroll=final,
+        max_drawdown=drawdown,
+        ruin_probability=ruined / paths,
+    )
+
+
+def _simulate_chunk(
+    size: int,
+    seed: np.random.SeedSequence,
+    prob: np.ndarray,
+    win_step: np.ndarray,
+    loss_step: np.ndarray,
+    checkpoints: np.ndarray,
+    compounding: bool,
+    bankroll_start: float,
+    ruin_level: float,
+) -> tuple[np.ndarray, np.ndarray, int, np.ndarray]:
+    rng = np.random.default_rng(seed)
+    # float32 halves memory traffic; the cumsum error over a season is far below Monte
+    # Carlo noise. The uniform-draw buffer is reused in place for the per-bet steps, and
+    # step = loss + win * (win_step - loss_step) avoids the slower np.where.
+    steps = rng.random((size, prob.shape[0]), dtype=np.float32)
+    wins = steps < prob.astype(np.float32)
+    np.multiply(wins, (win_step - loss_step).astype(np.float32), out=steps)
+    steps += loss_step.astype(np.float32)
+    del wins
+    np.cumsum(steps, axis=1, out=steps)  # steps now holds the running total after each bet
+
+    if compounding:
+        # Work in log-bankroll relative to the start; exp() only where values are reported.
+        peak = np.maximum.accumulate(np.maximum(steps, 0.0), axis=1)
+        np.subtract(peak, steps, out=peak)  # log drop from the running peak
+        drawdown = -np.expm1(-peak.max(axis=1).astype(np.float64))
+        del peak
+        floor = np.log(max(ruin_level / bankroll_start, _ALL_IN_FLOOR * 10))
+        ruined = int(np.count_nonzero(steps.min(axis=1) <= floor))
+        level = bankroll_start * np.exp(steps[:, checkpoints[1:] - 1]) if checkpoints.size > 1 else None
+        final = bankroll_start * np.exp(steps[:, -1].astype(np.float64))
+    else:
+        bankroll = steps
+        bankroll += bankroll_start
+        peak = np.maximum.accumulate(np.maximum(bankroll, bankroll_start), axis=1)
+        drawdown = np.max((peak - bankroll) / peak, axis=1).astype(np.float64)
+        del peak
+        ruined = int(np.count_nonzero(bankroll.min(axis=1) <= ruin_level))
+        level = bankroll[:, checkpoints[1:] - 1] if checkpoints.size > 1 else None
+        final = bankroll[:, -1].astype(np.float64)
+
+    at_checkpoints = np.empty((size, checkpoints.size), dtype=np.float32)
+    at_checkpoints[:, 0] = bankroll_start
+    if level is not None:
+        at_checkpoints[:, 1:] = level
+    return final, np.nan_to_num(drawdown, nan=1.0).clip(0.0, 1.0), ruined, at_checkpoints
@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from typing import Literal, Optional
 
 MarketSide = Literal["over", "under"]
@@ -15,6 +15,9 @@ class PredictionInput:
     line: float
     prob_over: float  # 0-1
     source: str = "model"
+    # Dictionary codes (see arbitrage_model.markets.CODEBOOK); -1 until a loader stamps them.
+    player_code: int = field(default=-1, compare=False, repr=False)
+    market_code: int = field(default=-1, compare=False, repr=False)
 
 
 @dataclass(frozen=True)
@@ -27,6 +30,9 @@ class MarketQuote:
     line: float
     over_odds: int
     under_odds: int
+    player_code: int = field(default=-1, compare=False, repr=False)
+    market_code: int = field(default=-1, compare=False, repr=False)
+    book_code: int = field(default=-1, compare=False, repr=False)
 
 
 @dataclass(frozen=True)
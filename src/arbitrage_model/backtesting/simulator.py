@@ -1,16 +1,18 @@
 from __future__ import annotations
 
-from typing import Iterable, List
-
-import pandas as pd
+from typing import TYPE_CHECKING, Iterable, List
 
 from arbitrage_model.backtesting.schemas import MarketQuote, PredictionInput, SimBet, SimResult
+from arbitrage_model.markets import quote_key
 from arbitrage_model.odds import american_to_decimal
 
+if TYPE_CHECKING:
+    import pandas as pd
+
 
 def simulate_expected_value(
     predictions: Iterable[PredictionInput],
-    quote_index: dict[tuple[str, float, str], list[MarketQuote]],
+    quote_index: dict[tuple[int, int, float], list[MarketQuote]],
     bankroll: float = 1000.0,
     kelly_clip: float = 0.25,
     min_edge_pct: float = 0.5,
@@ -21,7 +23,7 @@ def simulate_expected_value(
     This does NOT require actual outcomes—use this to score model quality vs available prices.
 
     Strategy:
-    - For each prediction, find matching quotes (player, line, market).
+    - For each prediction, find matching quotes by (player, market, line).
     - Compute edge for over and under; pick the better side above `min_edge_pct`.
     - Size using fractional Kelly (clipped) or flat stake if provided.
     """
@@ -30,15 +32,14 @@ def simulate_expected_value(
     expected_profit = 0.0
 
     for pred in predictions:
-        key = (pred.player, pred.line, pred.market)
-        quotes = quote_index.get(key, [])
+        quotes = quote_index.get(quote_key(pred), [])
         if not quotes:
             continue
         quote = _best_edge_quote(pred, quotes)
         if not quote:
             continue
 
-        side, odds, prob = quote
+        side, odds, prob, book = quote
         edge = _edge(prob, odds)
         if edge * 100 < min_edge_pct:
             continue
@@ -57,7 +58,7 @@ def simulate_expected_value(
                 market=pred.market,
                 line=pred.line,
                 side=side,
-                book=_quote_book(quotes, side),
+                book=book,
                 stake=stake,
                 odds=odds,
                 prob=prob,
@@ -84,6 +85,7 @@ def simulate_expected_value(
 
 
 def _best_edge_quote(pred: PredictionInput, quotes: list[MarketQuote]):
+    """(side, odds, prob, book) of the best-edge price across quotes; the book is the one offering it."""
     best = None
     best_edge = 0.0
     # Over
@@ -93,10 +95,10 @@ def _best_edge_quote(pred: PredictionInput, quotes: list[MarketQuote]):
         under_edge = _edge(under_prob, q.under_odds)
         if over_edge > best_edge:
             best_edge = over_edge
-            best = ("over", q.over_odds, pred.prob_over)
+            best = ("over", q.over_odds, pred.prob_over, q.book)
         if under_edge > best_edge:
             best_edge = under_edge
-            best = ("under", q.under_odds, under_prob)
+            best = ("under", q.under_odds, under_prob, q.book)
     return best
 
 
@@ -116,26 +118,26 @@ def _kelly_fraction(prob: float, odds: int) -> float:
     return max((prob * b - q) / b, 0)
 
 
-def _quote_book(quotes: list[MarketQuote], side: str) -> str:
-    # Return the book for the first quote; extend to pick best book per side if needed.
-    return quotes[0].book if quotes else "unknown"
+def to_rows(result: SimResult) -> list[dict]:
+    """Flatten simulated bets into display rows (rounded) for tables or JSON."""
+    return [
+        {
+            "player": b.player,
+            "market": b.market,
+            "line": b.line,
+            "side": b.side,
+            "book": b.book,
+            "stake": round(b.stake, 2),
+            "odds": b.odds,
+            "prob": round(b.prob, 3),
+            "edge_pct": round(b.edge, 2),
+            "kelly_fraction": round(b.kelly_fraction, 3),
+        }
+        for b in result.bets
+    ]
 
 
 def to_frame(result: SimResult) -> pd.DataFrame:
-    return pd.DataFrame(
-        [
-            {
-                "player": b.player,
-                "market": b.market,
-                "line": b.line,
-                "side": b.side,
-                "book": b.book,
-                "stake": round(b.stake, 2),
-                "odds": b.odds,
-                "prob": round(b.prob, 3),
-                "edge_pct": round(b.edge, 2),
-                "kelly_fraction": round(b.kelly_fraction, 3),
-            }
-            for b in result.bets
-        ]
-    )
+    import pandas as pd
+
+    return pd.DataFrame(to_rows(result))
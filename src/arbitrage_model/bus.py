@@ -0,0 +1,609 @@
+from __future__ import annotations
+
+import asyncio
+import csv
+import inspect
+import json
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager
+from dataclasses import dataclass, field, replace
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import (
+    TYPE_CHECKING,
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    Iterable,
+    Iterator,
+    Literal,
+    Optional,
+    Sequence,
+    Union,
+)
+
+from arbitrage_model.markets import CODEBOOK, DEFAULT_MARKET, MARKET_COLUMNS, canonical_market, quote_key
+from arbitrage_model.models import ArbitrageOpportunity, BookOffer
+from arbitrage_model.odds import normalize_american_odds
+
+if TYPE_CHECKING:
+    import pandas as pd
+
+    from arbitrage_model.backtesting.schemas import PredictionInput, SimBet
+
+DropPolicy = Literal["block", "drop_newest", "drop_oldest", "coalesce"]
+POLICIES: tuple[str, ...] = ("block", "drop_newest", "drop_oldest", "coalesce")
+LATENCY_WINDOW = 10_000
+
+Handler = Callable[["QuoteBatch"], Union[Awaitable[None], None]]
+
+
+@dataclass(frozen=True)
+class QuoteBatch:
+    """One book's normalized board from a single scrape."""
+
+    book: str
+    captured_at: datetime
+    offers: tuple[BookOffer, ...]
+    published_at: float = field(default_factory=time.time)  # wall clock, comparable across processes
+    seq: int = 0  # assigned by QuoteBus.publish
+
+    def quotes(self) -> dict[str, dict[tuple[str, str, float], tuple[int, int]]]:
+        """{book: {(player, market, line): (over_odds, under_odds)}}; multi-book batches split per book."""
+        boards: dict[str, dict[tuple[str, str, float], tuple[int, int]]] = {}
+        for o in self.offers:
+            boards.setdefault(o.book, {})[(o.player, o.market, o.line)] = (o.over_odds, o.under_odds)
+        return boards
+
+
+def frame_to_batch(
+    book: str, frame: pd.DataFrame, market: Optional[str] = None, captured_at: Optional[datetime] = None
+) -> QuoteBatch:
+    """
+    Normalize a scraper frame (players, line, over, under[, book][, market]) into a batch.
+
+    Follows aggregator.load_book_quotes: a `book` column overrides `book` per row, markets
+    are canonicalized and codes stamped. Rows without both prices (line-only Rotowire
+    boards) or with unparseable odds (suspended or half-rendered lines) are skipped rather
+    than failing the whole board.
+    """
+    file_market = canonical_market(market, book) if market else DEFAULT_MARKET
+    market_column = next((c for c in MARKET_COLUMNS if c in frame.columns), None)
+    columns = ["players", "line", "over", "under"]
+    rows = frame[columns].itertuples(index=False, name=None)
+    row_books = frame["book"].tolist() if "book" in frame.columns else None
+    row_markets = frame[market_column].tolist() if market_column else None
+
+    players, markets, books = CODEBOOK.players, CODEBOOK.markets, CODEBOOK.books
+    offers = []
+    for i, (player, line, over, under) in enumerate(rows):
+        try:
+            over_odds, under_odds = _frame_odds(over), _frame_odds(under)
+            line = float(line)
+        except (TypeError, ValueError):
+            continue
+        if over_odds is None or under_odds is None:
+            continue
+        row_book = (row_books[i] if row_books else None) or book
+        raw_market = row_markets[i] if row_markets else None
+        has_market = isinstance(raw_market, str) and raw_market
+        row_market = canonical_market(raw_market, row_book) if has_market else file_market
+        player = str(player).strip()
+        offers.append(
+            BookOffer(
+                book=row_book,
+                player=player,
+                market=row_market,
+                line=line,
+                over_odds=over_odds,
+                under_odds=under_odds,
+                player_code=players.code(player),
+                market_code=markets.code(row_market),
+                book_code=books.code(row_book),
+            )
+        )
+    return QuoteBatch(book=book, captured_at=captured_at or datetime.now(timezone.utc), offers=tuple(offers))
+
+
+def _frame_odds(value: object) -> Optional[int]:
+    """American odds from a frame cell; None for a missing price (None, NaN or blank)."""
+    if value is None or (isinstance(value, str) and not value.strip()):
+        return None
+    if isinstance(value, float):
+        # A numeric odds column holding a missing price is widened to float64.
+        return None if value != value else int(value)
+    return normalize_american_odds(value)
+
+
+@dataclass(frozen=True)
+class SubscriberStats:
+    name: str
+    policy: str
+    maxsize: int
+    depth: int
+    max_depth: int
+    delivered: int
+    dropped: int
+    replaced: int
+    handled: int
+    errors: int
+    p50_ms: float
+    p99_ms: float
+
+
+class Subscription:
+    """
+    Bounded queue of batches for one subscriber.
+
+    When full, `policy` decides: "block" makes the publisher wait (backpressure),
+    "drop_newest" discards the incoming batch, "drop_oldest" evicts the head. "coalesce"
+    first replaces a queued batch from the same book (a newer board supersedes an older
+    one) and otherwise behaves like drop_oldest. Every discard is counted in `dropped`,
+    every in-place replacement in `replaced`.
+    """
+
+    def __init__(self, name: str, maxsize: int = 64, policy: DropPolicy = "block") -> None:
+        if policy not in POLICIES:
+            raise ValueError(f"Unknown drop policy {policy!r}; expected one of {POLICIES}")
+        if maxsize < 1:
+            raise ValueError("maxsize must be at least 1")
+        self.name = name
+        self.maxsize = maxsize
+        self.policy = policy
+        self.closed = False
+        self.delivered = 0
+        self.dropped = 0
+        self.replaced = 0
+        self.handled = 0
+        self.errors = 0
+        self.max_depth = 0
+        self.last_error: Optional[BaseException] = None
+        self.latencies: deque[float] = deque(maxlen=LATENCY_WINDOW)  # publish -> handled, seconds
+        self._items: deque[QuoteBatch] = deque()
+        self._cond = asyncio.Condition()
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+    async def put(self, batch: QuoteBatch) -> bool:
+        """Enqueue per the drop policy; False if the batch was discarded (or the subscription closed)."""
+        async with self._cond:
+            if self.closed:
+                return False
+            if self.policy == "coalesce":
+                for i, queued in enumerate(self._items):
+                    if queued.book == batch.book:
+                        self._items[i] = batch
+                        self.replaced += 1
+                        self._cond.notify_all()
+                        return True
+            if len(self._items) >= self.maxsize:
+                if self.policy == "block":
+                    await self._cond.wait_for(lambda: len(self._items) < self.maxsize or self.closed)
+                    if self.closed:
+                        return False
+                elif self.policy == "drop_newest":
+                    self.dropped += 1
+                    return False
+                else:
+                    self._items.popleft()
+                    self.dropped += 1
+            self._items.append(batch)
+            self.delivered += 1
+            self.max_depth = max(self.max_depth, len(self._items))
+            self._cond.notify_all()
+            return True
+
+    async def get(self) -> Optional[QuoteBatch]:
+        """Next batch, waiting if needed; None once closed and drained."""
+        async with self._cond:
+            await self._cond.wait_for(lambda: self._items or self.closed)
+            if not self._items:
+                return None
+            batch = self._items.popleft()
+            self._cond.notify_all()
+            return batch
+
+    def __aiter__(self) -> AsyncIterator[QuoteBatch]:
+        return self
+
+    async def __anext__(self) -> QuoteBatch:
+        batch = await self.get()
+        if batch is None:
+            raise StopAsyncIteration
+        return batch
+
+    async def close(self) -> None:
+        """Stop accepting batches; queued ones are still handed out."""
+        async with self._cond:
+            self.closed = True
+            self._cond.notify_all()
+
+    def stats(self) -> SubscriberStats:
+        ordered = sorted(self.latencies)
+
+        def _pct(q: float) -> float:
+            return ordered[min(len(ordered) - 1, int(q * len(ordered)))] * 1000 if ordered else float("nan")
+
+        return SubscriberStats(
+            name=self.name,
+            policy=self.policy,
+            maxsize=self.maxsize,
+            depth=len(self._items),
+            max_depth=self.max_depth,
+            delivered=self.delivered,
+            dropped=self.dropped,
+            replaced=self.replaced,
+            handled=self.handled,
+            errors=self.errors,
+            p50_ms=_pct(0.5),
+            p99_ms=_pct(0.99),
+        )
+
+
+class QuoteBus:
+    """
+    In-process publish/subscribe for quote batches.
+
+    Scrapers publish each normalized board once; every subscriber (arb scanner, +EV
+    scanner, CSV writer, socket bridge) gets its own bounded Subscription, so a slow
+    consumer only affects the publisher if it chose the "block" policy. Must be used
+    from one event loop; other threads publish through `publish_threadsafe`.
+    """
+
+    def __init__(self) -> None:
+        self._subs: dict[str, Subscription] = {}
+        self._tasks: dict[str, asyncio.Task] = {}
+        self._servers: list[asyncio.AbstractServer] = []
+        self._seq = 0
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+
+    async def __aenter__(self) -> QuoteBus:
+        self._loop = asyncio.get_running_loop()
+        return self
+
+    async def __aexit__(self, *exc) -> None:
+        await self.close()
+
+    def subscribe(self, name: str, maxsize: int = 64, policy: DropPolicy = "block") -> Subscription:
+        if name in self._subs:
+            raise ValueError(f"Subscriber {name!r} already exists")
+        sub = self._subs[name] = Subscription(name, maxsize, policy)
+        return sub
+
+    def unsubscribe(self, name: str) -> None:
+        sub = self._subs.pop(name, None)
+        if sub is not None:
+            # Release a publisher blocked on this subscriber.
+            sub.closed = True
+            asyncio.ensure_future(sub.close())
+
+    def attach(self, name: str, handler: Handler, maxsize: int = 64, policy: DropPolicy = "block") -> Subscription:
+        """Subscribe and run `handler` (sync or async) on each batch in a task on the running loop."""
+        self._loop = self._loop or asyncio.get_running_loop()
+        sub = self.subscribe(name, maxsize, policy)
+        self._tasks[name] = asyncio.ensure_future(self._consume(sub, handler))
+        return sub
+
+    async def _consume(self, sub: Subscription, handler: Handler) -> None:
+        async for batch in sub:
+            try:
+                result = handler(batch)
+                if inspect.isawaitable(result):
+                    await result
+            except Exception as exc:  # one bad batch must not kill the subscriber
+                sub.errors += 1
+                sub.last_error = exc
+                continue
+            sub.handled += 1
+            sub.latencies.append(time.time() - batch.published_at)
+
+    async def publish(self, batch: QuoteBatch) -> QuoteBatch:
+        """Stamp a sequence number and publish time, then offer the batch to every subscriber."""
+        self._seq += 1
+        batch = replace(batch, seq=self._seq, published_at=time.time())
+        for sub in list(self._subs.values()):
+            await sub.put(batch)
+        return batch
+
+    def publish_threadsafe(self, batch: QuoteBatch, timeout: Optional[float] = None) -> QuoteBatch:
+        """Publish from a non-loop thread (e.g. a scraper worker); blocks while a "block" subscriber is full."""
+        if self._loop is None:
+            raise RuntimeError("QuoteBus is not running on an event loop")
+        return asyncio.run_coroutine_threadsafe(self.publish(batch), self._loop).result(timeout)
+
+    def call_threadsafe(self, func: Callable, *args, **kwargs):
+        """Run `func(*args, **kwargs)` (awaited if it is a coroutine) on the bus loop from another thread."""
+        if self._loop is None:
+            raise RuntimeError("QuoteBus is not running on an event loop")
+
+        async def _call():
+            result = func(*args, **kwargs)
+            return await result if inspect.isawaitable(result) else result
+
+        return asyncio.run_coroutine_threadsafe(_call(), self._loop).result()
+
+    async def close(self) -> None:
+        """Stop socket bridges, close every subscription and wait for attached handlers to drain."""
+        for server in self._servers:
+            server.close()
+        self._servers.clear()
+        for sub in list(self._subs.values()):
+            await sub.close()
+        if self._tasks:
+            await asyncio.gather(*self._tasks.values(), return_exceptions=True)
+        self._tasks.clear()
+
+    def stats(self) -> list[SubscriberStats]:
+        return [sub.stats() for sub in self._subs.values()]
+
+
+@contextmanager
+def threaded_bus() -> Iterator[QuoteBus]:
+    """
+    Run a QuoteBus on an event loop in a daemon thread, for synchronous callers such as
+    the scrape scheduler. Attach subscribers with `bus.call_threadsafe(bus.attach, ...)`;
+    on exit the bus is closed (queues drained) and the loop stopped.
+    """
+    loop = asyncio.new_event_loop()
+    thread = threading.Thread(target=loop.run_forever, name="quote-bus", daemon=True)
+    thread.start()
+    bus = QuoteBus()
+    bus._loop = loop
+    try:
+        yield bus
+    finally:
+        asyncio.run_coroutine_threadsafe(bus.close(), loop).result()
+        loop.call_soon_threadsafe(loop.stop)
+        thread.join()
+        loop.close()
+
+
+def format_bus_stats(stats: Iterable[SubscriberStats]) -> list[dict]:
+    """Display rows for subscriber stats."""
+    return [
+        {
+            "subscriber": s.name,
+            "policy": s.policy,
+            "depth": f"{s.depth}/{s.maxsize}",
+            "max_depth": s.max_depth,
+            "delivered": s.delivered,
+            "dropped": s.dropped,
+            "replaced": s.replaced,
+            "handled": s.handled,
+            "errors": s.errors,
+            "p50_ms": round(s.p50_ms, 2),
+            "p99_ms": round(s.p99_ms, 2),
+        }
+        for s in stats
+    ]
+
+
+class ArbSubscriber:
+    """
+    Keep a live cross-book board and rescan only the lines each batch changed.
+
+    Each batch is diffed against that book's previous board (replay.diff_quotes) and the
+    changes fed to an IncrementalScanner; `on_new` gets opportunities that just appeared.
+    """
+
+    def __init__(
+        self,
+        bankroll: float = 100.0,
+        on_new: Optional[Callable[[list[ArbitrageOpportunity], QuoteBatch], None]] = None,
+    ) -> None:
+        from arbitrage_model.replay import IncrementalScanner
+
+        self.scanner = IncrementalScanner(bankroll)
+        self.on_new = on_new
+        self._boards: dict[str, dict[tuple[str, str, float], tuple[int, int]]] = {}
+
+    def __call__(self, batch: QuoteBatch) -> list[ArbitrageOpportunity]:
+        from arbitrage_model.replay import diff_quotes
+
+        events = []
+        for book, quotes in batch.quotes().items():
+            events.extend(diff_quotes(book, self._boards.get(book, {}), quotes, at=0.0))
+            self._boards[book] = quotes
+        before = set(self.scanner.arbs)
+        self.scanner.apply(events)
+        new = [opp for key, opp in self.scanner.arbs.items() if key not in before]
+        if new and self.on_new is not None:
+            self.on_new(sorted(new, key=lambda o: o.edge_pct, reverse=True), batch)
+        return new
+
+    @property
+    def opportunities(self) -> list[ArbitrageOpportunity]:
+        return self.scanner.opportunities
+
+
+class EVSubscriber:
+    """
+    Score each batch against model predictions (backtesting.simulator) and report +EV bets.
+
+    Only predictions whose (player, market, line) appear in the batch are simulated, so
+    the cost per batch scales with the board, not the prediction file.
+    """
+
+    def __init__(
+        self,
+        predictions: Sequence[PredictionInput],
+        bankroll: float = 1000.0,
+        kelly_clip: float = 0.25,
+        min_edge_pct: float = 0.5,
+        on_bets: Optional[Callable[[list[SimBet], QuoteBatch], None]] = None,
+    ) -> None:
+        self.bankroll = bankroll
+        self.kelly_clip = kelly_clip
+        self.min_edge_pct = min_edge_pct
+        self.on_bets = on_bets
+        self._all_predictions = tuple(predictions)
+        self._index()
+
+    def _index(self) -> None:
+        # Keyed on codebook codes, so rebuilt whenever the codebook is reset.
+        self._generation = CODEBOOK.generation
+        self._predictions: dict[tuple[int, int, float], list[PredictionInput]] = {}
+        for pred in self._all_predictions:
+            self._predictions.setdefault(quote_key(pred), []).append(pred)
+
+    def __call__(self, batch: QuoteBatch) -> list[SimBet]:
+        from arbitrage_model.backtesting.loader import align_predictions_to_quotes
+        from arbitrage_model.backtesting.schemas import MarketQuote
+        from arbitrage_model.backtesting.simulator import simulate_expected_value
+
+        if self._generation != CODEBOOK.generation:
+            self._index()
+        keys = {quote_key(o) for o in batch.offers}
+        matched = [p for key in keys for p in self._predictions.get(key, ())]
+        if not matched:
+            return []
+        quotes = [
+            MarketQuote(
+                book=o.book,
+                player=o.player,
+                market=o.market,
+                line=o.line,
+                over_odds=o.over_odds,
+                under_odds=o.under_odds,
+                player_code=o.player_code,
+                market_code=o.market_code,
+                book_code=o.book_code,
+            )
+            for o in batch.offers
+        ]
+        result = simulate_expected_value(
+            matched,
+            align_predictions_to_quotes(matched, quotes),
+            bankroll=self.bankroll,
+            kelly_clip=self.kelly_clip,
+            min_edge_pct=self.min_edge_pct,
+        )
+        if result.bets and self.on_bets is not None:
+            self.on_bets(result.bets, batch)
+        return result.bets
+
+
+class CsvSink:
+    """
+    Write each batch in the scanner's CSV schema, off the event loop.
+
+    Default: `<book>_props_latest.csv` (overwritten). With `dated`, one
+    `<book>_props_YYYY-MM-DDTHHMM.csv` per capture minute, which replay and the CLV
+    analytics read as history.
+    """
+
+    def __init__(self, output_dir: Path, dated: bool = False) -> None:
+        self.output_dir = Path(output_dir)
+        self.dated = dated
+        self.output_dir.mkdir(parents=True, exist_ok=True)
+
+    async def __call__(self, batch: QuoteBatch) -> None:
+        await asyncio.to_thread(self.write, batch)
+
+    def path_for(self, batch: QuoteBatch) -> Path:
+        slug = batch.book.strip().lower().replace(" ", "_")
+        suffix = batch.captured_at.astimezone(timezone.utc).strftime("%Y-%m-%dT%H%M") if self.dated else "latest"
+        return self.output_dir / f"{slug}_props_{suffix}.csv"
+
+    def write(self, batch: QuoteBatch) -> Path:
+        path = self.path_for(batch)
+        tmp = path.with_suffix(".csv.tmp")
+        with open(tmp, "w", newline="", encoding="utf-8") as fh:
+            writer = csv.writer(fh)
+            writer.writerow(["players", "line", "over", "under", "market", "book"])
+            writer.writerows((o.player, o.line, o.over_odds, o.under_odds, o.market, o.book) for o in batch.offers)
+        tmp.replace(path)  # readers never see a half-written board
+        return path
+
+
+def encode_batch(batch: QuoteBatch) -> bytes:
+    """One NDJSON line; codes are process-local and not sent."""
+    payload = {
+        "book": batch.book,
+        "captured_at": batch.captured_at.isoformat(),
+        "published_at": batch.published_at,
+        "seq": batch.seq,
+        "offers": [[o.book, o.player, o.market, o.line, o.over_odds, o.under_odds] for o in batch.offers],
+    }
+    return json.dumps(payload, separators=(",", ":")).encode("utf-8") + b"\n"
+
+
+def decode_batch(line: bytes) -> QuoteBatch:
+    """Inverse of encode_batch; codes are stamped from this process's CODEBOOK."""
+    payload = json.loads(line)
+    players, markets, books = CODEBOOK.players, CODEBOOK.markets, CODEBOOK.books
+    offers = tuple(
+        BookOffer(
+            book=book,
+            player=player,
+            market=market,
+            line=float(line_),
+            over_odds=int(over),
+            under_odds=int(under),
+            player_code=players.code(player),
+            market_code=markets.code(market),
+            book_code=books.code(book),
+        )
+        for book, player, market, line_, over, under in payload["offers"]
+    )
+    return QuoteBatch(
+        book=payload["book"],
+        captured_at=datetime.fromisoformat(payload["captured_at"]),
+        offers=offers,
+        published_at=payload["published_at"],
+        seq=payload["seq"],
+    )
+
+
+_STREAM_LIMIT = 1 << 24  # a full multi-book board is one line
+
+
+async def serve_unix(
+    bus: QuoteBus, path: Path, maxsize: int = 256, policy: DropPolicy = "drop_oldest"
+) -> asyncio.AbstractServer:
+    """
+    Stream every published batch as NDJSON to clients of a local Unix socket.
+
+    Each client is its own attached bus subscriber, so a stalled reader drops its own
+    oldest batches (by default) instead of holding up the scrapers. Clients never send;
+    reaching EOF on the read side is how a hang-up is noticed, even while no batches flow.
+    """
+    path = Path(path)
+    path.unlink(missing_ok=True)
+
+    async def _client(reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        name = f"unix:{id(writer):x}"
+
+        async def _send(batch: QuoteBatch) -> None:
+            writer.write(encode_batch(batch))
+            await writer.drain()
+
+        bus.attach(name, _send, maxsize, policy)
+        try:
+            while not reader.at_eof():
+                await reader.read(4096)
+        except ConnectionError:
+            pass
+        finally:
+            bus.unsubscribe(name)
+            task = bus._tasks.pop(name, None)
+            if task is not None:
+                task.cancel()  # nobody left to drain queued batches to
+            writer.close()
+
+    server = await asyncio.start_unix_server(_client, path=str(path), limit=_STREAM_LIMIT)
+    bus._servers.append(server)  # closed with the bus
+    return server
+
+
+async def subscribe_unix(path: Path) -> AsyncIterator[QuoteBatch]:
+    """Yield batches from a `serve_unix` socket until the publisher goes away."""
+    reader, writer = await asyncio.open_unix_connection(str(path), limit=_STREAM_LIMIT)
+    try:
+        while line := await reader.readline():
+            yield decode_batch(line)
+    finally:
+        writer.close()
@@ -0,0 +1,198 @@
+from __future__ import annotations
+
+import re
+from functools import lru_cache
+from pathlib import Path
+from typing import Optional, Protocol
+
+DEFAULT_MARKET = "points"
+
+CANONICAL_MARKETS = (
+    "points",
+    "rebounds",
+    "assists",
+    "threes",
+    "steals",
+    "blocks",
+    "turnovers",
+    "points_rebounds_assists",
+    "points_rebounds",
+    "points_assists",
+    "rebounds_assists",
+    "steals_blocks",
+)
+
+# Normalized label (lowercase words, see normalize_label) -> canonical market.
+MARKET_ALIASES: dict[str, str] = {
+    **{m.replace("_", " "): m for m in CANONICAL_MARKETS},
+    "pts": "points",
+    "player points": "points",
+    "reb": "rebounds",
+    "rebs": "rebounds",
+    "player rebounds": "rebounds",
+    "ast": "assists",
+    "asts": "assists",
+    "player assists": "assists",
+    "3pm": "threes",
+    "3pt": "threes",
+    "3 pt made": "threes",
+    "3 pointers made": "threes",
+    "three pointers made": "threes",
+    "made threes": "threes",
+    "stl": "steals",
+    "blk": "blocks",
+    "tov": "turnovers",
+    "pra": "points_rebounds_assists",
+    "pts reb ast": "points_rebounds_assists",
+    "pts rebs asts": "points_rebounds_assists",
+    "points rebounds assists": "points_rebounds_assists",
+    "pr": "points_rebounds",
+    "pts reb": "points_rebounds",
+    "pts rebs": "points_rebounds",
+    "pa": "points_assists",
+    "pts ast": "points_assists",
+    "pts asts": "points_assists",
+    "ra": "rebounds_assists",
+    "reb ast": "rebounds_assists",
+    "rebs asts": "rebounds_assists",
+    "stocks": "steals_blocks",
+    "blks stls": "steals_blocks",
+    "steals blocks": "steals_blocks",
+}
+
+# Book-specific labels that differ from (or would be ambiguous in) the shared table. Keys
+# are book-name prefixes after normalize_label.
+BOOK_MARKET_ALIASES: dict[str, dict[str, str]] = {
+    "bovada": {"total points": "points", "total rebounds": "rebounds", "total assists": "assists"},
+    "prizepicks": {"3 pt made": "threes", "rebs asts": "rebounds_assists", "blks stls": "steals_blocks"},
+}
+
+MARKET_COLUMNS = ("market", "stat", "prop")
+
+
+def normalize_label(raw: str) -> str:
+    """Lowercase words only: `Pts+Rebs+Asts` -> `pts rebs asts`."""
+    return " ".join(re.findall(r"[a-z0-9]+", raw.lower()))
+
+
+@lru_cache(maxsize=4096)
+def lookup_market(raw: str, book: Optional[str] = None) -> Optional[str]:
+    """Canonical market for a label (book aliases first), or None if it is not in the taxonomy."""
+    label = normalize_label(raw)
+    if book:
+        book_key = normalize_label(book)
+        for prefix, aliases in BOOK_MARKET_ALIASES.items():
+            if book_key.startswith(prefix) and label in aliases:
+                return aliases[label]
+    return MARKET_ALIASES.get(label)
+
+
+def canonical_market(raw: str, book: Optional[str] = None) -> str:
+    """Canonical market for a label; unknown labels pass through as a snake_case slug."""
+    return lookup_market(raw, book) or normalize_label(raw).replace(" ", "_") or DEFAULT_MARKET
+
+
+def split_market_from_stem(stem: str) -> tuple[str, Optional[str]]:
+    """
+    Find a market named in a snapshot filename stem and return (stem without it, market).
+
+    `draftkings_rebounds_props_2025-05-09` -> (`draftkings_props_2025-05-09`, "rebounds");
+    `prizepicks_pts_rebs_asts_props_sample` -> (`prizepicks_props_sample`, "points_rebounds_assists").
+    Labels and aliases are only read right before `_props`; without it the suffix must be a
+    canonical market name (`fanduel_rebounds`), so `betmgm_pa` stays a book. Stems without a
+    recognizable market come back unchanged with None.
+    """
+    head, sep, tail = stem.partition("_props")
+    parts = head.split("_")
+    if len(parts) < 2:
+        return stem, None
+    if sep:
+        market = lookup_market(" ".join(parts[1:]), parts[0])
+    else:
+        market = "_".join(parts[1:]) if "_".join(parts[1:]) in CANONICAL_MARKETS else None
+    if market is None:
+        return stem, None
+    return parts[0] + sep + tail, market
+
+
+def market_from_path(path: Path) -> Optional[str]:
+    return split_market_from_stem(Path(path).stem)[1]
+
+
+class Vocabulary:
+    """Append-only string <-> small int code table; `names` is only ever appended to, so it can be shared."""
+
+    def __init__(self) -> None:
+        self._codes: dict[str, int] = {}
+        self.names: list[str] = []
+
+    def code(self, name: str) -> int:
+        code = self._codes.get(name)
+        if code is None:
+            code = self._codes[name] = len(self.names)
+            self.names.append(name)
+        return code
+
+    def holds(self, code: int, name: str) -> bool:
+        """True if `code` is this table's code for `name` (False for unstamped or stale codes)."""
+        return 0 <= code < len(self.names) and self.names[code] == name
+
+    def __len__(self) -> int:
+        return len(self.names)
+
+
+MAX_CODEBOOK_NAMES = 20_000  # per vocabulary, before a long-lived process starts a fresh codebook
+
+
+class Codebook:
+    """
+    Dictionary encoding for players, markets and books.
+
+    Loaders stamp codes onto records once at ingestion, so grouping and joins hash small
+    integer tuples instead of strings. Codes are process-local; never persist them.
+
+    The tables only grow, so long-lived processes (`scrape_books watch`, `serve_api`) call
+    `trim()` between boards. A reset swaps in new tables rather than clearing the old ones,
+    so name lists already handed out (QuoteArrays) stay valid; records stamped before it are
+    recognised as stale by `Vocabulary.holds` and re-encoded, and `generation` tells caches
+    keyed on codes to rebuild.
+    """
+
+    def __init__(self) -> None:
+        self.generation = 0
+        self._fresh()
+
+    def _fresh(self) -> None:
+        self.players = Vocabulary()
+        self.markets = Vocabulary()
+        self.books = Vocabulary()
+
+    def reset(self) -> None:
+        self._fresh()
+        self.generation += 1
+
+    def trim(self, max_names: int = MAX_CODEBOOK_NAMES) -> bool:
+        """Reset once any table holds more than `max_names` names; True if it did."""
+        if max(len(self.players), len(self.markets), len(self.books)) <= max_names:
+            return False
+        self.reset()
+        return True
+
+
+CODEBOOK = Codebook()
+
+
+class _Coded(Protocol):
+    player: str
+    market: str
+    line: float
+    player_code: int
+    market_code: int
+
+
+def quote_key(record: _Coded) -> tuple[int, int, float]:
+    """(player_code, market_code, line) for an offer/quote/prediction, encoding on the fly if unstamped or stale."""
+    players, markets = CODEBOOK.players, CODEBOOK.markets
+    if players.holds(record.player_code, record.player) and markets.holds(record.market_code, record.market):
+        return record.player_code, record.market_code, record.line
+    return players.code(record.player), markets.code(record.market), record.line
@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from typing import Literal
 
 MarketSide = Literal["over", "under"]
@@ -16,6 +16,10 @@ class BookOffer:
     line: float
     over_odds: int
     under_odds: int
+    # Dictionary codes (see arbitrage_model.markets.CODEBOOK); -1 until a loader stamps them.
+    player_code: int = field(default=-1, compare=False, repr=False)
+    market_code: int = field(default=-1, compare=False, repr=False)
+    book_code: int = field(default=-1, compare=False, repr=False)
 
 
 @dataclass(frozen=True)
@@ -0,0 +1,307 @@
+from __future__ import annotations
+
+import csv
+import re
+import sqlite3
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from dataclasses import dataclass, field
+from datetime import date, datetime, timezone
+from pathlib import Path
+from typing import Callable, Iterable, Optional, Sequence, Union
+
+import numpy as np
+import pandas as pd
+
+from arbitrage_model.markets import canonical_market
+
+STAT_COLUMNS = ("minutes", "points", "rebounds", "assists", "threes", "steals", "blocks", "turnovers")
+
+# Canonical market -> box-score stats summed to settle it.
+MARKET_STATS: dict[str, tuple[str, ...]] = {
+    "points": ("points",),
+    "rebounds": ("rebounds",),
+    "assists": ("assists",),
+    "threes": ("threes",),
+    "steals": ("steals",),
+    "blocks": ("blocks",),
+    "turnovers": ("turnovers",),
+    "points_rebounds_assists": ("points", "rebounds", "assists"),
+    "points_rebounds": ("points", "rebounds"),
+    "points_assists": ("points", "assists"),
+    "rebounds_assists": ("rebounds", "assists"),
+    "steals_blocks": ("steals", "blocks"),
+}
+
+DateLike = Union[str, date, datetime, pd.Timestamp]
+
+_SUFFIXES = {"jr", "sr", "ii", "iii", "iv"}
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS games (
+    game_id TEXT PRIMARY KEY,
+    game_date TEXT NOT NULL,
+    url TEXT,
+    players INTEGER NOT NULL,
+    ingested_at TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS box_scores (
+    player TEXT NOT NULL,
+    game_date TEXT NOT NULL,
+    game_id TEXT NOT NULL REFERENCES games(game_id),
+    minutes REAL,
+    points INTEGER,
+    rebounds INTEGER,
+    assists INTEGER,
+    threes INTEGER,
+    steals INTEGER,
+    blocks INTEGER,
+    turnovers INTEGER,
+    PRIMARY KEY (player, game_date)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS box_scores_game ON box_scores (game_id);
+CREATE INDEX IF NOT EXISTS box_scores_date ON box_scores (game_date);
+"""
+
+
+@dataclass(frozen=True)
+class GameRef:
+    """A box score to ingest."""
+
+    game_id: str
+    game_date: date
+    url: str
+
+
+def load_game_list(path: Path) -> list[GameRef]:
+    """
+    Read games to ingest from CSV: game_url, game_date (YYYY-MM-DD)[, game_id].
+    The id defaults to ESPN's gameId in the URL.
+    """
+    from arbitrage_model.scrapers.espn_boxscore import game_id_from_url
+
+    with open(path, newline="", encoding="utf-8") as fh:
+        reader = csv.DictReader(fh)
+        missing = {"game_url", "game_date"} - set(reader.fieldnames or ())
+        if missing:
+            raise ValueError(f"{path} missing required columns: {missing}")
+        return [
+            GameRef(
+                game_id=(row.get("game_id") or "").strip() or game_id_from_url(row["game_url"].strip()),
+                game_date=date.fromisoformat(row["game_date"].strip()),
+                url=row["game_url"].strip(),
+            )
+            for row in reader
+        ]
+
+
+def _iso_date(value: DateLike) -> str:
+    return pd.Timestamp(value).date().isoformat()
+
+
+def player_key(name: str) -> str:
+    """Join key tolerant of ESPN's abbreviated names: `LeBron James` and `L. James` -> `l james`."""
+    words = [w for w in re.findall(r"[a-z]+", name.lower().replace("'", "")) if w not in _SUFFIXES]
+    if len(words) < 2:
+        return " ".join(words)
+    return f"{words[0][0]} {words[-1]}"
+
+
+class OutcomeStore:
+    """
+    Realized player box scores in SQLite, keyed by (player, game_date).
+
+    Ingestion is per game and idempotent: a game's rows are replaced in one transaction,
+    and a name already stored for that date by another game (or twice in one box score, as
+    abbreviated names like "J. Williams" can be) fails the whole game rather than
+    overwriting a row. `stored_games()` lets bulk runs skip what is already settled. Reads come back as
+    typed pandas frames so the backtester joins against a whole slate in one pass.
+    """
+
+    def __init__(self, path: Path) -> None:
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(self.path)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.executescript(_SCHEMA)
+
+    def __enter__(self) -> OutcomeStore:
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    def close(self) -> None:
+        self._conn.close()
+
+    def stored_games(self) -> set[str]:
+        return {row[0] for row in self._conn.execute("SELECT game_id FROM games")}
+
+    def last_ingested(self) -> Optional[str]:
+        return self._conn.execute("SELECT MAX(ingested_at) FROM games").fetchone()[0]
+
+    def ingest(self, frame: pd.DataFrame, game_id: str, game_date: DateLike, url: Optional[str] = None) -> int:
+        """
+        Store one game's box score (a parse_boxscore frame), replacing any earlier copy; returns rows.
+        Raises sqlite3.IntegrityError, storing nothing, if a player name collides on that date.
+        """
+        day = _iso_date(game_date)
+        # float64 -> Python floats for sqlite3; INTEGER affinity stores whole values as ints.
+        stats = frame.reindex(columns=list(STAT_COLUMNS)).astype("float64").to_numpy().tolist()
+        rows = [
+            (str(player).strip(), day, game_id, *(None if v != v else v for v in values))
+            for player, values in zip(frame["players"], stats)
+        ]
+        with self._conn:
+            self._conn.execute("DELETE FROM box_scores WHERE game_id = ?", (game_id,))
+            self._conn.execute(
+                "INSERT OR REPLACE INTO games VALUES (?, ?, ?, ?, ?)",
+                (game_id, day, url, len(rows), datetime.now(timezone.utc).isoformat()),
+            )
+            self._conn.executemany(
+                f"INSERT INTO box_scores VALUES (?, ?, ?{', ?' * len(STAT_COLUMNS)})", rows
+            )
+        return len(rows)
+
+    def frame(
+        self,
+        start: Optional[DateLike] = None,
+        end: Optional[DateLike] = None,
+        players: Optional[Iterable[str]] = None,
+        stats: Sequence[str] = STAT_COLUMNS,
+        ingested_after: Optional[str] = None,
+    ) -> pd.DataFrame:
+        """
+        Box scores between `start` and `end` (inclusive): player, game_date (datetime64),
+        game_id, stats. `players` match by player_key, so a book's `Jayson Tatum` finds
+        ESPN's `J. Tatum`. `ingested_after` (an `ingested_at` watermark, exclusive) limits
+        the read to games stored since then, for incremental consumers.
+        """
+        clauses, params = [], []
+        if ingested_after is not None:
+            clauses.append("game_id IN (SELECT game_id FROM games WHERE ingested_at > ?)")
+            params.append(ingested_after)
+        if start is not None:
+            clauses.append("game_date >= ?")
+            params.append(_iso_date(start))
+        if end is not None:
+            clauses.append("game_date <= ?")
+            params.append(_iso_date(end))
+        where = f" WHERE {' AND '.join(clauses)}" if clauses else ""
+        query = f"SELECT player, game_date, game_id, {', '.join(stats)} FROM box_scores{where}"
+        frame = pd.read_sql_query(query, self._conn, params=params)
+        if players is not None:
+            frame = frame[frame["player"].map(player_key).isin({player_key(p) for p in players})]
+        frame["game_date"] = pd.to_datetime(frame["game_date"])
+        for column in stats:
+            frame[column] = frame[column].astype("float64" if column == "minutes" else "Int64")
+        return frame.sort_values(["game_date", "player"], ignore_index=True)
+
+    def outcomes(
+        self,
+        markets: Optional[Iterable[str]] = None,
+        game_date: Optional[DateLike] = None,
+        latest: bool = False,
+    ) -> pd.DataFrame:
+        """
+        Long settlement frame (player, game_date, market, actual) in the shape
+        backtesting.analytics.label_outcomes expects. `game_date` restricts to one slate;
+        `latest` keeps each player's most recent game. Players who did not play are omitted.
+        """
+        wanted = [canonical_market(m) for m in markets] if markets is not None else list(MARKET_STATS)
+        unknown = set(wanted) - MARKET_STATS.keys()
+        if unknown:
+            raise ValueError(f"No box-score settlement for markets: {sorted(unknown)}")
+        frame = self.frame(start=game_date, end=game_date)
+        frame = frame[frame["minutes"].notna()]
+        if latest:
+            frame = frame.drop_duplicates("player", keep="last")
+        parts = [
+            pd.DataFrame(
+                {
+                    "player": frame["player"],
+                    "game_date": frame["game_date"],
+                    "market": market,
+                    "actual": frame[list(MARKET_STATS[market])].sum(axis=1, skipna=False),
+                }
+            )
+            for market in dict.fromkeys(wanted)
+        ]
+        if not parts:
+            return pd.DataFrame(columns=["player", "game_date", "market", "actual"])
+        return pd.concat(parts, ignore_index=True).dropna(subset=["actual"])
+
+    def lookup(self, players: Sequence[str], game_dates: Sequence[DateLike], market: str) -> np.ndarray:
+        """
+        Realized `market` value for each (player, game_date) pair, NaN where nothing is
+        stored; one indexed read and one reindex, no per-row queries. Players are matched by
+        player_key; a key two stored players share on a date is ambiguous and comes back NaN.
+        """
+        stats = list(MARKET_STATS[canonical_market(market)])
+        days = pd.to_datetime(pd.Index(game_dates), format="ISO8601").normalize()
+        if not len(days):
+            return np.empty(0, dtype=np.float64)
+        frame = self.frame(start=days.min(), end=days.max(), players=players, stats=stats)
+        values = frame[stats].sum(axis=1, skipna=False).astype("float64")
+        index = pd.MultiIndex.from_arrays([frame["player"].map(player_key), frame["game_date"]])
+        series = pd.Series(values.to_numpy(), index=index)
+        series = series[~index.duplicated(keep=False)]
+        wanted = pd.MultiIndex.from_arrays([pd.Index([player_key(p) for p in players]), days])
+        return series.reindex(wanted).to_numpy(dtype=np.float64, na_value=np.nan)
+
+
+@dataclass
+class IngestSummary:
+    ingested: int = 0
+    skipped: int = 0
+    rows: int = 0
+    failed: list[tuple[GameRef, str]] = field(default_factory=list)
+
+
+def ingest_games(
+    store: OutcomeStore,
+    games: Sequence[GameRef],
+    scrape: Callable[[str], pd.DataFrame],
+    workers: int = 2,
+    force: bool = False,
+    on_game: Optional[Callable[[GameRef, int], None]] = None,
+) -> IngestSummary:
+    """
+    Scrape and store many games concurrently, skipping ones already in the store unless `force`.
+
+    `scrape(url)` runs on `workers` threads (one browser each in the CLI); results are
+    written from the calling thread as they finish, so SQLite sees a single writer and a
+    crash mid-run keeps every game completed so far.
+    """
+    summary = IngestSummary()
+    stored = set() if force else store.stored_games()
+    todo = []
+    for game in dict.fromkeys(games):
+        if game.game_id in stored:
+            summary.skipped += 1
+        else:
+            todo.append(game)
+    if not todo:
+        return summary
+
+    with ThreadPoolExecutor(max_workers=max(1, workers), thread_name_prefix="boxscore") as pool:
+        futures = {pool.submit(scrape, game.url): game for game in todo}
+        for future in as_completed(futures):
+            game = futures[future]
+            try:
+                frame = future.result()
+            except Exception as exc:  # keep bulk runs going; report failures to the caller
+                summary.failed.append((game, f"{type(exc).__name__}: {exc}"))
+                continue
+            if frame.empty:
+                summary.failed.append((game, "no player rows parsed"))
+                continue
+            try:
+                rows = store.ingest(frame, game.game_id, game.game_date, url=game.url)
+            except sqlite3.IntegrityError as exc:  # e.g. two "J. Williams" on one date
+                summary.failed.append((game, f"{type(exc).__name__}: {exc}"))
+                continue
+            summary.ingested += 1
+            summary.rows += rows
+            if on_game is not None:
+                on_game(game, rows)
+    return summary
@@ -0,0 +1,230 @@
+from __future__ import annotations
+
+import json
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Iterable, Optional, Union
+
+import numpy as np
+import pandas as pd
+
+from arbitrage_model.backtesting.schemas import MarketQuote, PredictionInput
+from arbitrage_model.markets import CODEBOOK
+from arbitrage_model.models import BookOffer
+from arbitrage_model.outcomes import MARKET_STATS, STAT_COLUMNS, OutcomeStore, player_key
+
+DEFAULT_WINDOW = 10
+SHORT_WINDOW = 3
+MIN_GAMES = 3
+MAX_COUNT = 200  # support cap for the count distribution
+TREND_CLIP = (0.5, 1.5)  # bounds on the recent/long minutes ratio applied to projections
+FORM_COLUMNS = ["player", "game_date", "market", "games", "mean", "var", "minutes", "recent_minutes"]
+
+
+def _window_sums(
+    values: np.ndarray, starts: np.ndarray, window: int, exclude_current: bool
+) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Trailing sums over each row's last `window` rows within its group, and the row counts.
+    Rows are sorted by group; `starts[i]` is the index of row i's first group row. One
+    cumsum for the whole frame, so the cost does not depend on how many groups there are.
+    """
+    pos = np.arange(values.shape[0])
+    cumulative = np.concatenate(([0.0], np.cumsum(values)))
+    end = pos if exclude_current else pos + 1  # exclusive
+    low = np.maximum(starts, end - window)
+    return cumulative[end] - cumulative[low], end - low
+
+
+def rolling_form(
+    box: pd.DataFrame,
+    markets: Optional[Iterable[str]] = None,
+    window: int = DEFAULT_WINDOW,
+    short_window: int = SHORT_WINDOW,
+    exclude_current: bool = False,
+) -> pd.DataFrame:
+    """
+    Rolling per-player form for every game played, one row per (player, game_date, market).
+
+    Columns: games in the window, mean and sample variance of the market's stat over the
+    last `window` games, mean minutes over the same games, and mean minutes over the last
+    `short_window` games (the minutes trend). With `exclude_current` each row only sees
+    earlier games (pre-game features for backtests); otherwise it includes that game.
+    DNPs are not games. `box` is an OutcomeStore.frame().
+    """
+    markets = list(markets) if markets is not None else list(MARKET_STATS)
+    played = box[box["minutes"].fillna(0) > 0].sort_values(["player", "game_date"], kind="stable", ignore_index=True)
+    if played.empty:
+        return pd.DataFrame(columns=FORM_COLUMNS)
+
+    player = played["player"].to_numpy()
+    first = np.r_[True, player[1:] != player[:-1]]
+    starts = np.maximum.accumulate(np.where(first, np.arange(player.shape[0]), 0))
+    minutes = played["minutes"].to_numpy(dtype=np.float64)
+    minute_sum, games = _window_sums(minutes, starts, window, exclude_current)
+    recent_sum, recent_games = _window_sums(minutes, starts, short_window, exclude_current)
+    with np.errstate(invalid="ignore", divide="ignore"):
+        avg_minutes = minute_sum / games
+        recent_minutes = recent_sum / recent_games
+
+    parts = []
+    for market in dict.fromkeys(markets):
+        stats = played[list(MARKET_STATS[market])].astype("float64").fillna(0.0)
+        values = stats.to_numpy().sum(axis=1)
+        total, _ = _window_sums(values, starts, window, exclude_current)
+        squares, _ = _window_sums(values * values, starts, window, exclude_current)
+        with np.errstate(invalid="ignore", divide="ignore"):
+            mean = total / games
+            var = np.maximum((squares - total * mean) / (games - 1), 0.0)
+        parts.append(
+            pd.DataFrame(
+                {
+                    "player": player,
+                    "game_date": played["game_date"].to_numpy(),
+                    "market": market,
+                    "games": games,
+                    "mean": mean,
+                    "var": var,
+                    "minutes": avg_minutes,
+                    "recent_minutes": recent_minutes,
+                }
+            )
+        )
+    return pd.concat(parts, ignore_index=True)
+
+
+def latest_form(form: pd.DataFrame) -> pd.DataFrame:
+    """Most recent row per (player, market) of a rolling_form frame."""
+    return form.sort_values("game_date", kind="stable").drop_duplicates(["player", "market"], keep="last")
+
+
+def project(form: pd.DataFrame, min_games: int = MIN_GAMES) -> pd.DataFrame:
+    """
+    Add `projection` and `projection_var`: the window mean scaled by the minutes trend
+    (recent / window minutes, clipped to TREND_CLIP), with the variance scaled alike so
+    the dispersion index is kept. Rows with fewer than `min_games` games are dropped.
+    """
+    form = form[form["games"] >= min_games]
+    trend = (form["recent_minutes"] / form["minutes"]).clip(*TREND_CLIP).fillna(1.0)
+    return form.assign(projection=form["mean"] * trend, projection_var=form["var"] * trend)
+
+
+def prob_over(mean: np.ndarray, var: np.ndarray, line: np.ndarray) -> np.ndarray:
+    """
+    P(stat > line) for counting stats: negative binomial with the given mean and variance,
+    Poisson when the sample is not overdispersed. Integer lines are conditioned on no
+    push, since pushes are refunded. Vectorized over rows; the pmf recurrence runs once
+    per count up to the largest line.
+    """
+    mean = np.maximum(np.asarray(mean, dtype=np.float64), 1e-9)
+    var = np.asarray(var, dtype=np.float64)
+    line = np.asarray(line, dtype=np.float64)
+    k_line = np.clip(np.floor(line), -1, MAX_COUNT).astype(np.int64)
+    integer = line == np.floor(line)
+
+    overdispersed = var > mean * (1 + 1e-6)
+    r = np.where(overdispersed, mean * mean / np.maximum(var - mean, 1e-12), 1.0)
+    q = mean / (r + mean)
+    pmf = np.where(overdispersed, np.exp(-r * np.log1p(mean / r)), np.exp(-mean))
+    cdf = np.where(k_line >= 0, pmf, 0.0)
+    push = np.where(integer & (k_line == 0), pmf, 0.0)
+    for k in range(int(k_line.max(initial=0))):
+        pmf = pmf * np.where(overdispersed, (k + r) / (k + 1) * q, mean / (k + 1))  # pmf(k + 1)
+        cdf += np.where(k + 1 <= k_line, pmf, 0.0)
+        push += np.where(integer & (k_line == k + 1), pmf, 0.0)
+    with np.errstate(invalid="ignore", divide="ignore"):
+        return np.clip((1 - cdf) / (1 - push), 0.0, 1.0)
+
+
+def predict_lines(
+    quotes: Iterable[Union[MarketQuote, BookOffer]], form: pd.DataFrame, min_games: int = MIN_GAMES
+) -> pd.DataFrame:
+    """
+    One prediction per distinct quoted (player, market, line) across all books.
+
+    Quote players are matched to form players by player_key; keys that are ambiguous on
+    either side (two form players, or two differently named quoted players, collapsing to
+    one key, e.g. Jalen and Jaylin Williams) are skipped. Columns: player, market, line,
+    prob_over, projection, games.
+    """
+    lines = pd.DataFrame(
+        list(dict.fromkeys((q.player, q.market, q.line) for q in quotes)), columns=["player", "market", "line"]
+    )
+    projected = project(latest_form(form), min_games)
+    keys = {name: player_key(name) for name in set(lines["player"]) | set(projected["player"])}
+    projected = projected.assign(_key=projected["player"].map(keys)).drop_duplicates(["_key", "market"], keep=False)
+    lines = lines.assign(_key=lines["player"].map(keys))
+    quoted_names = lines.groupby("_key")["player"].transform("nunique")
+    merged = lines[quoted_names == 1].merge(
+        projected[["_key", "market", "projection", "projection_var", "games"]], on=["_key", "market"], how="inner"
+    )
+    merged["prob_over"] = prob_over(merged["projection"], merged["projection_var"], merged["line"])
+    return merged[["player", "market", "line", "prob_over", "projection", "games"]]
+
+
+def to_predictions(frame: pd.DataFrame, source: str = "rolling") -> list[PredictionInput]:
+    """PredictionInput batch (codes stamped) from predict_lines output, ready for the simulator."""
+    players, markets = CODEBOOK.players, CODEBOOK.markets
+    return [
+        PredictionInput(
+            player=player,
+            market=market,
+            line=float(line),
+            prob_over=float(prob),
+            source=source,
+            player_code=players.code(player),
+            market_code=markets.code(market),
+        )
+        for player, market, line, prob in frame[["player", "market", "line", "prob_over"]].itertuples(
+            index=False, name=None
+        )
+    ]
+
+
+@dataclass
+class FormState:
+    """
+    Each player's last `window` games played: everything a projection needs, so a daily
+    update reads only newly ingested box scores instead of recomputing from history.
+    """
+
+    games: pd.DataFrame = field(default_factory=lambda: pd.DataFrame(columns=["player", "game_date", *STAT_COLUMNS]))
+    window: int = DEFAULT_WINDOW
+    ingested_at: Optional[str] = None  # store watermark already folded into `games`
+
+    def update(self, store: OutcomeStore) -> int:
+        """Fold in games ingested since the last update; returns how many player rows were read."""
+        watermark = store.last_ingested()  # read first: games landing mid-update are read again next time
+        new = store.frame(ingested_after=self.ingested_at)
+        new = new[new["minutes"].fillna(0) > 0]
+        if not new.empty:
+            games = pd.concat([self.games, new[self.games.columns]], ignore_index=True)
+            games["game_date"] = pd.to_datetime(games["game_date"])
+            games = games.drop_duplicates(["player", "game_date"], keep="last")
+            games = games.sort_values(["player", "game_date"], kind="stable").groupby("player").tail(self.window)
+            self.games = games.reset_index(drop=True)
+        self.ingested_at = watermark or self.ingested_at
+        return len(new)
+
+    def form(self, markets: Optional[Iterable[str]] = None, short_window: int = SHORT_WINDOW) -> pd.DataFrame:
+        return latest_form(rolling_form(self.games, markets, self.window, short_window))
+
+    def save(self, path: Path) -> None:
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        payload = {
+            "window": self.window,
+            "ingested_at": self.ingested_at,
+            "games": json.loads(self.games.to_json(orient="split", index=False, date_format="iso")),
+        }
+        path.write_text(json.dumps(payload), encoding="utf-8")
+
+    @classmethod
+    def load(cls, path: Path) -> FormState:
+        payload = json.loads(Path(path).read_text(encoding="utf-8"))
+        split = payload["games"]
+        games = pd.DataFrame(split["data"], columns=split["columns"])
+        games["game_date"] = pd.to_datetime(games["game_date"]).dt.tz_localize(None)
+        for column in STAT_COLUMNS:
+            games[column] = games[column].astype("float64")
+        return cls(games=games, window=payload["window"], ingested_at=payload["ingested_at"])
@@ -0,0 +1,316 @@
+from __future__ import annotations
+
+import time
+from dataclasses import dataclass
+from datetime import datetime
+from pathlib import Path
+from typing import Callable, Iterable, Optional, Protocol, Sequence
+
+import numpy as np
+
+from arbitrage_model.aggregator import find_two_way_arbs, load_book_quotes
+from arbitrage_model.markets import canonical_market
+from arbitrage_model.models import ArbitrageOpportunity, BookOffer
+from arbitrage_model.vectorized import find_two_way_arbs_vectorized
+
+DATED_PATTERN = "*_props_????-??-??*.csv"
+DEFAULT_PERCENTILES = (50.0, 90.0, 99.0, 99.9)
+
+QuoteKey = tuple[str, str, float]  # (player, market, line)
+
+
+@dataclass(frozen=True)
+class Snapshot:
+    """One book's full board at a capture time."""
+
+    book: str
+    captured_at: datetime
+    quotes: dict[QuoteKey, tuple[int, int]]  # -> (over_odds, under_odds)
+
+
+@dataclass(frozen=True)
+class QuoteEvent:
+    """A single quote change; odds of None mean the book pulled the line."""
+
+    at: float  # seconds since the first snapshot
+    book: str
+    player: str
+    market: str
+    line: float
+    over_odds: Optional[int]
+    under_odds: Optional[int]
+
+    @property
+    def removed(self) -> bool:
+        return self.over_odds is None
+
+
+def load_snapshot_dir(
+    data_dir: Path, pattern: str = DATED_PATTERN, market: Optional[str] = None
+) -> list[Snapshot]:
+    """Read dated snapshot CSVs (`<book>_props_YYYY-MM-DD[THHMM].csv`) in capture order."""
+    from arbitrage_model.backtesting.analytics import parse_snapshot_name
+
+    snapshots = []
+    for csv_file in sorted(Path(data_dir).glob(pattern)):
+        book, captured_at = parse_snapshot_name(csv_file)
+        by_book: dict[str, dict[QuoteKey, tuple[int, int]]] = {}
+        for o in load_book_quotes(csv_file, book=book, market=market):  # multi-book files split per book
+            by_book.setdefault(o.book, {})[(o.player, o.market, o.line)] = (o.over_odds, o.under_odds)
+        stamp = captured_at.to_pydatetime()
+        snapshots.extend(Snapshot(book=name, captured_at=stamp, quotes=quotes) for name, quotes in by_book.items())
+    return sorted(snapshots, key=lambda s: s.captured_at)
+
+
+def load_snapshot_archive(
+    root: Path, books: Sequence[str], market: str = "points", workers: Optional[int] = None
+) -> list[Snapshot]:
+    """Re-parse archived pages (see scrapers.archive) into snapshots; rows without odds are skipped."""
+    import pandas as pd
+
+    from arbitrage_model.backtesting.analytics import canonical_book
+    from arbitrage_model.scrapers.offline import parse_archive
+
+    market = canonical_market(market)
+    snapshots = []
+    for book in books:
+        frame = parse_archive(root, book, workers=workers)
+        frame = frame.dropna(subset=["over", "under"])
+        for captured_at, rows in frame.groupby("captured_at", sort=True):
+            quotes = {
+                (player.strip(), market, float(line)): (int(over), int(under))
+                for player, line, over, under in rows[["players", "line", "over", "under"]].itertuples(
+                    index=False, name=None
+                )
+            }
+            stamp = pd.Timestamp(captured_at).to_pydatetime()
+            snapshots.append(Snapshot(book=canonical_book(book), captured_at=stamp, quotes=quotes))
+    return sorted(snapshots, key=lambda s: s.captured_at)
+
+
+def snapshot_events(snapshots: Sequence[Snapshot]) -> list[QuoteEvent]:
+    """
+    Diff consecutive snapshots of each book into quote-change events.
+
+    A book's first snapshot is one burst of inserts; later snapshots emit only changed,
+    new and pulled lines, all stamped with the capture time (so each capture is a burst).
+    """
+    if not snapshots:
+        return []
+    ordered = sorted(snapshots, key=lambda s: s.captured_at)
+    origin = ordered[0].captured_at
+    previous: dict[str, dict[QuoteKey, tuple[int, int]]] = {}
+    events: list[QuoteEvent] = []
+    for snap in ordered:
+        at = (snap.captured_at - origin).total_seconds()
+        events.extend(diff_quotes(snap.book, previous.get(snap.book, {}), snap.quotes, at))
+        previous[snap.book] = snap.quotes
+    return events
+
+
+def diff_quotes(
+    book: str, before: dict[QuoteKey, tuple[int, int]], after: dict[QuoteKey, tuple[int, int]], at: float
+) -> list[QuoteEvent]:
+    """Events that turn one board of `book` into the next: changed/new lines, then pulled ones."""
+    events = [
+        QuoteEvent(at, book, player, market, line, odds[0], odds[1])
+        for (player, market, line), odds in after.items()
+        if before.get((player, market, line)) != odds
+    ]
+    events.extend(
+        QuoteEvent(at, book, player, market, line, None, None) for player, market, line in before.keys() - after.keys()
+    )
+    return events
+
+
+def bursts(events: Sequence[QuoteEvent]) -> list[list[QuoteEvent]]:
+    """Group consecutive events that share a timestamp."""
+    grouped: list[list[QuoteEvent]] = []
+    for event in events:
+        if grouped and grouped[-1][0].at == event.at:
+            grouped[-1].append(event)
+        else:
+            grouped.append([event])
+    return grouped
+
+
+class Scanner(Protocol):
+    """What the replay engine drives: apply quote changes, keep the current arbitrage set."""
+
+    def apply(self, events: Sequence[QuoteEvent]) -> int:
+        """Apply events and return how many new arbitrage opportunities appeared."""
+
+    @property
+    def opportunities(self) -> list[ArbitrageOpportunity]: ...
+
+
+class _Board:
+    def __init__(self, bankroll: float) -> None:
+        self.bankroll = bankroll
+        self.quotes: dict[QuoteKey, dict[str, BookOffer]] = {}
+        self.arbs: dict[QuoteKey, ArbitrageOpportunity] = {}
+
+    def _update(self, events: Sequence[QuoteEvent]) -> set[QuoteKey]:
+        touched = set()
+        for e in events:
+            key = (e.player, e.market, e.line)
+            books = self.quotes.setdefault(key, {})
+            if e.removed:
+                books.pop(e.book, None)
+                if not books:
+                    del self.quotes[key]
+            else:
+                books[e.book] = BookOffer(e.book, e.player, e.market, e.line, e.over_odds, e.under_odds)
+            touched.add(key)
+        return touched
+
+    @property
+    def opportunities(self) -> list[ArbitrageOpportunity]:
+        return sorted(self.arbs.values(), key=lambda o: o.edge_pct, reverse=True)
+
+
+class IncrementalScanner(_Board):
+    """Rescan only the (player, market, line) groups an update touched."""
+
+    def apply(self, events: Sequence[QuoteEvent]) -> int:
+        appeared = 0
+        for key in self._update(events):
+            offers = self.quotes.get(key)
+            found = find_two_way_arbs(list(offers.values()), self.bankroll) if offers and len(offers) > 1 else []
+            if found:
+                appeared += key not in self.arbs
+                self.arbs[key] = found[0]
+            else:
+                self.arbs.pop(key, None)
+        return appeared
+
+
+class FullRescanScanner(_Board):
+    """Re-encode and rescan the whole board with the vectorized kernel on every update."""
+
+    def apply(self, events: Sequence[QuoteEvent]) -> int:
+        self._update(events)
+        offers = [o for books in self.quotes.values() for o in books.values()]
+        found = find_two_way_arbs_vectorized(offers, self.bankroll)
+        before = self.arbs.keys()
+        self.arbs = {(o.player, o.market, o.line): o for o in found}
+        return len(self.arbs.keys() - before)
+
+
+SCANNERS: dict[str, Callable[[float], Scanner]] = {
+    "incremental": IncrementalScanner,
+    "full": FullRescanScanner,
+}
+
+
+@dataclass(frozen=True)
+class ReplayResult:
+    """Detection latency and throughput for one replay run."""
+
+    events: int
+    bursts: int
+    speed: float
+    scheduled_s: float  # replay span after speed-up and gap compression
+    wall_s: float
+    busy_s: float  # time spent inside the scanner
+    latencies: np.ndarray  # per event, seconds from scheduled arrival to detection
+    arbs_detected: int
+    final_opportunities: int
+
+    @property
+    def throughput(self) -> float:
+        """Events/s the scanner can absorb back to back: the maximum sustainable rate."""
+        return self.events / self.busy_s if self.busy_s > 0 else float("inf")
+
+    @property
+    def offered_rate(self) -> float:
+        return self.events / self.scheduled_s if self.scheduled_s > 0 else float("inf")
+
+    def latency_percentiles(self, percentiles: Sequence[float] = DEFAULT_PERCENTILES) -> dict[float, float]:
+        """Latency percentiles in milliseconds."""
+        if not self.latencies.size:
+            return {q: float("nan") for q in percentiles}
+        return dict(zip(percentiles, (np.percentile(self.latencies, percentiles) * 1000).tolist()))
+
+
+def replay(
+    events: Sequence[QuoteEvent],
+    scanner: Scanner,
+    speed: float = 1.0,
+    max_gap: Optional[float] = None,
+    per_event: bool = False,
+    clock: Callable[[], float] = time.perf_counter,
+    sleep: Callable[[float], None] = time.sleep,
+) -> ReplayResult:
+    """
+    Play events through a scanner and time detection.
+
+    Bursts are released on an open-loop schedule: capture times divided by `speed`, with
+    idle gaps capped at `max_gap` seconds (before speed-up) so day-apart snapshots do not
+    stall the run. Latency runs from an event's scheduled arrival to the moment the scanner
+    has processed it, so falling behind shows up as queueing delay rather than being hidden.
+    `speed <= 0` releases each burst as soon as the previous one is done (latency is then
+    pure service time and the run measures maximum throughput). With `per_event` the
+    scanner gets one event at a time instead of whole bursts.
+    """
+    groups = bursts(events)
+    latencies = np.empty(len(events), dtype=np.float64)
+    busy = 0.0
+    detected = 0
+    done = 0
+    offset = 0.0
+    previous_at = groups[0][0].at if groups else 0.0
+    start = clock()
+    for burst in groups:
+        gap = burst[0].at - previous_at
+        previous_at = burst[0].at
+        if speed > 0:
+            offset += (min(gap, max_gap) if max_gap is not None else gap) / speed
+            arrival = start + offset
+            ahead = arrival - clock()
+            if ahead > 0:
+                sleep(ahead)
+        else:
+            arrival = clock()
+        began = clock()
+        if per_event:
+            for event in burst:
+                detected += scanner.apply((event,))
+                latencies[done] = clock() - arrival
+                done += 1
+        else:
+            detected += scanner.apply(burst)
+            latencies[done : done + len(burst)] = clock() - arrival
+            done += len(burst)
+        busy += clock() - began
+    return ReplayResult(
+        events=len(events),
+        bursts=len(groups),
+        speed=speed,
+        scheduled_s=offset,
+        wall_s=clock() - start,
+        busy_s=busy,
+        latencies=latencies,
+        arbs_detected=detected,
+        final_opportunities=len(scanner.opportunities),
+    )
+
+
+def format_replay(results: Iterable[tuple[str, ReplayResult]]) -> list[dict]:
+    """Display rows for labelled replay results."""
+    rows = []
+    for label, r in results:
+        pct = r.latency_percentiles()
+        rows.append(
+            {
+                "run": label,
+                "events": r.events,
+                "bursts": r.bursts,
+                "offered_eps": None if r.offered_rate == float("inf") else round(r.offered_rate, 1),
+                "max_eps": round(r.throughput, 1),
+                **{f"p{q:g}_ms": round(v, 3) for q, v in pct.items()},
+                "max_ms": round(float(r.latencies.max()) * 1000, 3) if r.latencies.size else None,
+                "arbs_detected": r.arbs_detected,
+            }
+        )
+    return rows
@@ -0,0 +1,287 @@
+from __future__ import annotations
+
+import logging
+import math
+import time
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from typing import TYPE_CHECKING, Callable, Iterable, Optional, Sequence
+
+if TYPE_CHECKING:
+    import pandas as pd
+
+SnapshotCallback = Callable[[str, "pd.DataFrame", datetime], None]
+
+_log = logging.getLogger(__name__)
+
+
+@dataclass
+class PollTarget:
+    """A book (or book+market page) to poll; `scrape` returns the normalized quote frame."""
+
+    book: str
+    scrape: Callable[[], "pd.DataFrame"]
+    tipoff: Optional[datetime] = None  # start time of the earliest game on the page
+    min_interval: float = 10.0
+    max_interval: float = 900.0
+
+
+@dataclass
+class BookState:
+    """Per-book polling statistics the scheduler adapts on."""
+
+    interval: float
+    next_due: float
+    change_rate: float = 0.0  # estimated board changes per second
+    observed_changes: float = 0.0  # exponentially decayed count of polls that saw a change
+    exposure: float = 0.0  # exponentially decayed seconds covered by those polls
+    last_poll: Optional[float] = None
+    last_success: Optional[float] = None
+    last_change: Optional[float] = None
+    last_signature: Optional[frozenset] = None
+    polls: int = 0
+    changes: int = 0
+    failures: int = 0
+    consecutive_failures: int = 0
+    last_error: Optional[str] = None
+    last_duration: float = 0.0
+    in_flight: bool = False
+
+
+@dataclass(frozen=True)
+class Freshness:
+    """How current a book's data is right now."""
+
+    book: str
+    age_s: Optional[float]  # time since the last successful scrape
+    since_change_s: Optional[float]  # time since a scrape last observed a change
+    interval_s: float
+    next_due_in_s: float
+    changes_per_min: float
+    polls: int
+    failures: int
+    last_error: Optional[str] = None
+
+
+@dataclass
+class AdaptiveScheduler:
+    """
+    Poll books at rates matched to how fast their boards move, within a fixed budget.
+
+    Each book's change rate is estimated from successive snapshots as (changes seen) /
+    (seconds observed), both exponentially decayed with `rate_halflife` and seeded with a
+    prior so a single poll never dominates. Minimizing average staleness for a fixed total
+    poll rate gives poll frequencies proportional to sqrt(change rate), so the global
+    `polls_per_minute` budget is split that way, boosted near tip-off and clamped to each
+    target's [min_interval, max_interval]. Failing books back off exponentially, whether the
+    scrape or the `on_snapshot` callback failed. At most
+    `max_concurrency` scrapes (browsers) run at once: the poll threads are created once and
+    reused by every `run()` call, so per-thread browsers are not re-created between calls.
+    Call `close()` (or use as a context manager) to stop them.
+    """
+
+    targets: Sequence[PollTarget]
+    polls_per_minute: float = 12.0
+    max_concurrency: int = 1
+    rate_halflife: float = 900.0
+    prior_seconds: float = 120.0
+    tipoff_window: float = 3600.0  # seconds before tip-off when polling ramps up
+    tipoff_boost: float = 4.0
+    prior_changes_per_min: float = 0.2
+    on_snapshot: Optional[SnapshotCallback] = None
+    clock: Callable[[], float] = time.monotonic
+    now: Callable[[], datetime] = lambda: datetime.now(timezone.utc)
+    states: dict[str, BookState] = field(init=False)
+    _pool: Optional[ThreadPoolExecutor] = field(init=False, default=None, repr=False)
+
+    def __post_init__(self) -> None:
+        if len({t.book for t in self.targets}) != len(self.targets):
+            raise ValueError("PollTarget.book values must be unique")
+        start = self.clock()
+        prior = self.prior_changes_per_min / 60
+        self.states = {
+            t.book: BookState(interval=t.min_interval, next_due=start, change_rate=prior) for t in self.targets
+        }
+        self._by_book = {t.book: t for t in self.targets}
+        self._rebalance()
+
+    def __enter__(self) -> AdaptiveScheduler:
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    def close(self) -> None:
+        if self._pool is not None:
+            self._pool.shutdown()
+            self._pool = None
+
+    def run(self, duration: Optional[float] = None, max_polls: Optional[int] = None) -> None:
+        """Poll until `duration` seconds pass or `max_polls` scrapes complete (forever if neither)."""
+        deadline = None if duration is None else self.clock() + duration
+        completed = 0
+        if self._pool is None:
+            self._pool = ThreadPoolExecutor(max_workers=self.max_concurrency, thread_name_prefix="poll")
+        pool = self._pool
+        running: dict[Future, str] = {}
+        while True:
+            now = self.clock()
+            stopping = (deadline is not None and now >= deadline) or (
+                max_polls is not None and completed + len(running) >= max_polls
+            )
+            if not stopping:
+                for book in self._due(now, self.max_concurrency - len(running)):
+                    state = self.states[book]
+                    state.in_flight = True
+                    state.last_poll = now
+                    running[pool.submit(self._poll, book)] = book
+            if not running:
+                if stopping:
+                    return
+                next_due = min(s.next_due for s in self.states.values())
+                limit = next_due if deadline is None else min(next_due, deadline)
+                time.sleep(max(limit - self.clock(), 0.0))
+                continue
+            saturated = len(running) >= self.max_concurrency
+            timeout = None if stopping or saturated else max(self._next_wakeup(now) - now, 0.0)
+            done, _ = wait(list(running), timeout=timeout, return_when=FIRST_COMPLETED)
+            for future in done:
+                self._record(running.pop(future), future)
+                completed += 1
+
+    def poll_once(self, book: str) -> None:
+        """Scrape one book synchronously and update its statistics (useful for tests/cron)."""
+        state = self.states[book]
+        state.last_poll = self.clock()
+        future: Future = Future()
+        try:
+            future.set_result(self._poll(book))
+        except Exception as exc:
+            future.set_exception(exc)
+        self._record(book, future)
+
+    def freshness(self) -> list[Freshness]:
+        """Snapshot of per-book data age and polling cadence, stalest first."""
+        now = self.clock()
+        report = [
+            Freshness(
+                book=book,
+                age_s=None if s.last_success is None else now - s.last_success,
+                since_change_s=None if s.last_change is None else now - s.last_change,
+                interval_s=s.interval,
+                next_due_in_s=max(s.next_due - now, 0.0),
+                changes_per_min=s.change_rate * 60,
+                polls=s.polls,
+                failures=s.failures,
+                last_error=s.last_error,
+            )
+            for book, s in self.states.items()
+        ]
+        return sorted(report, key=lambda f: -math.inf if f.age_s is None else -f.age_s)
+
+    def _due(self, now: float, slots: int) -> list[str]:
+        due = [b for b, s in self.states.items() if not s.in_flight and s.next_due <= now]
+        return sorted(due, key=lambda b: self.states[b].next_due)[: max(slots, 0)]
+
+    def _next_wakeup(self, now: float) -> float:
+        idle = [s.next_due for s in self.states.values() if not s.in_flight]
+        return min(idle) if idle else now + 3600.0
+
+    def _poll(self, book: str) -> tuple["pd.DataFrame", float, float]:
+        start = self.clock()
+        frame = self._by_book[book].scrape()
+        return frame, start, self.clock()
+
+    def _record(self, book: str, future: Future) -> None:
+        state = self.states[book]
+        state.in_flight = False
+        state.polls += 1
+        try:
+            frame, start, end = future.result()
+        except Exception as exc:
+            self._fail(state, exc)
+            return
+
+        state.last_duration = end - start
+        signature = _signature(frame)
+        if state.last_signature is not None and state.last_success is not None:
+            elapsed = max(end - state.last_success, 1e-6)
+            changed = signature != state.last_signature
+            decay = 0.5 ** (elapsed / self.rate_halflife)
+            state.observed_changes = state.observed_changes * decay + (1.0 if changed else 0.0)
+            state.exposure = state.exposure * decay + elapsed
+            prior_changes = self.prior_changes_per_min / 60 * self.prior_seconds
+            state.change_rate = (state.observed_changes + prior_changes) / (state.exposure + self.prior_seconds)
+            if changed:
+                state.changes += 1
+                state.last_change = end
+        elif state.last_signature is None:
+            state.last_change = end
+        state.last_signature = signature
+        state.last_success = end
+        if self.on_snapshot is not None:
+            try:
+                self.on_snapshot(book, frame, self.now())
+            except Exception as exc:  # one book's bad board must not stop polling the others
+                _log.warning("on_snapshot failed for %s", book, exc_info=True)
+                self._fail(state, exc)
+                return
+        state.consecutive_failures = 0
+        state.last_error = None
+        self._rebalance()
+
+    def _fail(self, state: BookState, exc: Exception) -> None:
+        state.failures += 1
+        state.consecutive_failures += 1
+        state.last_error = f"{type(exc).__name__}: {exc}"
+        self._rebalance()
+
+    def _rebalance(self) -> None:
+        """Split the poll budget across books in proportion to sqrt(effective change rate)."""
+        weights = {book: math.sqrt(self._effective_rate(book)) for book in self.states}
+        total = sum(weights.values()) or 1.0
+        budget = self.polls_per_minute / 60
+        for book, state in self.states.items():
+            target = self._by_book[book]
+            frequency = budget * weights[book] / total
+            interval = 1 / frequency if frequency > 0 else target.max_interval
+            interval *= 2 ** min(state.consecutive_failures, 10)
+            state.interval = min(max(interval, target.min_interval), target.max_interval)
+            if state.last_poll is not None and not state.in_flight:
+                state.next_due = state.last_poll + state.interval
+
+    def _effective_rate(self, book: str) -> float:
+        rate = max(self.states[book].change_rate, 1e-6)
+        tipoff = self._by_book[book].tipoff
+        if tipoff is None:
+            return rate
+        until = (tipoff - self.now()).total_seconds()
+        if until < 0:
+            return 1e-6  # game started; props are off the board
+        if until <= self.tipoff_window:
+            # Ramp linearly from 1x at the window edge to `tipoff_boost` at tip-off.
+            return rate * (1 + (self.tipoff_boost - 1) * (1 - until / self.tipoff_window))
+        return rate
+
+
+def _signature(frame: "pd.DataFrame") -> frozenset:
+    columns = [c for c in ("players", "line", "over", "under") if c in frame.columns]
+    return frozenset(frame[columns].itertuples(index=False, name=None)) if columns else frozenset()
+
+
+def format_freshness(report: Iterable[Freshness]) -> list[dict]:
+    """Display rows for a freshness report."""
+    return [
+        {
+            "book": f.book,
+            "age_s": None if f.age_s is None else round(f.age_s, 1),
+            "since_change_s": None if f.since_change_s is None else round(f.since_change_s, 1),
+            "interval_s": round(f.interval_s, 1),
+            "next_due_in_s": round(f.next_due_in_s, 1),
+            "changes_per_min": round(f.changes_per_min, 3),
+            "polls": f.polls,
+            "failures": f.failures,
+        }
+        for f in report
+    ]
@@ -0,0 +1,212 @@
+from __future__ import annotations
+
+import gzip
+import hashlib
+import json
+import queue
+import threading
+from dataclasses import asdict, dataclass
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import BinaryIO, Iterator, Optional
+
+INDEX_NAME = "index.jsonl"
+_STOP = object()
+
+
+@dataclass(frozen=True)
+class ArchiveEntry:
+    """Index record mapping one capture (book, timestamp) to a compressed blob in a bundle."""
+
+    book: str
+    captured_at: str  # ISO-8601 UTC
+    sha256: str
+    bundle: str  # path relative to the archive root
+    offset: int
+    length: int
+    codec: str
+    raw_bytes: int
+    url: Optional[str] = None
+    deduplicated: bool = False
+
+
+def _zstd():
+    try:
+        import zstandard
+    except ImportError:  # optional dependency; gzip is always available
+        return None
+    return zstandard
+
+
+def _compress(data: bytes, codec: str) -> bytes:
+    if codec == "zstd":
+        return _zstd().ZstdCompressor(level=10).compress(data)
+    return gzip.compress(data, compresslevel=6)
+
+
+def _decompress(data: bytes, codec: str) -> bytes:
+    if codec == "zstd":
+        zstd = _zstd()
+        if zstd is None:
+            raise RuntimeError("Archive entry is zstd-compressed; install `zstandard` to read it")
+        return zstd.ZstdDecompressor().decompress(data)
+    return gzip.decompress(data)
+
+
+class SnapshotArchiver:
+    """
+    Archive raw page source captured during scraping.
+
+    `submit()` only enqueues the page; hashing, compression and disk writes happen on a
+    background thread so scrape latency does not grow with archive size. Identical pages
+    (by SHA-256) are stored once: repeat captures get an index row pointing at the existing
+    blob. Blobs are independent compressed frames appended to time-bucketed bundles
+    (`<root>/<book>/<bucket>.<codec>`), and `index.jsonl` maps (book, captured_at) to
+    (bundle, offset, length).
+
+    Use as a context manager (or call `close()`) so queued pages are flushed.
+    """
+
+    def __init__(
+        self,
+        root: Path,
+        codec: Optional[str] = None,
+        bucket_minutes: int = 60,
+        max_pending: int = 64,
+    ) -> None:
+        if codec is None:
+            codec = "zstd" if _zstd() is not None else "gzip"
+        if codec not in {"gzip", "zstd"}:
+            raise ValueError(f"Unsupported codec {codec!r}; expected 'gzip' or 'zstd'")
+        if codec == "zstd" and _zstd() is None:
+            raise RuntimeError("codec='zstd' requires the optional `zstandard` package")
+        self.root = Path(root)
+        self.codec = codec
+        self.bucket_minutes = bucket_minutes
+        self.root.mkdir(parents=True, exist_ok=True)
+        self._known: dict[str, ArchiveEntry] = {e.sha256: e for e in iter_index(self.root) if not e.deduplicated}
+        self._queue: queue.Queue = queue.Queue(maxsize=max_pending)
+        self._bundles: dict[Path, BinaryIO] = {}
+        self._index = open(self.root / INDEX_NAME, "a", encoding="utf-8")
+        self._error: Optional[BaseException] = None
+        self._thread = threading.Thread(target=self._run, name="snapshot-archiver", daemon=True)
+        self._thread.start()
+
+    def __enter__(self) -> "SnapshotArchiver":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    def submit(
+        self, book: str, page_source: str, captured_at: Optional[datetime] = None, url: Optional[str] = None
+    ) -> None:
+        """Queue a page for archiving (blocks only if `max_pending` pages are already waiting)."""
+        if self._error is not None:
+            raise RuntimeError("Snapshot archiver failed") from self._error
+        self._queue.put((book, page_source, captured_at or datetime.now(timezone.utc), url))
+
+    def close(self) -> None:
+        if self._thread.is_alive():
+            self._queue.put(_STOP)
+            self._thread.join()
+        for fh in self._bundles.values():
+            fh.close()
+        self._bundles.clear()
+        if not self._index.closed:
+            self._index.close()
+        if self._error is not None:
+            raise RuntimeError("Snapshot archiver failed") from self._error
+
+    def _run(self) -> None:
+        while True:
+            item = self._queue.get()
+            if item is _STOP:
+                return
+            try:
+                self._write(*item)
+            except BaseException as exc:  # surface on the next submit()/close()
+                self._error = exc
+                return
+
+    def _write(self, book: str, page_source: str, captured_at: datetime, url: Optional[str]) -> None:
+        raw = page_source.encode("utf-8")
+        digest = hashlib.sha256(raw).hexdigest()
+        captured = captured_at.astimezone(timezone.utc)
+        existing = self._known.get(digest)
+        if existing is not None:
+            entry = ArchiveEntry(
+                book=book,
+                captured_at=captured.isoformat(),
+                sha256=digest,
+                bundle=existing.bundle,
+                offset=existing.offset,
+                length=existing.length,
+                codec=existing.codec,
+                raw_bytes=existing.raw_bytes,
+                url=url,
+                deduplicated=True,
+            )
+        else:
+            blob = _compress(raw, self.codec)
+            bundle = self._bundle_path(book, captured)
+            fh = self._bundle_handle(bundle)
+            offset = fh.seek(0, 2)
+            fh.write(blob)
+            fh.flush()
+            entry = ArchiveEntry(
+                book=book,
+                captured_at=captured.isoformat(),
+                sha256=digest,
+                bundle=bundle.relative_to(self.root).as_posix(),
+                offset=offset,
+                length=len(blob),
+                codec=self.codec,
+                raw_bytes=len(raw),
+                url=url,
+            )
+            self._known[digest] = entry
+        self._index.write(json.dumps(asdict(entry)) + "\n")
+        self._index.flush()
+
+    def _bundle_path(self, book: str, captured: datetime) -> Path:
+        minute = (captured.hour * 60 + captured.minute) // self.bucket_minutes * self.bucket_minutes
+        bucket = f"{captured:%Y-%m-%d}T{minute // 60:02d}{minute % 60:02d}"
+        suffix = "zst" if self.codec == "zstd" else "gz"
+        return self.root / _slug(book) / f"{bucket}.{suffix}"
+
+    def _bundle_handle(self, bundle: Path) -> BinaryIO:
+        fh = self._bundles.get(bundle)
+        if fh is None:
+            # Only the current bucket per book stays open.
+            for stale in [p for p in self._bundles if p.parent == bundle.parent]:
+                self._bundles.pop(stale).close()
+            bundle.parent.mkdir(parents=True, exist_ok=True)
+            fh = self._bundles[bundle] = open(bundle, "ab")
+        return fh
+
+
+def _slug(book: str) -> str:
+    return "".join(ch if ch.isalnum() else "_" for ch in book.strip().lower()) or "unknown"
+
+
+def iter_index(root: Path, book: Optional[str] = None) -> Iterator[ArchiveEntry]:
+    """Yield index entries (optionally for one book) in capture order as written."""
+    path = Path(root) / INDEX_NAME
+    if not path.exists():
+        return
+    with open(path, encoding="utf-8") as fh:
+        for line in fh:
+            if not line.strip():
+                continue
+            entry = ArchiveEntry(**json.loads(line))
+            if book is None or entry.book == book:
+                yield entry
+
+
+def load_snapshot(root: Path, entry: ArchiveEntry) -> str:
+    """Read and decompress the page source referenced by an index entry."""
+    with open(Path(root) / entry.bundle, "rb") as fh:
+        fh.seek(entry.offset)
+        blob = fh.read(entry.length)
+    return _decompress(blob, entry.codec).decode("utf-8")
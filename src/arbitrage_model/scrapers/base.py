@@ -1,12 +1,86 @@
 from __future__ import annotations
 
 import os
+import time
+import weakref
 from contextlib import contextmanager
-from typing import Iterator
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Iterable, Iterator, Mapping, Optional
 
-from selenium import webdriver
-from selenium.webdriver.chrome.options import Options
-from selenium.webdriver.chrome.service import Service
+if TYPE_CHECKING:  # Selenium is imported where a browser is driven, so parsing works without it
+    from selenium import webdriver
+    from selenium.webdriver.remote.webdriver import WebDriver
+
+
+# Resource types are blocked by URL pattern: `Network.setBlockedURLs` works through plain
+# `execute_cdp_cmd`, whereas type-based interception (`Fetch.requestPaused`) needs an event loop.
+RESOURCE_PATTERNS: dict[str, tuple[str, ...]] = {
+    "image": ("*.png*", "*.jpg*", "*.jpeg*", "*.gif*", "*.webp*", "*.avif*", "*.svg*", "*.ico*"),
+    "font": ("*.woff*", "*.woff2*", "*.ttf*", "*.otf*", "*.eot*"),
+    "media": ("*.mp4*", "*.webm*", "*.m3u8*", "*.mp3*"),
+    "stylesheet": ("*.css*",),
+}
+
+TRACKER_PATTERNS: tuple[str, ...] = (
+    "*doubleclick.net*",
+    "*googlesyndication.com*",
+    "*google-analytics.com*",
+    "*googletagmanager.com*",
+    "*connect.facebook.net*",
+    "*hotjar.com*",
+    "*segment.io*",
+    "*optimizely.com*",
+    "*nr-data.net*",
+    "*adsrvr.org*",
+    "*amazon-adsystem.com*",
+    "*scorecardresearch.com*",
+    "*taboola.com*",
+    "*outbrain.com*",
+)
+
+
+@dataclass(frozen=True)
+class BlockProfile:
+    """
+    Requests a book's pages can do without.
+
+    `resource_types` are keys of RESOURCE_PATTERNS; `url_patterns` are extra CDP wildcard
+    patterns (ad/tracker hosts, heavy widgets). Stylesheets are left alone by default since
+    Selenium's `.text` only returns text CSS leaves visible.
+    """
+
+    resource_types: tuple[str, ...] = ("image", "font", "media")
+    url_patterns: tuple[str, ...] = TRACKER_PATTERNS
+
+    def patterns(self) -> list[str]:
+        unknown = set(self.resource_types) - set(RESOURCE_PATTERNS)
+        if unknown:
+            raise ValueError(f"Unknown resource types {sorted(unknown)}; expected {sorted(RESOURCE_PATTERNS)}")
+        blocked = [p for kind in self.resource_types for p in RESOURCE_PATTERNS[kind]]
+        return list(dict.fromkeys([*blocked, *self.url_patterns]))
+
+
+DEFAULT_BLOCKING = BlockProfile()
+
+
+@dataclass(frozen=True)
+class PageTiming:
+    """Where the time went loading one page: navigation, then waiting for the board to settle."""
+
+    book: str
+    url: str
+    navigation_s: float  # driver.get() until the page load strategy's event fired
+    ready_s: float  # until the element count stopped changing
+    elements: int
+    stable: bool  # False if wait_time ran out while the count was still changing
+    blocked_patterns: int
+
+    @property
+    def total_s(self) -> float:
+        return self.navigation_s + self.ready_s
+
+
+_applied_blocking: "weakref.WeakKeyDictionary[WebDriver, tuple[str, ...]]" = weakref.WeakKeyDictionary()
 
 
 def _resolve_driver_path() -> str | None:
@@ -14,29 +88,150 @@ def _resolve_driver_path() -> str | None:
     return os.environ.get("CHROMEDRIVER")
 
 
-def build_chrome(headless: bool = True) -> webdriver.Chrome:
+def build_chrome(
+    headless: bool = True,
+    page_load_strategy: str = "eager",
+    blocking: Optional[BlockProfile] = None,
+) -> webdriver.Chrome:
     """
     Create a Chrome driver with sensible defaults.
 
     Notes:
     - Requires CHROMEDRIVER env var pointing to chromedriver binary, or chromedriver on PATH.
     - Headless by default; set headless=False for interactive debugging.
+    - `page_load_strategy="eager"` returns from `get()` at DOMContentLoaded; scrapers then
+      wait for their board to render (`wait_for_stable_count`) rather than for every asset.
+    - `blocking` applies a BlockProfile up front; scrapers switch profiles per book with
+      `apply_blocking`.
     """
+    from selenium import webdriver
+    from selenium.webdriver.chrome.options import Options
+    from selenium.webdriver.chrome.service import Service
+
     options = Options()
     if headless:
         options.add_argument("--headless=new")
     options.add_argument("--disable-gpu")
     options.add_argument("--no-sandbox")
     options.add_argument("--disable-dev-shm-usage")
+    options.page_load_strategy = page_load_strategy
     driver_path = _resolve_driver_path()
     service = Service(executable_path=driver_path) if driver_path else Service()
-    return webdriver.Chrome(service=service, options=options)
+    driver = webdriver.Chrome(service=service, options=options)
+    if blocking is not None:
+        apply_blocking(driver, blocking)
+    return driver
 
 
 @contextmanager
-def chrome_driver(headless: bool = True) -> Iterator[webdriver.Chrome]:
-    driver = build_chrome(headless=headless)
+def chrome_driver(
+    headless: bool = True, page_load_strategy: str = "eager", blocking: Optional[BlockProfile] = None
+) -> Iterator[webdriver.Chrome]:
+    driver = build_chrome(headless=headless, page_load_strategy=page_load_strategy, blocking=blocking)
     try:
         yield driver
     finally:
         driver.quit()
+
+
+def collect_fields(driver: WebDriver, locators: Mapping[str, tuple[str, str]]) -> dict[str, list[str]]:
+    """
+    Collect element texts for each named (by, value) locator on the live page.
+
+    Empty texts are kept so positional layouts (e.g. box-score cells) line up; the per-book
+    `parse_*` functions drop them where appropriate, exactly as they do for offline HTML.
+    """
+    return {name: [el.text for el in driver.find_elements(*locator)] for name, locator in locators.items()}
+
+
+def apply_blocking(driver: WebDriver, blocking: Optional[BlockProfile]) -> int:
+    """
+    Block a profile's URL patterns for subsequent loads via the Chrome DevTools Protocol.
+
+    Passing None clears any earlier profile. Repeat calls with the same profile are free, so
+    one driver can hop between books. Returns the number of patterns in effect (0 when the
+    driver has no CDP support).
+    """
+    if not hasattr(driver, "execute_cdp_cmd"):
+        return 0
+    patterns = tuple(blocking.patterns()) if blocking is not None else ()
+    if _applied_blocking.get(driver, ()) != patterns:
+        driver.execute_cdp_cmd("Network.enable", {})
+        driver.execute_cdp_cmd("Network.setBlockedURLs", {"urls": list(patterns)})
+        _applied_blocking[driver] = patterns
+    return len(patterns)
+
+
+def wait_for_stable_count(
+    driver: WebDriver,
+    locator: tuple[str, str],
+    timeout: float,
+    settle: float = 0.75,
+    poll: float = 0.1,
+) -> tuple[int, bool]:
+    """
+    Wait until `locator` matches at least one element and the count has not changed for
+    `settle` seconds.
+
+    Boards render in batches, so presence of the first row says little about completeness,
+    while a fixed sleep wastes time on fast loads. Returns (count, stable); if `timeout`
+    expires with rows present but still changing, returns what is there with stable=False.
+    Raises TimeoutException if nothing matched at all.
+    """
+    from selenium.common.exceptions import TimeoutException
+
+    deadline = time.monotonic() + timeout
+    count, changed_at = -1, time.monotonic()
+    while True:
+        current = len(driver.find_elements(*locator))
+        now = time.monotonic()
+        if current != count:
+            count, changed_at = current, now
+        elif count > 0 and now - changed_at >= settle:
+            return count, True
+        if now >= deadline:
+            if count > 0:
+                return count, False
+            raise TimeoutException(f"No elements matched {locator} within {timeout:.1f}s")
+        time.sleep(min(poll, max(deadline - now, 0.0)))
+
+
+def load_page(
+    driver: WebDriver,
+    book: str,
+    url: str,
+    ready: tuple[str, str],
+    wait_time: float,
+    blocking: Optional[BlockProfile] = None,
+) -> PageTiming:
+    """Apply the book's blocking profile, navigate, and wait for the `ready` locator to settle."""
+    blocked = apply_blocking(driver, blocking)
+    start = time.perf_counter()
+    driver.get(url)
+    loaded = time.perf_counter()
+    elements, stable = wait_for_stable_count(driver, ready, timeout=wait_time)
+    return PageTiming(
+        book=book,
+        url=url,
+        navigation_s=loaded - start,
+        ready_s=time.perf_counter() - loaded,
+        elements=elements,
+        stable=stable,
+        blocked_patterns=blocked,
+    )
+
+
+def format_timings(timings: Iterable[PageTiming]) -> list[dict]:
+    """Display rows for page-load timings."""
+    return [
+        {
+            "book": t.book,
+            "navigation_s": round(t.navigation_s, 2),
+            "ready_s": round(t.ready_s, 2),
+            "total_s": round(t.total_s, 2),
+            "elements": t.elements,
+            "stable": t.stable,
+            "blocked_patterns": t.blocked_patterns,
+        }
+        for t in timings
+    ]
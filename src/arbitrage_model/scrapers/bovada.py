@@ -1,29 +1,51 @@
 from __future__ import annotations
 
+from typing import TYPE_CHECKING, Optional
+
 import pandas as pd
-from selenium.webdriver.common.by import By
-from selenium.webdriver.support import expected_conditions as EC
-from selenium.webdriver.support.ui import WebDriverWait
-from selenium.webdriver.remote.webdriver import WebDriver
 
 from arbitrage_model.odds import normalize_american_odds
+from arbitrage_model.scrapers.archive import SnapshotArchiver
+from arbitrage_model.scrapers.base import DEFAULT_BLOCKING, collect_fields, load_page
+from arbitrage_model.scrapers.selectors import CLASS_NAME
+
+if TYPE_CHECKING:
+    from selenium.webdriver.remote.webdriver import WebDriver
+
+LOCATORS = {
+    "names": (CLASS_NAME, "over-under-block__title"),
+    "lines": (CLASS_NAME, "over-under-block__over-under"),
+    "prices": (CLASS_NAME, "bet-price"),
+}
 
 
-def scrape_bovada(driver: WebDriver, url: str, wait_time: int = 12) -> pd.DataFrame:
+def scrape_bovada(
+    driver: WebDriver,
+    url: str,
+    wait_time: int = 12,
+    archiver: Optional[SnapshotArchiver] = None,
+    block_resources: bool = True,
+) -> pd.DataFrame:
     """
     Scrape Bovada player props into a normalized DataFrame.
 
     Bovada's DOM is volatile; selectors below target over/under blocks and price cells.
     Verify selectors when running in your region/environment.
     """
-    driver.get(url)
-    wait = WebDriverWait(driver, wait_time)
+    blocking = DEFAULT_BLOCKING if block_resources else None
+    timing = load_page(driver, "bovada", url, LOCATORS["names"], wait_time, blocking=blocking)
+    if archiver is not None:
+        archiver.submit("bovada", driver.page_source, url=url)
+    df = parse_bovada(collect_fields(driver, LOCATORS))
+    df.attrs["timing"] = timing
+    return df
 
-    wait.until(EC.presence_of_all_elements_located((By.CLASS_NAME, "over-under-block__title")))
 
-    names = [el.text for el in driver.find_elements(By.CLASS_NAME, "over-under-block__title") if el.text]
-    lines = [el.text for el in driver.find_elements(By.CLASS_NAME, "over-under-block__over-under") if el.text]
-    price_cells = [el.text for el in driver.find_elements(By.CLASS_NAME, "bet-price") if el.text]
+def parse_bovada(fields: dict[str, list[str]]) -> pd.DataFrame:
+    """Build the normalized frame from element texts (live page or saved HTML)."""
+    names = [t for t in fields["names"] if t]
+    lines = [t for t in fields["lines"] if t]
+    price_cells = [t for t in fields["prices"] if t]
 
     overs, unders = _split_odds(price_cells)
 
@@ -1,17 +1,31 @@
 from __future__ import annotations
 
-from typing import Optional
+from typing import TYPE_CHECKING, Optional
 
 import pandas as pd
-from selenium.webdriver.common.by import By
-from selenium.webdriver.support import expected_conditions as EC
-from selenium.webdriver.support.ui import WebDriverWait
-from selenium.webdriver.remote.webdriver import WebDriver
 
 from arbitrage_model.odds import normalize_american_odds
+from arbitrage_model.scrapers.archive import SnapshotArchiver
+from arbitrage_model.scrapers.base import DEFAULT_BLOCKING, collect_fields, load_page
+from arbitrage_model.scrapers.selectors import CLASS_NAME
 
+if TYPE_CHECKING:
+    from selenium.webdriver.remote.webdriver import WebDriver
 
-def scrape_draftkings(driver: WebDriver, url: str, wait_time: int = 12) -> pd.DataFrame:
+LOCATORS = {
+    "names": (CLASS_NAME, "sportsbook-row-name"),
+    "lines": (CLASS_NAME, "sportsbook-outcome-cell__line"),
+    "odds": (CLASS_NAME, "sportsbook-outcome-cell__element"),
+}
+
+
+def scrape_draftkings(
+    driver: WebDriver,
+    url: str,
+    wait_time: int = 12,
+    archiver: Optional[SnapshotArchiver] = None,
+    block_resources: bool = True,
+) -> pd.DataFrame:
     """
     Scrape DraftKings NBA player props (over/under) into a DataFrame with
     columns: players, line, over, under.
@@ -19,17 +33,23 @@ def scrape_draftkings(driver: WebDriver, url: str, wait_time: int = 12) -> pd.Da
     The selectors are anchored on current DraftKings class names and may need
     refresh if the site changes; runs with explicit waits to reduce flakiness.
     """
-    driver.get(url)
-    wait = WebDriverWait(driver, wait_time)
+    blocking = DEFAULT_BLOCKING if block_resources else None
+    timing = load_page(driver, "draftkings", url, LOCATORS["names"], wait_time, blocking=blocking)
+    if archiver is not None:
+        archiver.submit("draftkings", driver.page_source, url=url)
+    df = parse_draftkings(collect_fields(driver, LOCATORS))
+    df.attrs["timing"] = timing
+    return df
 
-    wait.until(EC.presence_of_all_elements_located((By.CLASS_NAME, "sportsbook-row-name")))
 
-    names = [el.text for el in driver.find_elements(By.CLASS_NAME, "sportsbook-row-name") if el.text]
+def parse_draftkings(fields: dict[str, list[str]]) -> pd.DataFrame:
+    """Build the normalized frame from element texts (live page or saved HTML)."""
+    names = [t for t in fields["names"] if t]
     # Lines (duplicated for over/under; we keep every other as the prop number)
-    raw_lines = [el.text for el in driver.find_elements(By.CLASS_NAME, "sportsbook-outcome-cell__line") if el.text]
+    raw_lines = [t for t in fields["lines"] if t]
     lines = [raw_lines[i] for i in range(len(raw_lines)) if i % 2 == 0]
 
-    raw_odds = [el.text for el in driver.find_elements(By.CLASS_NAME, "sportsbook-outcome-cell__element") if el.text]
+    raw_odds = [t for t in fields["odds"] if t]
     overs, unders = _split_odds(raw_odds)
 
     rows = []
@@ -1,34 +1,100 @@
 from __future__ import annotations
 
+import re
+from typing import TYPE_CHECKING, Optional
+
 import pandas as pd
-from selenium.webdriver.common.by import By
-from selenium.webdriver.support import expected_conditions as EC
-from selenium.webdriver.support.ui import WebDriverWait
-from selenium.webdriver.remote.webdriver import WebDriver
 
-def scrape_boxscore(driver: WebDriver, game_url: str, wait_time: int = 5) -> pd.DataFrame:
+from arbitrage_model.scrapers.archive import SnapshotArchiver
+from arbitrage_model.scrapers.base import TRACKER_PATTERNS, BlockProfile, collect_fields, load_page
+from arbitrage_model.scrapers.selectors import CLASS_NAME
+
+if TYPE_CHECKING:
+    from selenium.webdriver.remote.webdriver import WebDriver
+
+LOCATORS = {
+    "cells": (CLASS_NAME, "Table__TD"),
+}
+# Stat cells following each player cell in ESPN's standard layout.
+BOX_COLUMNS = (
+    "minutes",
+    "field_goals",
+    "threes",
+    "free_throws",
+    "offensive_rebounds",
+    "defensive_rebounds",
+    "rebounds",
+    "assists",
+    "steals",
+    "blocks",
+    "turnovers",
+    "fouls",
+    "points",
+)
+STAT_COLUMNS = ("minutes", "points", "rebounds", "assists", "threes", "steals", "blocks", "turnovers")
+_GAME_ID = re.compile(r"gameId[=/](\d+)")
+BLOCKING = BlockProfile(url_patterns=(*TRACKER_PATTERNS, "*espncdn.com/combiner/i*"))  # headshots, logos
+
+
+def scrape_boxscore(
+    driver: WebDriver,
+    game_url: str,
+    wait_time: int = 5,
+    archiver: Optional[SnapshotArchiver] = None,
+    block_resources: bool = True,
+) -> pd.DataFrame:
     """
     Scrape an ESPN NBA box score page into a player-level stats DataFrame.
     Used for feature engineering/backtests, not directly for odds.
     """
-    driver.get(game_url)
-    wait = WebDriverWait(driver, wait_time)
-    wait.until(EC.presence_of_all_elements_located((By.CLASS_NAME, "Table__TD")))
+    blocking = BLOCKING if block_resources else None
+    timing = load_page(driver, "espn_boxscore", game_url, LOCATORS["cells"], wait_time, blocking=blocking)
+    if archiver is not None:
+        archiver.submit("espn_boxscore", driver.page_source, url=game_url)
+    df = parse_boxscore(collect_fields(driver, LOCATORS))
+    df.attrs["timing"] = timing
+    return df
+
+
+def parse_boxscore(fields: dict[str, list[str]]) -> pd.DataFrame:
+    """
+    Build the typed player-level frame from table cell texts (live page or saved HTML).
 
-    cells = [el.text for el in driver.find_elements(By.CLASS_NAME, "Table__TD")]
+    One row per player: minutes as float, counting stats as nullable ints. Players who did
+    not play (the row holds a "DNP-..." note instead of stat cells) get missing values.
+    """
+    cells = fields["cells"]
     caps = "ABCDEFGHIJKLMNOPQRSTUVWXYZ"
 
-    players, minutes, points = [], [], []
+    rows = []
     # Simple heuristic: ESPN tables list player names with initials and periods
     for idx, cell in enumerate(cells):
         if cell and cell[0] in caps and "." in cell:
-            players.append(cell.split("\n")[0])
-            # offsets: minutes at idx+1, points at idx+13 in standard layout
-            try:
-                minutes.append(cells[idx + 1])
-                points.append(cells[idx + 13])
-            except Exception:
-                minutes.append(None)
-                points.append(None)
-
-    return pd.DataFrame({"players": players, "minutes": minutes, "points": points})
+            stats = cells[idx + 1 : idx + 1 + len(BOX_COLUMNS)]
+            if len(stats) < len(BOX_COLUMNS) or not _is_number(stats[0]):
+                stats = [None] * len(BOX_COLUMNS)
+            rows.append([cell.split("\n")[0], *(_made(value) for value in stats)])
+
+    frame = pd.DataFrame(rows, columns=["players", *BOX_COLUMNS])
+    frame["minutes"] = frame["minutes"].astype("float64")
+    for column in BOX_COLUMNS[1:]:
+        frame[column] = frame[column].astype("Int64")
+    return frame[["players", *STAT_COLUMNS]]
+
+
+def game_id_from_url(url: str) -> str:
+    """ESPN game id (`.../gameId/401585000` or `?gameId=401585000`); the URL itself if absent."""
+    match = _GAME_ID.search(url)
+    return match.group(1) if match else url
+
+
+def _is_number(cell: Optional[str]) -> bool:
+    return bool(cell) and cell.strip().isdigit()
+
+
+def _made(cell: Optional[str]) -> Optional[int]:
+    # Shooting cells read "made-attempted"; the made count is the stat props settle on.
+    if cell is None:
+        return None
+    head = cell.strip().split("-")[0]
+    return int(head) if head.isdigit() else None
@@ -1,15 +1,33 @@
 from __future__ import annotations
 
+from typing import TYPE_CHECKING, Optional
+
 import pandas as pd
-from selenium.webdriver.common.by import By
-from selenium.webdriver.support import expected_conditions as EC
-from selenium.webdriver.support.ui import WebDriverWait
-from selenium.webdriver.remote.webdriver import WebDriver
 
 from arbitrage_model.odds import normalize_american_odds
+from arbitrage_model.scrapers.archive import SnapshotArchiver
+from arbitrage_model.scrapers.base import DEFAULT_BLOCKING, collect_fields, load_page
+from arbitrage_model.scrapers.selectors import CLASS_NAME, CSS_SELECTOR
+
+if TYPE_CHECKING:
+    from selenium.webdriver.remote.webdriver import WebDriver
 
+LOCATORS = {
+    "lines": (CLASS_NAME, "sportsbook-outcome-cell__line"),
+    "odds": (CLASS_NAME, "sportsbook-outcome-cell__element"),
+    # Player names are nested; target aria-label-based selector for resiliency
+    "names": (CSS_SELECTOR, "[data-test-id='event-title']"),
+    "names_fallback": (CLASS_NAME, "event-title"),
+}
 
-def scrape_fanduel(driver: WebDriver, url: str, wait_time: int = 15) -> pd.DataFrame:
+
+def scrape_fanduel(
+    driver: WebDriver,
+    url: str,
+    wait_time: int = 15,
+    archiver: Optional[SnapshotArchiver] = None,
+    block_resources: bool = True,
+) -> pd.DataFrame:
     """
     Scrape FanDuel NBA player props into a normalized DataFrame.
 
@@ -18,23 +36,25 @@ def scrape_fanduel(driver: WebDriver, url: str, wait_time: int = 15) -> pd.DataF
     - We target generic sportsbook outcome classes (`sportsbook-outcome-cell__line`
       and `sportsbook-outcome-cell__element`) which tend to be stable.
     """
-    driver.get(url)
-    wait = WebDriverWait(driver, wait_time)
+    blocking = DEFAULT_BLOCKING if block_resources else None
+    timing = load_page(driver, "fanduel", url, LOCATORS["lines"], wait_time, blocking=blocking)
+    if archiver is not None:
+        archiver.submit("fanduel", driver.page_source, url=url)
+    df = parse_fanduel(collect_fields(driver, LOCATORS))
+    df.attrs["timing"] = timing
+    return df
 
-    wait.until(EC.presence_of_all_elements_located((By.CLASS_NAME, "sportsbook-outcome-cell__line")))
 
-    raw_lines = [el.text for el in driver.find_elements(By.CLASS_NAME, "sportsbook-outcome-cell__line") if el.text]
+def parse_fanduel(fields: dict[str, list[str]]) -> pd.DataFrame:
+    """Build the normalized frame from element texts (live page or saved HTML)."""
+    raw_lines = [t for t in fields["lines"] if t]
     # Every other element is the numeric line; odd indices are labels like "O/U"
     lines = [raw_lines[i] for i in range(len(raw_lines)) if i % 2 == 0]
 
-    raw_odds = [el.text for el in driver.find_elements(By.CLASS_NAME, "sportsbook-outcome-cell__element") if el.text]
+    raw_odds = [t for t in fields["odds"] if t]
     overs, unders = _split_odds(raw_odds)
 
-    # Player names are nested; target aria-label-based selector for resiliency
-    name_elements = driver.find_elements(By.CSS_SELECTOR, "[data-test-id='event-title']") or driver.find_elements(
-        By.CLASS_NAME, "event-title"
-    )
-    names = [el.text for el in name_elements if el.text]
+    names = [t for t in (fields["names"] or fields["names_fallback"]) if t]
 
     rows = []
     for name, line, over, under in zip(names, lines, overs, unders):
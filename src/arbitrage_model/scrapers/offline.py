@@ -0,0 +1,142 @@
+from __future__ import annotations
+
+import importlib
+import os
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import Callable, Iterable, Optional, Sequence
+
+import pandas as pd
+
+from arbitrage_model.scrapers.archive import ArchiveEntry, iter_index, load_snapshot
+from arbitrage_model.scrapers.selectors import extract_fields
+
+# book -> (module, parse function[, locators]). Each module exposes the same LOCATORS its
+# live scraper uses, so offline parsing cannot drift from the WebDriver path.
+PARSERS: dict[str, tuple[str, ...]] = {
+    "draftkings": ("arbitrage_model.scrapers.draftkings", "parse_draftkings"),
+    "fanduel": ("arbitrage_model.scrapers.fanduel", "parse_fanduel"),
+    "bovada": ("arbitrage_model.scrapers.bovada", "parse_bovada"),
+    "prizepicks": ("arbitrage_model.scrapers.prizepicks", "parse_prizepicks"),
+    "rotowire": ("arbitrage_model.scrapers.rotowire", "parse_rotowire"),
+    "rotowire_comparison": (
+        "arbitrage_model.scrapers.rotowire",
+        "parse_rotowire_comparison",
+        "COMPARISON_LOCATORS",
+    ),
+    "espn_boxscore": ("arbitrage_model.scrapers.espn_boxscore", "parse_boxscore"),
+}
+
+
+def _resolve(book: str) -> tuple[dict, Callable[[dict[str, list[str]]], pd.DataFrame]]:
+    try:
+        module_name, parser_name, *locators_name = PARSERS[book]
+    except KeyError:
+        raise ValueError(f"Unknown book {book!r}; expected one of {sorted(PARSERS)}") from None
+    module = importlib.import_module(module_name)
+    return getattr(module, locators_name[0] if locators_name else "LOCATORS"), getattr(module, parser_name)
+
+
+def parse_html(source: str | Path, book: str) -> pd.DataFrame:
+    """
+    Parse one saved page (HTML string or file path) with the book's live extraction rules.
+
+    Returns the same normalized frame the live `scrape_<book>` function produces.
+    """
+    locators, parse = _resolve(book)
+    return parse(extract_fields(source, locators))
+
+
+def _parse_file(path: str, book: str) -> tuple[str, pd.DataFrame | None, str | None]:
+    try:
+        return path, parse_html(Path(path), book), None
+    except Exception as exc:  # keep bulk runs going; report failures to the caller
+        return path, None, f"{type(exc).__name__}: {exc}"
+
+
+def parse_html_files(
+    paths: Sequence[Path],
+    book: str,
+    workers: Optional[int] = None,
+    chunksize: int = 16,
+    errors: Optional[list[tuple[Path, str]]] = None,
+) -> pd.DataFrame:
+    """
+    Bulk re-parse saved pages across a process pool.
+
+    Returns one frame with a `source_file` column added; files that fail to parse are
+    skipped and, if `errors` is given, appended to it as (path, message).
+    """
+    _resolve(book)  # fail fast on unknown books before spawning workers
+    workers = workers or os.cpu_count() or 1
+    args = [str(p) for p in paths]
+    if workers == 1 or len(args) <= 1:
+        results: Iterable = (_parse_file(p, book) for p in args)
+        return _combine(results, errors)
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        return _combine(pool.map(_parse_file, args, [book] * len(args), chunksize=chunksize), errors)
+
+
+def _combine(results: Iterable, errors: Optional[list[tuple[Path, str]]]) -> pd.DataFrame:
+    frames = []
+    for path, frame, error in results:
+        if error is not None:
+            if errors is not None:
+                errors.append((Path(path), error))
+            continue
+        if not frame.empty:
+            frames.append(frame.assign(source_file=path))
+    if not frames:
+        return pd.DataFrame(columns=["players", "line", "over", "under", "source_file"])
+    return pd.concat(frames, ignore_index=True)
+
+
+def _parse_archived(root: str, entry: ArchiveEntry) -> tuple[str, pd.DataFrame | None, str | None]:
+    label = f"{entry.bundle}@{entry.offset}"
+    try:
+        return label, parse_html(load_snapshot(Path(root), entry), entry.book), None
+    except Exception as exc:
+        return label, None, f"{type(exc).__name__}: {exc}"
+
+
+def parse_archive(
+    root: Path,
+    book: str,
+    workers: Optional[int] = None,
+    chunksize: int = 16,
+    errors: Optional[list[tuple[Path, str]]] = None,
+) -> pd.DataFrame:
+    """
+    Re-parse every archived snapshot of `book` (see scrapers.archive) across a process pool.
+
+    Deduplicated captures are parsed once and fanned out to each capture timestamp, so the
+    result has one block of rows per (book, captured_at) with `captured_at` and `source_file`.
+    """
+    _resolve(book)
+    entries = list(iter_index(root, book=book))
+    unique: dict[tuple[str, int], ArchiveEntry] = {}
+    for entry in entries:
+        unique.setdefault((entry.bundle, entry.offset), entry)
+
+    workers = workers or os.cpu_count() or 1
+    targets = list(unique.values())
+    if workers == 1 or len(targets) <= 1:
+        results = [_parse_archived(str(root), e) for e in targets]
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            results = list(pool.map(_parse_archived, [str(root)] * len(targets), targets, chunksize=chunksize))
+
+    parsed = {}
+    for entry, (label, frame, error) in zip(targets, results):
+        if error is not None:
+            if errors is not None:
+                errors.append((Path(label), error))
+            continue
+        parsed[(entry.bundle, entry.offset)] = (label, frame)
+    fanned = []
+    for entry in entries:
+        hit = parsed.get((entry.bundle, entry.offset))
+        if hit is not None:
+            label, frame = hit
+            fanned.append((label, frame.assign(captured_at=entry.captured_at), None))
+    return _combine(fanned, None)
@@ -1,15 +1,32 @@
 from __future__ import annotations
 
+from typing import TYPE_CHECKING, Optional
+
 import pandas as pd
-from selenium.webdriver.common.by import By
-from selenium.webdriver.support import expected_conditions as EC
-from selenium.webdriver.support.ui import WebDriverWait
-from selenium.webdriver.remote.webdriver import WebDriver
 
 from arbitrage_model.odds import normalize_american_odds
+from arbitrage_model.scrapers.archive import SnapshotArchiver
+from arbitrage_model.scrapers.base import DEFAULT_BLOCKING, collect_fields, load_page
+from arbitrage_model.scrapers.selectors import XPATH
+
+if TYPE_CHECKING:
+    from selenium.webdriver.remote.webdriver import WebDriver
+
+LOCATORS = {
+    "names": (XPATH, "//div[contains(@class,'player-name')]"),
+    "lines": (XPATH, "//div[contains(@class,'player-projection')]"),
+    # PrizePicks uses multipliers; capture both over and under payout strings.
+    "payouts": (XPATH, "//div[contains(@class,'pp-over-under')]//div"),
+}
 
 
-def scrape_prizepicks(driver: WebDriver, url: str, wait_time: int = 20) -> pd.DataFrame:
+def scrape_prizepicks(
+    driver: WebDriver,
+    url: str,
+    wait_time: int = 20,
+    archiver: Optional[SnapshotArchiver] = None,
+    block_resources: bool = True,
+) -> pd.DataFrame:
     """
     Scrape PrizePicks player props.
 
@@ -17,16 +34,20 @@ def scrape_prizepicks(driver: WebDriver, url: str, wait_time: int = 20) -> pd.Da
     with the arbitrage pipeline, we treat over/under payout multipliers as
     pseudo-odds. Update selectors if the React app changes.
     """
-    driver.get(url)
-    wait = WebDriverWait(driver, wait_time)
-
-    wait.until(EC.presence_of_all_elements_located((By.XPATH, "//div[contains(@class,'player-name')]")))
+    blocking = DEFAULT_BLOCKING if block_resources else None
+    timing = load_page(driver, "prizepicks", url, LOCATORS["names"], wait_time, blocking=blocking)
+    if archiver is not None:
+        archiver.submit("prizepicks", driver.page_source, url=url)
+    df = parse_prizepicks(collect_fields(driver, LOCATORS))
+    df.attrs["timing"] = timing
+    return df
 
-    names = [el.text for el in driver.find_elements(By.XPATH, "//div[contains(@class,'player-name')]") if el.text]
-    lines = [el.text for el in driver.find_elements(By.XPATH, "//div[contains(@class,'player-projection')]") if el.text]
 
-    # PrizePicks uses multipliers; capture both over and under payout strings.
-    payouts = [el.text for el in driver.find_elements(By.XPATH, "//div[contains(@class,'pp-over-under')]//div") if el.text]
+def parse_prizepicks(fields: dict[str, list[str]]) -> pd.DataFrame:
+    """Build the normalized frame from element texts (live page or saved HTML)."""
+    names = [t for t in fields["names"] if t]
+    lines = [t for t in fields["lines"] if t]
+    payouts = [t for t in fields["payouts"] if t]
     overs, unders = _split_odds(payouts)
 
     rows = []
@@ -1,12 +1,39 @@
 from __future__ import annotations
 
+from typing import TYPE_CHECKING, Optional, Sequence
+
 import pandas as pd
-from selenium.webdriver.common.by import By
-from selenium.webdriver.support import expected_conditions as EC
-from selenium.webdriver.support.ui import WebDriverWait
-from selenium.webdriver.remote.webdriver import WebDriver
 
-def scrape_rotowire(driver: WebDriver, url: str, wait_time: int = 12) -> pd.DataFrame:
+from arbitrage_model.odds import normalize_american_odds
+from arbitrage_model.scrapers.archive import SnapshotArchiver
+from arbitrage_model.scrapers.base import DEFAULT_BLOCKING, collect_fields, load_page
+from arbitrage_model.scrapers.selectors import CLASS_NAME, CSS_SELECTOR
+
+if TYPE_CHECKING:
+    from selenium.webdriver.remote.webdriver import WebDriver
+
+LOCATORS = {
+    "blocks": (CLASS_NAME, "webix_ss_center_scroll"),
+}
+# Comparison view (no `?book=`): one webix grid with a frozen player column and, per book,
+# a group of Line/Over/Under columns. Webix renders cells column by column, so the center
+# cells come back column-major; empty cells are kept so the grid can be reshaped.
+COMPARISON_LOCATORS = {
+    "headers": (CSS_SELECTOR, ".webix_hs_center .webix_hcell"),
+    "players": (CSS_SELECTOR, ".webix_ss_left .webix_cell"),
+    "cells": (CSS_SELECTOR, ".webix_ss_center .webix_cell"),
+}
+
+_SUB_LABELS = {"line": "line", "over": "over", "o": "over", "under": "under", "u": "under"}
+
+
+def scrape_rotowire(
+    driver: WebDriver,
+    url: str,
+    wait_time: int = 12,
+    archiver: Optional[SnapshotArchiver] = None,
+    block_resources: bool = True,
+) -> pd.DataFrame:
     """
     Scrape Rotowire's aggregated props table (PointsBet view by default).
 
@@ -14,12 +41,88 @@ def scrape_rotowire(driver: WebDriver, url: str, wait_time: int = 12) -> pd.Data
     for anomaly detection or cross-checking against books. Odds fields are left
     empty to avoid misleading the arbitrage engine.
     """
-    driver.get(url)
-    wait = WebDriverWait(driver, wait_time)
+    blocking = DEFAULT_BLOCKING if block_resources else None
+    timing = load_page(driver, "rotowire", url, LOCATORS["blocks"], wait_time, blocking=blocking)
+    if archiver is not None:
+        archiver.submit("rotowire", driver.page_source, url=url)
+    df = parse_rotowire(collect_fields(driver, LOCATORS))
+    df.attrs["timing"] = timing
+    return df
+
+
+def scrape_rotowire_comparison(
+    driver: WebDriver,
+    url: str,
+    wait_time: int = 12,
+    archiver: Optional[SnapshotArchiver] = None,
+    block_resources: bool = True,
+    books: Optional[Sequence[str]] = None,
+) -> pd.DataFrame:
+    """
+    Scrape every book column of Rotowire's props comparison view in one navigation.
+
+    Returns one normalized frame (players, line, over, under, book) covering all books,
+    captured at the same moment. `books` names the column groups left to right when the
+    header shows logos instead of text.
+    """
+    blocking = DEFAULT_BLOCKING if block_resources else None
+    timing = load_page(driver, "rotowire_comparison", url, COMPARISON_LOCATORS["cells"], wait_time, blocking=blocking)
+    if archiver is not None:
+        archiver.submit("rotowire_comparison", driver.page_source, url=url)
+    df = parse_rotowire_comparison(collect_fields(driver, COMPARISON_LOCATORS), books=books)
+    df.attrs["timing"] = timing
+    return df
+
+
+def parse_rotowire_comparison(
+    fields: dict[str, list[str]], books: Optional[Sequence[str]] = None
+) -> pd.DataFrame:
+    """
+    Build the per-book quote frame from comparison-grid texts (live page or saved HTML).
+
+    Only priced quotes are kept: a grid without Over/Under columns, or a book with a line
+    but no price for a player, yields no row, so the file always loads as quotes.
+    """
+    columns = ["players", "line", "over", "under", "book"]
+    headers = [" ".join(t.split()) for t in fields["headers"] if t and t.strip()]
+    sub = [_SUB_LABELS[h.lower()] for h in headers if h.lower() in _SUB_LABELS]
+    names = list(books) if books else [h for h in headers if h.lower() not in _SUB_LABELS]
+    cells = fields["cells"]
+    if not sub or not names or not cells:
+        return pd.DataFrame(columns=columns)
+    if len(sub) % len(names) or len(cells) % len(sub):
+        raise ValueError(
+            f"Rotowire grid does not line up: {len(names)} books, {len(sub)} sub-columns, {len(cells)} cells"
+        )
+    width = len(sub) // len(names)
+    n_rows = len(cells) // len(sub)
+    players = fields["players"][:n_rows]
+
+    rows = []
+    for b, book in enumerate(names):
+        group = {sub[b * width + k]: b * width + k for k in range(width)}
+        if not {"line", "over", "under"} <= group.keys():
+            continue  # lines without prices are not quotes
+        for r, name in enumerate(players):
+            cell = {label: cells[col * n_rows + r].strip() for label, col in group.items()}
+            try:
+                row = {
+                    "players": name.strip(),
+                    "line": float(cell["line"]),
+                    "over": normalize_american_odds(cell["over"]),
+                    "under": normalize_american_odds(cell["under"]),
+                }
+            except ValueError:
+                continue  # book has no line or no price for this player
+            if not row["players"]:
+                continue
+            rows.append({**row, "book": book.lower().title()})
+    return pd.DataFrame(rows, columns=columns)
 
-    wait.until(EC.presence_of_all_elements_located((By.CLASS_NAME, "webix_ss_center_scroll")))
 
-    raw_blocks = [el.text for el in driver.find_elements(By.CLASS_NAME, "webix_ss_center_scroll") if el.text]
+def parse_rotowire(fields: dict[str, list[str]]) -> pd.DataFrame:
+    """Build the normalized frame from element texts (live page or saved HTML)."""
+    raw_blocks = [t for t in fields["blocks"] if t]
     formatted = []
     for block in raw_blocks:
         chunk = [line for line in block.split("\n") if line]
@@ -0,0 +1,259 @@
+from __future__ import annotations
+
+import re
+from dataclasses import dataclass, field
+from functools import lru_cache
+from html.parser import HTMLParser
+from pathlib import Path
+from typing import Iterable, Mapping, Optional, Sequence
+
+# Locator strategies, the same strings as selenium.webdriver.common.by.By, so scraper modules
+# can declare their LOCATORS (and parse saved HTML) without importing Selenium.
+CLASS_NAME = "class name"
+CSS_SELECTOR = "css selector"
+XPATH = "xpath"
+
+Locator = tuple[str, str]
+
+_VOID_TAGS = frozenset(
+    {"area", "base", "br", "col", "embed", "hr", "img", "input", "link", "meta", "param", "source", "track", "wbr"}
+)
+_BLOCK_TAGS = frozenset(
+    {
+        "address", "article", "aside", "blockquote", "br", "dd", "div", "dl", "dt", "fieldset", "figure",
+        "footer", "form", "h1", "h2", "h3", "h4", "h5", "h6", "header", "hr", "li", "main", "nav", "ol", "p",
+        "pre", "section", "table", "tbody", "thead", "tfoot", "tr", "ul",
+    }
+)
+_SKIP_TEXT_TAGS = frozenset({"script", "style", "noscript", "template"})
+
+_CSS_TOKEN = re.compile(r"""([.#])([\w-]+)|\[\s*([\w-]+)\s*(?:=\s*(['"]?)(.*?)\4\s*)?\]|([\w*-]+)""")
+_XPATH_STEP = re.compile(r"^([\w*-]+)((?:\[[^\]]+\])*)$")
+_XPATH_PRED = re.compile(
+    r"""\[\s*(?:contains\(\s*@([\w-]+)\s*,\s*['"](.*?)['"]\s*\)|@([\w-]+)\s*=\s*['"](.*?)['"]|@([\w-]+))\s*\]"""
+)
+
+
+@dataclass(frozen=True)
+class Step:
+    """One compound selector step: tag, exact class tokens, attribute equality/contains checks."""
+
+    tag: Optional[str] = None
+    classes: frozenset[str] = frozenset()
+    attr_equals: tuple[tuple[str, str], ...] = ()
+    attr_contains: tuple[tuple[str, str], ...] = ()
+    attr_present: tuple[str, ...] = ()
+
+    def matches(self, tag: str, attrs: Mapping[str, str]) -> bool:
+        if self.tag and self.tag != tag:
+            return False
+        if self.classes and not self.classes.issubset(attrs.get("class", "").split()):
+            return False
+        for name, value in self.attr_equals:
+            if attrs.get(name) != value:
+                return False
+        for name, value in self.attr_contains:
+            if value not in attrs.get(name, ""):
+                return False
+        return all(name in attrs for name in self.attr_present)
+
+
+@dataclass(frozen=True)
+class CompiledSelector:
+    """Descendant chain of steps; the last step is the element whose text is extracted."""
+
+    steps: tuple[Step, ...]
+
+    def matches(self, tag: str, attrs: Mapping[str, str], ancestors: Sequence[_Open]) -> bool:
+        if not self.steps[-1].matches(tag, attrs):
+            return False
+        pending = len(self.steps) - 2
+        for ancestor in reversed(ancestors):
+            if pending < 0:
+                break
+            if self.steps[pending].matches(ancestor.tag, ancestor.attrs):
+                pending -= 1
+        return pending < 0
+
+
+@lru_cache(maxsize=None)
+def compile_locator(by: str, value: str) -> CompiledSelector:
+    """
+    Compile a Selenium (by, value) locator into a matcher usable on static HTML.
+
+    Supported: By.CLASS_NAME; CSS compound selectors (tag, .class, #id, [attr], [attr='v'])
+    joined by descendant spaces; XPath `//tag[contains(@a,'v')]` / `//tag[@a='v']` steps
+    joined by `//`. Anything else raises ValueError so selector drift is caught early.
+    """
+    if by == CLASS_NAME:
+        return CompiledSelector((Step(classes=frozenset([value])),))
+    if by == CSS_SELECTOR:
+        return CompiledSelector(tuple(_compile_css_step(part) for part in value.split()))
+    if by == XPATH:
+        if not value.startswith("//"):
+            raise ValueError(f"Only descendant ('//') XPath locators are supported offline: {value!r}")
+        return CompiledSelector(tuple(_compile_xpath_step(part) for part in value[2:].split("//")))
+    raise ValueError(f"Unsupported locator strategy for offline parsing: {by!r}")
+
+
+def _compile_css_step(part: str) -> Step:
+    tag, classes, equals, present = None, [], [], []
+    pos = 0
+    for match in _CSS_TOKEN.finditer(part):
+        if match.start() != pos:
+            raise ValueError(f"Unsupported CSS selector fragment: {part!r}")
+        pos = match.end()
+        prefix, name, attr, _, attr_value, tag_name = match.groups()
+        if prefix == ".":
+            classes.append(name)
+        elif prefix == "#":
+            equals.append(("id", name))
+        elif attr:
+            if attr_value is None and "=" not in match.group(0):
+                present.append(attr)
+            else:
+                equals.append((attr, attr_value or ""))
+        elif tag_name and tag_name != "*":
+            tag = tag_name.lower()
+    if pos != len(part):
+        raise ValueError(f"Unsupported CSS selector fragment: {part!r}")
+    return Step(tag=tag, classes=frozenset(classes), attr_equals=tuple(equals), attr_present=tuple(present))
+
+
+def _compile_xpath_step(part: str) -> Step:
+    match = _XPATH_STEP.match(part.strip())
+    if not match:
+        raise ValueError(f"Unsupported XPath step: {part!r}")
+    tag, predicates = match.groups()
+    contains, equals, present = [], [], []
+    for pred in _XPATH_PRED.finditer(predicates):
+        c_attr, c_value, e_attr, e_value, p_attr = pred.groups()
+        if c_attr:
+            contains.append((c_attr, c_value))
+        elif e_attr:
+            equals.append((e_attr, e_value))
+        else:
+            present.append(p_attr)
+    if _XPATH_PRED.sub("", predicates):
+        raise ValueError(f"Unsupported XPath predicate: {part!r}")
+    return Step(
+        tag=None if tag == "*" else tag.lower(),
+        attr_equals=tuple(equals),
+        attr_contains=tuple(contains),
+        attr_present=tuple(present),
+    )
+
+
+@dataclass
+class _Open:
+    tag: str
+    attrs: dict[str, str]
+    captures: list[tuple[str, int, list[str]]] = field(default_factory=list)
+
+
+class FieldExtractor(HTMLParser):
+    """
+    Streaming extractor: feed HTML in chunks and collect the text of every element matching
+    each named locator, in document order (like `driver.find_elements(...)` + `.text`).
+
+    Tokenizing is html.parser's, which buffers partial tags across chunks; this class only
+    tracks open elements so descendant selectors can check their ancestors.
+    """
+
+    def __init__(self, locators: Mapping[str, Locator]) -> None:
+        super().__init__(convert_charrefs=True)
+        self._selectors = [(name, compile_locator(*loc)) for name, loc in locators.items()]
+        self._tags = _tag_filter(sel for _, sel in self._selectors)
+        self.fields: dict[str, list[Optional[str]]] = {name: [] for name in locators}
+        self._stack: list[_Open] = []
+        self._active: list[list[str]] = []
+        self._hidden = 0  # open script/style/... elements, whose text Selenium does not return
+
+    def close(self) -> None:
+        super().close()
+        while self._stack:
+            self._close(self._stack.pop())
+
+    def handle_starttag(self, tag: str, attrs: list[tuple[str, Optional[str]]]) -> None:
+        if tag in _BLOCK_TAGS:
+            self._emit("\n")
+        if tag in _VOID_TAGS:
+            return
+        node = _Open(tag, {name: value or "" for name, value in attrs})
+        if self._tags is None or tag in self._tags:
+            for name, selector in self._selectors:
+                if selector.matches(tag, node.attrs, self._stack):
+                    buf: list[str] = []
+                    slot = len(self.fields[name])
+                    self.fields[name].append(None)
+                    node.captures.append((name, slot, buf))
+                    self._active.append(buf)
+        if tag in _SKIP_TEXT_TAGS:
+            self._hidden += 1
+        self._stack.append(node)
+
+    def handle_startendtag(self, tag: str, attrs: list[tuple[str, Optional[str]]]) -> None:
+        self.handle_starttag(tag, attrs)
+        if tag not in _VOID_TAGS:
+            self.handle_endtag(tag)
+
+    def handle_endtag(self, tag: str) -> None:
+        if tag in _BLOCK_TAGS:
+            self._emit("\n")
+        for depth in range(len(self._stack) - 1, -1, -1):
+            if self._stack[depth].tag == tag:
+                break
+        else:
+            return  # stray end tag
+        while len(self._stack) > depth:
+            self._close(self._stack.pop())
+
+    def handle_data(self, data: str) -> None:
+        if not self._hidden:
+            self._emit(data)
+
+    def _emit(self, text: str) -> None:
+        for buf in self._active:
+            buf.append(text)
+
+    def _close(self, node: _Open) -> None:
+        if node.tag in _SKIP_TEXT_TAGS:
+            self._hidden -= 1
+        for name, slot, buf in node.captures:
+            self.fields[name][slot] = _normalize_text(buf)
+            self._active.remove(buf)
+
+
+def _tag_filter(selectors: Iterable[CompiledSelector]) -> Optional[frozenset[str]]:
+    tags = set()
+    for selector in selectors:
+        if selector.steps[-1].tag is None:
+            return None
+        tags.add(selector.steps[-1].tag)
+    return frozenset(tags)
+
+
+def _normalize_text(parts: Iterable[str]) -> str:
+    lines = (re.sub(r"\s+", " ", line).strip() for line in "".join(parts).split("\n"))
+    return "\n".join(line for line in lines if line)
+
+
+def extract_fields(
+    source: str | Path,
+    locators: Mapping[str, Locator],
+    chunk_size: int = 1 << 16,
+) -> dict[str, list[str]]:
+    """
+    Extract element texts for each named locator from an HTML string or file path.
+
+    Files are streamed in `chunk_size` pieces so large saved pages are never held twice.
+    """
+    extractor = FieldExtractor(locators)
+    if isinstance(source, Path):
+        with open(source, encoding="utf-8", errors="replace") as fh:
+            for chunk in iter(lambda: fh.read(chunk_size), ""):
+                extractor.feed(chunk)
+    else:
+        extractor.feed(source)
+    extractor.close()
+    return {name: [text or "" for text in texts] for name, texts in extractor.fields.items()}
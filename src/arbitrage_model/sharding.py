@@ -0,0 +1,198 @@
+from __future__ import annotations
+
+import heapq
+import os
+import sys
+from concurrent.futures import Executor, ProcessPoolExecutor
+from multiprocessing import shared_memory
+from typing import List, Optional, Sequence
+
+import numpy as np
+
+from arbitrage_model.models import ArbitrageOpportunity, BookOffer
+from arbitrage_model.vectorized import (
+    ArbArrays,
+    QuoteArrays,
+    arbs_to_opportunities,
+    encode_offers,
+    scan_arrays,
+    shard_keys,
+)
+
+# Columns the workers need, in shared-memory layout order. Book codes stay in the parent
+# because they are only used when materializing results.
+_SHARED_FIELDS: tuple[tuple[str, np.dtype], ...] = (
+    ("line", np.dtype(np.float64)),
+    ("player_code", np.dtype(np.int32)),
+    ("market_code", np.dtype(np.int32)),
+    ("over_odds", np.dtype(np.int32)),
+    ("under_odds", np.dtype(np.int32)),
+)
+
+
+def _layout(n: int) -> list[tuple[str, np.dtype, int]]:
+    layout, offset = [], 0
+    for name, dtype in _SHARED_FIELDS:
+        layout.append((name, dtype, offset))
+        offset += -(-n * dtype.itemsize // 8) * 8  # keep every column 8-byte aligned
+    return layout
+
+
+def _layout_size(n: int) -> int:
+    return max(sum(-(-n * dtype.itemsize // 8) * 8 for _, dtype in _SHARED_FIELDS), 1)
+
+
+def _views(buf, n: int) -> dict[str, np.ndarray]:
+    return {name: np.ndarray((n,), dtype=dtype, buffer=buf, offset=offset) for name, dtype, offset in _layout(n)}
+
+
+def _attach(name: str) -> shared_memory.SharedMemory:
+    """
+    Attach to the parent's block. Pool workers share the parent's resource tracker, so the
+    parent's unlink() remains the single point of cleanup.
+    """
+    if sys.version_info >= (3, 13):
+        return shared_memory.SharedMemory(name=name, track=False)
+    return shared_memory.SharedMemory(name=name)
+
+
+def _scan_shard(shm_name: str, n: int, start: int, stop: int, bankroll: float) -> ArbArrays:
+    """Worker entry point: scan rows [start, stop) of the shared board."""
+    shm = _attach(shm_name)
+    cols: dict[str, np.ndarray] = {}
+    try:
+        cols = _views(shm.buf, n)
+        arbs = scan_arrays(
+            cols["player_code"][start:stop],
+            cols["market_code"][start:stop],
+            cols["line"][start:stop],
+            cols["over_odds"][start:stop],
+            cols["under_odds"][start:stop],
+            bankroll=bankroll,
+        )
+        # Copy out of the shared buffer (and shift to board-wide row indices) before closing it.
+        return ArbArrays(
+            over_row=arbs.over_row + start,
+            under_row=arbs.under_row + start,
+            edge_pct=arbs.edge_pct.copy(),
+            stake_over=arbs.stake_over.copy(),
+            stake_under=arbs.stake_under.copy(),
+            expected_profit=arbs.expected_profit.copy(),
+        )
+    finally:
+        del cols
+        shm.close()
+
+
+def _take(arrays: QuoteArrays, index: np.ndarray) -> QuoteArrays:
+    return QuoteArrays(
+        players=arrays.players,
+        markets=arrays.markets,
+        books=arrays.books,
+        player_code=arrays.player_code[index],
+        market_code=arrays.market_code[index],
+        book_code=arrays.book_code[index],
+        line=arrays.line[index],
+        over_odds=arrays.over_odds[index],
+        under_odds=arrays.under_odds[index],
+    )
+
+
+def merge_shard_results(results: Sequence[ArbArrays]) -> ArbArrays:
+    """K-way merge of per-shard results (each already sorted by edge_pct descending)."""
+    streams = [
+        zip((-r.edge_pct).tolist(), range(len(r.edge_pct)), [shard] * len(r.edge_pct))
+        for shard, r in enumerate(results)
+    ]
+    merged = list(heapq.merge(*streams))
+    shards = np.fromiter((s for _, _, s in merged), dtype=np.intp, count=len(merged))
+    rows = np.fromiter((i for _, i, _ in merged), dtype=np.intp, count=len(merged))
+
+    def _gather(field: str) -> np.ndarray:
+        if not results:
+            return np.empty(0)
+        stacked = np.concatenate([getattr(r, field) for r in results])
+        base = np.cumsum([0] + [len(r.edge_pct) for r in results[:-1]])
+        return stacked[base[shards] + rows] if len(merged) else stacked[:0]
+
+    return ArbArrays(
+        over_row=_gather("over_row").astype(np.intp),
+        under_row=_gather("under_row").astype(np.intp),
+        edge_pct=_gather("edge_pct"),
+        stake_over=_gather("stake_over"),
+        stake_under=_gather("stake_under"),
+        expected_profit=_gather("expected_profit"),
+    )
+
+
+class ShardedScanner:
+    """
+    Shared-nothing multi-process arbitrage scanner.
+
+    Quotes are partitioned by a stable hash of (player, market), so every line of a market
+    lands on one shard. The parent writes the board once into shared memory sorted by
+    shard; each worker scans its contiguous slice and returns only the arbitrages found,
+    which the parent k-way merges by edge_pct.
+
+    Use as a context manager to keep the worker pool warm across scans.
+    """
+
+    def __init__(self, workers: Optional[int] = None, shards: Optional[int] = None) -> None:
+        self.workers = workers or os.cpu_count() or 1
+        self.shards = shards or self.workers
+        self._pool: Optional[Executor] = None
+
+    def __enter__(self) -> "ShardedScanner":
+        self._pool = ProcessPoolExecutor(max_workers=self.workers)
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    def close(self) -> None:
+        if self._pool is not None:
+            self._pool.shutdown()
+            self._pool = None
+
+    def scan(self, arrays: QuoteArrays, bankroll: float = 100.0) -> List[ArbitrageOpportunity]:
+        board, arbs = self.scan_arrays(arrays, bankroll=bankroll)
+        return arbs_to_opportunities(board, arbs)
+
+    def scan_arrays(self, arrays: QuoteArrays, bankroll: float = 100.0) -> tuple[QuoteArrays, ArbArrays]:
+        """Scan and return (shard-ordered board, merged ArbArrays indexing into that board)."""
+        n = len(arrays)
+        shard_of = shard_keys(arrays) % np.uint32(self.shards) if n else np.empty(0, dtype=np.uint32)
+        order = np.argsort(shard_of, kind="stable")
+        board = _take(arrays, order)
+        bounds = np.searchsorted(shard_of[order], np.arange(self.shards + 1))
+
+        shm = shared_memory.SharedMemory(create=True, size=_layout_size(n))
+        owns_pool = self._pool is None
+        pool = self._pool or ProcessPoolExecutor(max_workers=self.workers)
+        try:
+            cols = _views(shm.buf, n)
+            for name, _ in _SHARED_FIELDS:
+                cols[name][:] = getattr(board, name)
+            del cols
+            futures = [
+                pool.submit(_scan_shard, shm.name, n, int(start), int(stop), bankroll)
+                for start, stop in zip(bounds[:-1], bounds[1:])
+                if stop > start
+            ]
+            results = [f.result() for f in futures]
+        finally:
+            if owns_pool:
+                pool.shutdown()
+            shm.close()
+            shm.unlink()
+        return board, merge_shard_results(results)
+
+
+def find_two_way_arbs_sharded(
+    offers: Sequence[BookOffer],
+    bankroll: float = 100.0,
+    workers: Optional[int] = None,
+) -> List[ArbitrageOpportunity]:
+    """One-shot convenience wrapper around ShardedScanner for BookOffer lists."""
+    with ShardedScanner(workers=workers) as scanner:
+        return scanner.scan(encode_offers(offers), bankroll=bankroll)
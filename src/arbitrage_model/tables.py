@@ -0,0 +1,37 @@
+from __future__ import annotations
+
+from numbers import Number
+from typing import Mapping, Sequence
+
+
+def to_markdown(rows: Sequence[Mapping[str, object]]) -> str:
+    """
+    Render rows as a GitHub-style pipe table without pandas/tabulate.
+
+    Numeric columns are right-aligned and text columns left-aligned, matching
+    the layout of `DataFrame.to_markdown(index=False)` closely enough for CLI output.
+    """
+    if not rows:
+        return ""
+    headers = list(rows[0].keys())
+    cells = [[_format_cell(row.get(h)) for h in headers] for row in rows]
+    numeric = [all(isinstance(row.get(h), Number) for row in rows) for h in headers]
+    widths = [max(len(h), *(len(c[i]) for c in cells)) for i, h in enumerate(headers)]
+
+    def _line(values: Sequence[str]) -> str:
+        padded = [
+            value.rjust(width) if is_num else value.ljust(width)
+            for value, width, is_num in zip(values, widths, numeric)
+        ]
+        return "| " + " | ".join(padded) + " |"
+
+    rule = "|" + "|".join(
+        ("-" * (width + 1) + ":") if is_num else (":" + "-" * (width + 1)) for width, is_num in zip(widths, numeric)
+    ) + "|"
+    return "\n".join([_line(headers), rule, *(_line(c) for c in cells)])
+
+
+def _format_cell(value: object) -> str:
+    if value is None:
+        return ""
+    return str(value)
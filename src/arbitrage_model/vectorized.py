@@ -0,0 +1,279 @@
+from __future__ import annotations
+
+import zlib
+from dataclasses import dataclass
+from typing import List, Sequence
+
+import numpy as np
+
+from arbitrage_model.markets import CODEBOOK
+from arbitrage_model.models import ArbitrageOpportunity, BookOffer
+
+
+@dataclass(frozen=True)
+class QuoteArrays:
+    """
+    Column-oriented view of a quote board.
+
+    Strings (player, market, book) are stored once in the lookup lists and referenced by
+    small integer codes so the arrays can be shared between processes without pickling.
+    The lists may be the shared codebook's own (longer than the codes used); treat them as read-only.
+    """
+
+    players: list[str]
+    markets: list[str]
+    books: list[str]
+    player_code: np.ndarray  # int32
+    market_code: np.ndarray  # int32
+    book_code: np.ndarray  # int32
+    line: np.ndarray  # float64
+    over_odds: np.ndarray  # int32
+    under_odds: np.ndarray  # int32
+
+    def __len__(self) -> int:
+        return int(self.line.shape[0])
+
+
+@dataclass(frozen=True)
+class ArbArrays:
+    """Vectorized scan output; one entry per arbitrage, indices refer to the scanned QuoteArrays rows."""
+
+    over_row: np.ndarray
+    under_row: np.ndarray
+    edge_pct: np.ndarray
+    stake_over: np.ndarray
+    stake_under: np.ndarray
+    expected_profit: np.ndarray
+
+
+def encode_offers(offers: Sequence[BookOffer]) -> QuoteArrays:
+    """
+    Dictionary-encode BookOffer objects into QuoteArrays.
+
+    Offers stamped by a loader reuse their CODEBOOK codes and share its name lists (no copy);
+    otherwise (or if any code predates a codebook reset) strings are encoded here.
+    """
+    players, markets, books = CODEBOOK.players, CODEBOOK.markets, CODEBOOK.books
+    if offers and all(
+        players.holds(o.player_code, o.player)
+        and markets.holds(o.market_code, o.market)
+        and books.holds(o.book_code, o.book)
+        for o in offers
+    ):
+        return _from_codebook(offers, players.names, markets.names, books.names)
+    player_index: dict[str, int] = {}
+    market_index: dict[str, int] = {}
+    book_index: dict[str, int] = {}
+    n = len(offers)
+    player_code = np.empty(n, dtype=np.int32)
+    market_code = np.empty(n, dtype=np.int32)
+    book_code = np.empty(n, dtype=np.int32)
+    line = np.empty(n, dtype=np.float64)
+    over_odds = np.empty(n, dtype=np.int32)
+    under_odds = np.empty(n, dtype=np.int32)
+    for i, o in enumerate(offers):
+        player_code[i] = player_index.setdefault(o.player, len(player_index))
+        market_code[i] = market_index.setdefault(o.market, len(market_index))
+        book_code[i] = book_index.setdefault(o.book, len(book_index))
+        line[i] = o.line
+        over_odds[i] = o.over_odds
+        under_odds[i] = o.under_odds
+    return QuoteArrays(
+        players=list(player_index),
+        markets=list(market_index),
+        books=list(book_index),
+        player_code=player_code,
+        market_code=market_code,
+        book_code=book_code,
+        line=line,
+        over_odds=over_odds,
+        under_odds=under_odds,
+    )
+
+
+def _from_codebook(
+    offers: Sequence[BookOffer], players: list[str], markets: list[str], books: list[str]
+) -> QuoteArrays:
+    n = len(offers)
+    return QuoteArrays(
+        players=players,
+        markets=markets,
+        books=books,
+        player_code=np.fromiter((o.player_code for o in offers), dtype=np.int32, count=n),
+        market_code=np.fromiter((o.market_code for o in offers), dtype=np.int32, count=n),
+        book_code=np.fromiter((o.book_code for o in offers), dtype=np.int32, count=n),
+        line=np.fromiter((o.line for o in offers), dtype=np.float64, count=n),
+        over_odds=np.fromiter((o.over_odds for o in offers), dtype=np.int32, count=n),
+        under_odds=np.fromiter((o.under_odds for o in offers), dtype=np.int32, count=n),
+    )
+
+
+def decode_offers(arrays: QuoteArrays) -> List[BookOffer]:
+    """Inverse of encode_offers: one BookOffer per row, in row order."""
+    return [
+        BookOffer(
+            book=arrays.books[b],
+            player=arrays.players[p],
+            market=arrays.markets[m],
+            line=line,
+            over_odds=over,
+            under_odds=under,
+        )
+        for p, m, b, line, over, under in zip(
+            arrays.player_code.tolist(),
+            arrays.market_code.tolist(),
+            arrays.book_code.tolist(),
+            arrays.line.tolist(),
+            arrays.over_odds.tolist(),
+            arrays.under_odds.tolist(),
+        )
+    ]
+
+
+def synthetic_board(players: int, markets: int, lines: int, books: int, seed: int = 7) -> QuoteArrays:
+    """Every (player, market, line) quoted by every book with odds jittered around -110 (for benchmarks/replay)."""
+    rng = np.random.default_rng(seed)
+    n = players * markets * lines * books
+    idx = np.arange(n)
+    odds = rng.integers(-135, -95, size=(2, n))
+    # Flip a slice of prices to plus money so some arbitrages exist.
+    plus = rng.random((2, n)) < 0.15
+    odds = np.where(plus, rng.integers(100, 125, size=(2, n)), odds).astype(np.int32)
+    return QuoteArrays(
+        players=[f"Player {i}" for i in range(players)],
+        markets=[f"market_{i}" for i in range(markets)],
+        books=[f"Book {i}" for i in range(books)],
+        player_code=(idx // (markets * lines * books)).astype(np.int32),
+        market_code=((idx // (lines * books)) % markets).astype(np.int32),
+        book_code=(idx % books).astype(np.int32),
+        line=((idx // books) % lines).astype(np.float64) + 0.5,
+        over_odds=odds[0],
+        under_odds=odds[1],
+    )
+
+
+def american_to_decimal_array(odds: np.ndarray) -> np.ndarray:
+    """Vectorized american_to_decimal; zero odds are rejected like the scalar version."""
+    odds = np.asarray(odds, dtype=np.float64)
+    if np.any(odds == 0):
+        raise ValueError("American odds cannot be zero")
+    return np.where(odds > 0, odds / 100 + 1, 100 / np.abs(odds) + 1)
+
+
+def shard_keys(arrays: QuoteArrays) -> np.ndarray:
+    """
+    Stable (process- and run-independent) uint32 hash of each row's (player, market).
+
+    Uses crc32 rather than hash() so every worker and every run agrees on placement.
+    """
+    n_markets = max(len(arrays.markets), 1)  # read once: a shared codebook list may grow meanwhile
+    pair_codes = arrays.player_code.astype(np.int64) * n_markets + arrays.market_code
+    unique_pairs, inverse = np.unique(pair_codes, return_inverse=True)
+    hashed = np.fromiter(
+        (
+            zlib.crc32(f"{arrays.players[p // n_markets]}\x1f{arrays.markets[p % n_markets]}".encode("utf-8"))
+            for p in unique_pairs.tolist()
+        ),
+        dtype=np.uint32,
+        count=len(unique_pairs),
+    )
+    return hashed[inverse]
+
+
+def scan_arrays(
+    player_code: np.ndarray,
+    market_code: np.ndarray,
+    line: np.ndarray,
+    over_odds: np.ndarray,
+    under_odds: np.ndarray,
+    bankroll: float = 100.0,
+) -> ArbArrays:
+    """
+    Vectorized two-way arbitrage scan grouped by (player, market, line).
+
+    Mirrors find_two_way_arbs: groups need at least two quotes, the best price per side
+    wins (first occurrence on ties), and results are sorted by edge_pct descending.
+    """
+    n = line.shape[0]
+    empty = np.empty(0, dtype=np.float64)
+    if n == 0:
+        return ArbArrays(np.empty(0, dtype=np.intp), np.empty(0, dtype=np.intp), empty, empty, empty, empty)
+
+    order = np.lexsort((line, market_code, player_code))
+    p, m, ln = player_code[order], market_code[order], line[order]
+    boundary = np.empty(n, dtype=bool)
+    boundary[0] = True
+    boundary[1:] = (p[1:] != p[:-1]) | (m[1:] != m[:-1]) | (ln[1:] != ln[:-1])
+    starts = np.flatnonzero(boundary)
+    sizes = np.diff(np.append(starts, n))
+
+    dec_over = american_to_decimal_array(over_odds[order])
+    dec_under = american_to_decimal_array(under_odds[order])
+    over_pos = _first_argmax_per_group(dec_over, starts, sizes)
+    under_pos = _first_argmax_per_group(dec_under, starts, sizes)
+
+    best_over = dec_over[over_pos]
+    best_under = dec_under[under_pos]
+    inverse_sum = 1 / best_over + 1 / best_under
+    keep = (sizes >= 2) & (inverse_sum < 1)
+
+    inverse_sum = inverse_sum[keep]
+    best_over = best_over[keep]
+    best_under = best_under[keep]
+    stake_over = bankroll * (1 / best_over) / inverse_sum
+    stake_under = bankroll * (1 / best_under) / inverse_sum
+    expected_profit = bankroll / inverse_sum - bankroll
+    edge_pct = (1 / inverse_sum - 1) * 100
+
+    rank = np.argsort(-edge_pct, kind="stable")
+    return ArbArrays(
+        over_row=order[over_pos[keep]][rank],
+        under_row=order[under_pos[keep]][rank],
+        edge_pct=edge_pct[rank],
+        stake_over=stake_over[rank],
+        stake_under=stake_under[rank],
+        expected_profit=expected_profit[rank],
+    )
+
+
+def _first_argmax_per_group(values: np.ndarray, starts: np.ndarray, sizes: np.ndarray) -> np.ndarray:
+    group_max = np.maximum.reduceat(values, starts)
+    positions = np.arange(values.shape[0])
+    candidates = np.where(values == np.repeat(group_max, sizes), positions, values.shape[0])
+    return np.minimum.reduceat(candidates, starts)
+
+
+def arbs_to_opportunities(arrays: QuoteArrays, arbs: ArbArrays) -> List[ArbitrageOpportunity]:
+    """Materialize ArbArrays rows as ArbitrageOpportunity objects."""
+    return [
+        ArbitrageOpportunity(
+            player=arrays.players[arrays.player_code[o]],
+            market=arrays.markets[arrays.market_code[o]],
+            line=float(arrays.line[o]),
+            over_book=arrays.books[arrays.book_code[o]],
+            under_book=arrays.books[arrays.book_code[u]],
+            over_odds=int(arrays.over_odds[o]),
+            under_odds=int(arrays.under_odds[u]),
+            edge_pct=float(edge),
+            stake_over=float(so),
+            stake_under=float(su),
+            expected_profit=float(profit),
+        )
+        for o, u, edge, so, su, profit in zip(
+            arbs.over_row.tolist(),
+            arbs.under_row.tolist(),
+            arbs.edge_pct.tolist(),
+            arbs.stake_over.tolist(),
+            arbs.stake_under.tolist(),
+            arbs.expected_profit.tolist(),
+        )
+    ]
+
+
+def find_two_way_arbs_vectorized(offers: Sequence[BookOffer], bankroll: float = 100.0) -> List[ArbitrageOpportunity]:
+    """NumPy equivalent of aggregator.find_two_way_arbs (grouped per market as well as player/line)."""
+    arrays = encode_offers(offers)
+    arbs = scan_arrays(
+        arrays.player_code, arrays.market_code, arrays.line, arrays.over_odds, arrays.under_odds, bankroll=bankroll
+    )
+    return arbs_to_opportunities(arrays, arbs)
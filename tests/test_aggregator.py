@@ -0,0 +1,10 @@
+from __future__ import annotations
+
+from arbitrage_model.aggregator import load_book_quotes
+
+
+def test_loader_skips_rows_without_prices(tmp_path):
+    path = tmp_path / "rotowire_props_latest.csv"
+    path.write_text("players,line,over,under\nLuka Doncic,32.5,,\nKyrie Irving,24.5,+105,-125\n", encoding="utf-8")
+    offers = load_book_quotes(path, "Rotowire")
+    assert [(o.player, o.over_odds, o.under_odds) for o in offers] == [("Kyrie Irving", 105, -125)]
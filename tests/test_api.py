@@ -0,0 +1,72 @@
+from __future__ import annotations
+
+import asyncio
+import os
+import shutil
+from pathlib import Path
+
+from arbitrage_model.api import OpportunityBoard, watch_directory
+from arbitrage_model.markets import CODEBOOK
+from arbitrage_model.models import BookOffer
+
+RAW = Path(__file__).resolve().parents[1] / "data" / "raw"
+
+
+def _offer(book: str, over: int, under: int, market: str = "points") -> BookOffer:
+    return BookOffer(
+        book=book,
+        player="Anthony Davis",
+        market=market,
+        line=25.5,
+        over_odds=over,
+        under_odds=under,
+        player_code=CODEBOOK.players.code("Anthony Davis"),
+        market_code=CODEBOOK.markets.code(market),
+        book_code=CODEBOOK.books.code(book),
+    )
+
+
+def test_a_book_fed_by_two_sources_keeps_its_first_source():
+    board = OpportunityBoard()
+    board.update("data/raw:Draftkings", [_offer("Draftkings", 120, -140), _offer("Draftkings", 110, -130, "assists")])
+    board.update("bus:Draftkings", [_offer("Draftkings", -150, 130)])
+    assert board.rejected == {"bus:Draftkings": ["Draftkings"]}
+    assert [o.over_odds for o in board.quotes(market="points")] == [120]
+
+    # Dropping the bus source must not remove the directory's lines, and vice versa.
+    board.update("bus:Draftkings", ())
+    assert board.rejected == {}
+    assert len(board.quotes()) == 2
+    board.update("data/raw:Draftkings", ())
+    board.update("bus:Draftkings", [_offer("DraftKings", -150, 130)])
+    assert [o.over_odds for o in board.quotes()] == [-150]
+
+
+def test_etag_differs_across_boards_at_the_same_version():
+    first, second = OpportunityBoard(), OpportunityBoard()
+    assert first.version == second.version == 0
+    assert first.etag != second.etag
+
+
+def test_watch_directory_serves_only_the_newest_capture_per_book(tmp_path):
+    for name in ("draftkings_props_2025-05-09.csv", "draftkings_props_2025-05-13.csv", "fanduel_props_sample.csv"):
+        shutil.copy(RAW / name, tmp_path / name)
+    os.utime(tmp_path / "draftkings_props_2025-05-09.csv", ns=(2_000_000_000_000_000_000,) * 2)
+
+    async def _run() -> OpportunityBoard:
+        board = OpportunityBoard()
+        task = asyncio.ensure_future(watch_directory(board, tmp_path, "*.csv", interval=0.01))
+        for _ in range(500):
+            if len(board._sources) == 2:
+                break
+            await asyncio.sleep(0.01)
+        task.cancel()
+        return board
+
+    board = asyncio.run(_run())
+    assert sorted(board._sources) == [f"{tmp_path}:Draftkings", f"{tmp_path}:Fanduel"]
+    assert {o.book for o in board.quotes()} == {"Draftkings", "Fanduel"}
+    # The 2025-05-09 capture was touched last, so its board is the live one.
+    assert board.quotes(player="Anthony Davis", book="draftkings")
+    assert not board.quotes(player="Corey Kispert", book="draftkings")
+    assert board.rejected == {}
@@ -0,0 +1,61 @@
+from __future__ import annotations
+
+from datetime import datetime, timezone
+from pathlib import Path
+
+import pytest
+
+from arbitrage_model.scrapers.archive import SnapshotArchiver, iter_index, load_snapshot
+from arbitrage_model.scrapers.offline import parse_archive
+
+FIXTURES = Path(__file__).parent / "fixtures"
+
+
+def _at(hour: int, minute: int = 0) -> datetime:
+    return datetime(2025, 5, 9, hour, minute, tzinfo=timezone.utc)
+
+
+def test_identical_pages_are_stored_once(tmp_path):
+    with SnapshotArchiver(tmp_path, codec="gzip") as archiver:
+        archiver.submit("draftkings", "<html>board A</html>", _at(18, 0))
+        archiver.submit("draftkings", "<html>board A</html>", _at(18, 5))
+        archiver.submit("draftkings", "<html>board B</html>", _at(18, 10))
+    entries = list(iter_index(tmp_path))
+    assert [e.deduplicated for e in entries] == [False, True, False]
+    first, repeat, other = entries
+    assert (repeat.bundle, repeat.offset, repeat.length) == (first.bundle, first.offset, first.length)
+    assert other.offset == first.offset + first.length
+    assert (tmp_path / first.bundle).stat().st_size == first.length + other.length
+
+    # A reopened archive still deduplicates against what is already stored.
+    with SnapshotArchiver(tmp_path, codec="gzip") as archiver:
+        archiver.submit("draftkings", "<html>board B</html>", _at(19, 0))
+    assert list(iter_index(tmp_path))[-1].deduplicated
+
+
+@pytest.mark.parametrize("codec", ["gzip", "zstd"])
+def test_round_trip_through_the_index(tmp_path, codec):
+    if codec == "zstd":
+        pytest.importorskip("zstandard")
+    pages = {"draftkings": "<html>Nikola Jokić −120</html>", "fanduel": "<html>Jayson Tatum</html>"}
+    with SnapshotArchiver(tmp_path, codec=codec, bucket_minutes=30) as archiver:
+        for minute, (book, page) in enumerate(pages.items()):
+            archiver.submit(book, page, _at(18, 40 + minute), url=f"https://{book}.test")
+    entries = list(iter_index(tmp_path))
+    assert {e.book: load_snapshot(tmp_path, e) for e in entries} == pages
+    suffix = "zst" if codec == "zstd" else "gz"
+    assert [e.bundle for e in entries] == [f"draftkings/2025-05-09T1830.{suffix}", f"fanduel/2025-05-09T1830.{suffix}"]
+    assert [e.book for e in iter_index(tmp_path, book="fanduel")] == ["fanduel"]
+    assert entries[0].url == "https://draftkings.test" and entries[0].codec == codec
+
+
+def test_parse_archive_fans_deduplicated_captures_out(tmp_path):
+    page = (FIXTURES / "draftkings.html").read_text(encoding="utf-8")
+    with SnapshotArchiver(tmp_path, codec="gzip") as archiver:
+        archiver.submit("draftkings", page, _at(18, 0))
+        archiver.submit("draftkings", page, _at(18, 30))
+        archiver.submit("fanduel", (FIXTURES / "fanduel.html").read_text(encoding="utf-8"), _at(18, 0))
+    frame = parse_archive(tmp_path, "draftkings", workers=1)
+    assert frame["captured_at"].unique().tolist() == [_at(18, 0).isoformat(), _at(18, 30).isoformat()]
+    assert frame["players"].tolist() == ["LeBron James", "Nikola Jokić"] * 2
+    assert frame[["line", "over", "under"]].values.tolist()[:2] == [[25.5, -115, -105], [28.5, 100, -120]]
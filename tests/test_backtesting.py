@@ -0,0 +1,70 @@
+from __future__ import annotations
+
+import pandas as pd
+import pytest
+
+from arbitrage_model.backtesting.analytics import attach_closing_lines, bets_frame, load_quote_history
+from arbitrage_model.backtesting.loader import align_predictions_to_quotes
+from arbitrage_model.backtesting.schemas import MarketQuote, PredictionInput
+from arbitrage_model.backtesting.simulator import simulate_expected_value
+
+
+def _quote(book, over, under):
+    return MarketQuote(book=book, player="Anthony Davis", market="points", line=25.5, over_odds=over, under_odds=under)
+
+
+def test_bet_is_attributed_to_the_book_offering_the_price():
+    quotes = [_quote("Draftkings", 100, -130), _quote("Fanduel", 120, -150), _quote("Bovada", -110, -110)]
+    pred = PredictionInput(player="Anthony Davis", market="points", line=25.5, prob_over=0.6)
+    result = simulate_expected_value([pred], align_predictions_to_quotes([pred], quotes))
+    (bet,) = result.bets
+    assert (bet.side, bet.odds, bet.book) == ("over", 120, "Fanduel")
+
+
+@pytest.mark.parametrize(
+    "game_time, expected",
+    [
+        ("2025-05-12T00:00", "2025-05-12 00:00+00:00"),
+        ("2025-05-12T00:00Z", "2025-05-12 00:00+00:00"),
+        ("2025-05-12T00:00-04:00", "2025-05-12 04:00+00:00"),
+        (pd.Timestamp("2025-05-12 02:00", tz="US/Eastern"), "2025-05-12 06:00+00:00"),
+    ],
+)
+def test_bets_frame_game_time_is_utc(game_time, expected):
+    pred = PredictionInput(player="Anthony Davis", market="points", line=25.5, prob_over=0.6)
+    result = simulate_expected_value([pred], align_predictions_to_quotes([pred], [_quote("Fanduel", 120, -150)]))
+    frame = bets_frame(result, game_time)
+    assert frame["game_time"].tolist() == [pd.Timestamp(expected)]
+
+
+def test_closing_line_is_taken_from_the_bet_book():
+    pred = PredictionInput(player="Anthony Davis", market="points", line=25.5, prob_over=0.6)
+    quotes = [_quote("Draftkings", 100, -130), _quote("Fanduel", 120, -150)]
+    result = simulate_expected_value([pred], align_predictions_to_quotes([pred], quotes))
+    history = pd.DataFrame(
+        {
+            "book": ["Draftkings", "Fanduel"],
+            "player": "Anthony Davis",
+            "market": "points",
+            "line": 25.5,
+            "over_odds": [105, 110],
+            "under_odds": [-135, -140],
+            "captured_at": pd.Timestamp("2025-05-11 23:00", tz="UTC"),
+        }
+    )
+    closed = attach_closing_lines(bets_frame(result, "2025-05-12T00:00Z"), history)
+    assert closed.loc[0, "close_odds"] == 110
+    assert closed.loc[0, "clv_pct"] == pytest.approx((2.2 / 2.1 - 1) * 100)
+
+
+def test_quote_history_skips_rows_without_prices(tmp_path):
+    (tmp_path / "rotowire_props_latest.csv").write_text(
+        "players,line,over,under\nLuka Doncic,32.5,,\nKyrie Irving,24.5,+105,\n", encoding="utf-8"
+    )
+    (tmp_path / "draftkings_props_2025-05-09.csv").write_text(
+        "players,line,over,under\nAnthony Davis,25.5,+100,−130\nLuka Doncic,32.5,,-110\n", encoding="utf-8"
+    )
+    history = load_quote_history(tmp_path)
+    assert history[["book", "player", "over_odds", "under_odds"]].values.tolist() == [
+        ["Draftkings", "Anthony Davis", 100, -130]
+    ]
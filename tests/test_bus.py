@@ -0,0 +1,81 @@
+from __future__ import annotations
+
+import asyncio
+from datetime import datetime, timezone
+
+import numpy as np
+import pandas as pd
+
+from arbitrage_model.backtesting.schemas import PredictionInput
+from arbitrage_model.bus import EVSubscriber, QuoteBus, Subscription, frame_to_batch, serve_unix, subscribe_unix
+from arbitrage_model.markets import CODEBOOK
+
+
+def _batch(book: str, over: int = -110):
+    frame = pd.DataFrame({"players": ["A"], "line": [1.5], "over": [over], "under": [-110]})
+    return frame_to_batch(book, frame, captured_at=datetime(2025, 5, 1, tzinfo=timezone.utc))
+
+
+def test_frame_to_batch_skips_rows_without_prices():
+    frame = pd.DataFrame(
+        {
+            "players": ["Luka Doncic", "Kyrie Irving", "Anthony Davis", "LeBron James"],
+            "line": [32.5, 24.5, 25.5, 27.5],
+            "over": [None, np.nan, -115, 105],
+            "under": [None, -110, -105, " "],
+        }
+    )
+    batch = frame_to_batch("Rotowire", frame)
+    assert [(o.player, o.over_odds, o.under_odds) for o in batch.offers] == [("Anthony Davis", -115, -105)]
+    assert frame_to_batch("Rotowire", frame.assign(over=None, under=None)).offers == ()
+
+
+def test_ev_subscriber_rebuilds_its_index_after_a_codebook_reset():
+    prediction = PredictionInput(player="A", market="points", line=1.5, prob_over=0.7)
+    ev = EVSubscriber([prediction], min_edge_pct=0.5)
+    assert [bet.side for bet in ev(_batch("Draftkings"))] == ["over"]
+    before = CODEBOOK.players.code("A")
+    CODEBOOK.reset()
+    for i in range(before + 1):  # so "A" gets a different code than the index was built with
+        CODEBOOK.players.code(f"Someone Else {i}")
+    assert [bet.side for bet in ev(_batch("Draftkings"))] == ["over"]
+
+
+def test_coalesce_counts_replacements_separately():
+    async def _run() -> Subscription:
+        sub = Subscription("csv", maxsize=4, policy="coalesce")
+        await sub.put(_batch("DraftKings", -110))
+        await sub.put(_batch("DraftKings", -115))
+        await sub.put(_batch("FanDuel"))
+        return sub
+
+    sub = asyncio.run(_run())
+    stats = sub.stats()
+    assert (stats.delivered, stats.dropped, stats.replaced, stats.depth) == (2, 0, 1, 2)
+    assert sub._items[0].offers[0].over_odds == -115
+
+
+def test_unix_client_is_attached_and_unsubscribed_on_hangup(tmp_path):
+    async def _run() -> None:
+        path = tmp_path / "quotes.sock"
+        async with QuoteBus() as bus:
+            await serve_unix(bus, path)
+            stream = subscribe_unix(path)
+            receive = asyncio.ensure_future(stream.__anext__())
+            while not bus.stats():
+                await asyncio.sleep(0.01)
+            await bus.publish(_batch("DraftKings"))
+            batch = await asyncio.wait_for(receive, 5)
+            assert batch.book == "DraftKings"
+            [stats] = bus.stats()
+            assert (stats.delivered, stats.handled) == (1, 1)
+
+            # Hang up while idle: the subscriber must go away without another publish.
+            await stream.aclose()
+            for _ in range(500):
+                if not bus.stats():
+                    break
+                await asyncio.sleep(0.01)
+            assert bus.stats() == []
+
+    asyncio.run(_run())
@@ -0,0 +1,61 @@
+from __future__ import annotations
+
+import pytest
+
+from arbitrage_model.aggregator import find_two_way_arbs
+from arbitrage_model.markets import CODEBOOK, Codebook, quote_key, split_market_from_stem
+from arbitrage_model.models import BookOffer
+
+
+@pytest.mark.parametrize(
+    "stem, expected",
+    [
+        ("draftkings_rebounds_props_2025-05-09", ("draftkings_props_2025-05-09", "rebounds")),
+        ("prizepicks_pts_rebs_asts_props_sample", ("prizepicks_props_sample", "points_rebounds_assists")),
+        ("betmgm_pa_props_latest", ("betmgm_props_latest", "points_assists")),
+        ("draftkings_props_2025-05-09", ("draftkings_props_2025-05-09", None)),
+        ("fanduel_rebounds", ("fanduel", "rebounds")),
+        ("betmgm_pa", ("betmgm_pa", None)),  # state suffix, not a market
+        ("caesars_az", ("caesars_az", None)),
+        ("rotowire_compare_props_latest", ("rotowire_compare_props_latest", None)),
+    ],
+)
+def test_split_market_from_stem(stem, expected):
+    assert split_market_from_stem(stem) == expected
+
+
+def _stamped(book: str, player: str, over: int, under: int) -> BookOffer:
+    return BookOffer(
+        book=book,
+        player=player,
+        market="points",
+        line=20.5,
+        over_odds=over,
+        under_odds=under,
+        player_code=CODEBOOK.players.code(player),
+        market_code=CODEBOOK.markets.code("points"),
+        book_code=CODEBOOK.books.code(book),
+    )
+
+
+def test_trim_starts_new_tables_and_leaves_handed_out_names_intact():
+    codebook = Codebook()
+    names = codebook.players.names
+    for i in range(4):
+        codebook.players.code(f"P{i}")
+    assert not codebook.trim(max_names=4) and codebook.generation == 0
+    codebook.players.code("P4")
+    assert codebook.trim(max_names=4) and codebook.generation == 1
+    assert len(codebook.players) == 0 and names == ["P0", "P1", "P2", "P3", "P4"]
+    assert codebook.players.code("P4") == 0
+
+
+def test_codes_stamped_before_a_reset_are_re_encoded():
+    CODEBOOK.players.code("Padding Player")  # so stale and fresh codes for the player differ
+    stale = _stamped("Draftkings", "Jalen Brunson", 105, -125)
+    CODEBOOK.reset()
+    fresh = _stamped("Fanduel", "Jalen Brunson", -120, 110)
+    assert stale.player_code != fresh.player_code
+    assert quote_key(stale) == quote_key(fresh) == (fresh.player_code, fresh.market_code, 20.5)
+    [arb] = find_two_way_arbs([stale, fresh], bankroll=100.0)  # still one group
+    assert (arb.over_book, arb.under_book) == ("Draftkings", "Fanduel")
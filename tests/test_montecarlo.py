@@ -0,0 +1,69 @@
+from __future__ import annotations
+
+import numpy as np
+import pytest
+
+from arbitrage_model.backtesting.montecarlo import simulate_bankroll_paths
+from arbitrage_model.backtesting.schemas import SimBet
+
+
+def _bets(n: int = 60, prob: float = 0.55, stake: float = 20.0, odds: int = -110) -> list[SimBet]:
+    return [
+        SimBet(
+            player=f"Player {i}",
+            market="points",
+            line=20.5,
+            side="over",
+            book="Draftkings",
+            stake=stake,
+            odds=odds,
+            prob=prob,
+            edge=0.0,
+            kelly_fraction=0.0,
+        )
+        for i in range(n)
+    ]
+
+
+@pytest.mark.parametrize("compounding", [True, False])
+def test_fixed_seed_is_reproducible_and_independent_of_workers(compounding):
+    kwargs = dict(paths=1_000, compounding=compounding, chunk_size=256, seed=42)
+    single = simulate_bankroll_paths(_bets(), 1_000.0, workers=1, **kwargs)
+    again = simulate_bankroll_paths(_bets(), 1_000.0, workers=1, **kwargs)
+    pooled = simulate_bankroll_paths(_bets(), 1_000.0, workers=2, **kwargs)
+    for other in (again, pooled):
+        np.testing.assert_array_equal(other.final_bankroll, single.final_bankroll)
+        np.testing.assert_array_equal(other.max_drawdown, single.max_drawdown)
+        np.testing.assert_array_equal(other.percentile_paths, single.percentile_paths)
+        assert other.ruin_probability == single.ruin_probability
+    other_seed = simulate_bankroll_paths(_bets(), 1_000.0, workers=1, **{**kwargs, "seed": 7})
+    assert not np.array_equal(other_seed.final_bankroll, single.final_bankroll)
+
+
+def test_result_shapes_and_bounds():
+    percentiles = (5.0, 50.0, 95.0)
+    result = simulate_bankroll_paths(
+        _bets(), 1_000.0, paths=1_500, percentiles=percentiles, checkpoints=10, chunk_size=512, seed=1
+    )
+    assert result.final_bankroll.shape == result.max_drawdown.shape == (1_500,)
+    assert result.checkpoints[0] == 0 and result.checkpoints[-1] == 60 and len(result.checkpoints) == 11
+    assert result.percentile_paths.shape == (3, 11)
+    np.testing.assert_allclose(result.percentile_paths[:, 0], 1_000.0)
+    assert np.all(np.diff(result.percentile_paths, axis=0) >= 0)  # percentile rows are ordered
+    assert ((result.max_drawdown >= 0) & (result.max_drawdown <= 1)).all()
+    assert 0.0 <= result.ruin_probability <= 1.0
+    assert list(result.final_percentiles()) == list(percentiles)
+
+
+def test_certain_outcomes_and_ruin():
+    winners = simulate_bankroll_paths(_bets(10, prob=1.0, stake=100.0, odds=100), 1_000.0, paths=64, seed=0)
+    np.testing.assert_allclose(winners.final_bankroll, 1_000.0 * 1.1**10, rtol=1e-5)
+    assert winners.ruin_probability == 0.0 and winners.max_drawdown.max() == 0.0
+
+    all_in = simulate_bankroll_paths(_bets(1, prob=0.0, stake=1_000.0), 1_000.0, paths=64, seed=0)
+    assert all_in.ruin_probability == 1.0
+    np.testing.assert_allclose(all_in.max_drawdown, 1.0)
+
+    flat = simulate_bankroll_paths(_bets(5, prob=0.0, stake=100.0), 1_000.0, paths=8, compounding=False, seed=0)
+    np.testing.assert_allclose(flat.final_bankroll, 500.0)
+    assert flat.ruin_probability == 0.0
@@ -0,0 +1,108 @@
+from __future__ import annotations
+
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+import pandas as pd
+import pytest
+
+from arbitrage_model.scrapers.offline import parse_html
+from arbitrage_model.scrapers.selectors import CLASS_NAME, CSS_SELECTOR, XPATH, extract_fields
+
+FIXTURES = Path(__file__).parent / "fixtures"
+
+
+def test_draftkings_fixture():
+    frame = parse_html(FIXTURES / "draftkings.html", "draftkings")
+    assert frame.to_dict("records") == [
+        {"players": "LeBron James", "line": 25.5, "over": -115, "under": -105},
+        {"players": "Nikola Jokić", "line": 28.5, "over": 100, "under": -120},
+    ]
+
+
+def test_fanduel_fixture():
+    frame = parse_html(FIXTURES / "fanduel.html", "fanduel")
+    assert frame["players"].tolist() == ["Stephen Curry", "Jayson Tatum"]
+    assert frame[["line", "over", "under"]].values.tolist() == [[4.5, 110, -140], [8.5, -110, -110]]
+
+
+def test_prizepicks_fixture():
+    frame = parse_html(FIXTURES / "prizepicks.html", "prizepicks")
+    assert frame.to_dict("records") == [
+        {"players": "Anthony Edwards", "line": 26.5, "over": 25, "under": -25},
+        {"players": "Tyrese Haliburton", "line": 9.5, "over": 0, "under": 0},
+    ]
+
+
+def test_espn_boxscore_fixture():
+    frame = parse_html(FIXTURES / "espn_boxscore.html", "espn_boxscore")
+    assert frame["players"].tolist() == ["J. Tatum", "J. Brown"]
+    tatum, brown = frame.iloc[0], frame.iloc[1]
+    stats = tatum[["minutes", "points", "rebounds", "assists", "threes"]].tolist()
+    assert stats == [38.0, 29, 9, 6, 4]
+    assert pd.isna(brown["minutes"]) and pd.isna(brown["points"])
+
+
+@pytest.mark.parametrize("chunk_size", [1, 7, 64, 1 << 16])
+def test_chunked_feed_matches_whole_document(chunk_size):
+    locators = {
+        "names": (CLASS_NAME, "sportsbook-row-name"),
+        "rows": (CSS_SELECTOR, "tr[data-tooltip]"),
+        "cells": (XPATH, "//td//span[contains(@class,'outcome-cell__element')]"),
+    }
+    path = FIXTURES / "draftkings.html"
+    whole = extract_fields(path.read_text(encoding="utf-8"), locators)
+    assert extract_fields(path, locators, chunk_size=chunk_size) == whole
+    assert whole["names"] == ["LeBron James", "Nikola Jokić"]  # script, style and comment text ignored
+    assert len(whole["rows"]) == 1  # `>` inside a quoted attribute does not end the tag
+    assert whole["cells"] == ["−115", "-105", "+100", "−120"]
+
+
+def test_nested_matches_and_block_text():
+    html = "<ul class='board'><li class='row'>A<br>B</li><li class='row'><b>C</b> <i>D</i></li></ul>"
+    fields = extract_fields(html, {"board": (CLASS_NAME, "board"), "rows": (CSS_SELECTOR, "ul.board li.row")})
+    assert fields["rows"] == ["A\nB", "C D"]
+    assert fields["board"] == ["A\nB\nC D"]
+
+
+def test_offline_parsing_does_not_need_selenium():
+    code = (
+        "import sys; sys.modules['selenium'] = None\n"
+        "from pathlib import Path\n"
+        "from arbitrage_model.scrapers.offline import PARSERS, parse_html\n"
+        "import importlib\n"
+        "for module, *_ in PARSERS.values(): importlib.import_module(module)\n"
+        f"print(len(parse_html(Path({str(FIXTURES / 'draftkings.html')!r}), 'draftkings')))\n"
+    )
+    src = str(Path(__file__).resolve().parents[1] / "src")
+    env = {**os.environ, "PYTHONPATH": os.pathsep.join(filter(None, [src, os.environ.get("PYTHONPATH")]))}
+    result = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, env=env, check=False)
+    assert result.returncode == 0, result.stderr
+    assert result.stdout.strip() == "2"
+
+
+def test_rotowire_comparison_fixture():
+    frame = parse_html(FIXTURES / "rotowire_comparison.html", "rotowire_comparison")
+    assert frame.to_dict("records") == [
+        {"players": "Luka Doncic", "line": 32.5, "over": -115, "under": -105, "book": "Draftkings"},
+        {"players": "Kyrie Irving", "line": 24.5, "over": 105, "under": -125, "book": "Draftkings"},
+        {"players": "Luka Doncic", "line": 33.5, "over": 100, "under": -120, "book": "Fanduel"},
+    ]
+
+
+def test_rotowire_comparison_without_prices_writes_a_loadable_file(tmp_path):
+    from arbitrage_model.aggregator import load_book_quotes
+    from arbitrage_model.scrapers.rotowire import parse_rotowire_comparison
+
+    fields = {
+        "headers": ["DraftKings", "FanDuel", "Line", "Line"],
+        "players": ["Luka Doncic", "Kyrie Irving"],
+        "cells": ["32.5", "24.5", "33.5", "24.5"],
+    }
+    frame = parse_rotowire_comparison(fields)
+    assert frame.empty
+    path = tmp_path / "rotowire_compare_props_latest.csv"
+    frame.to_csv(path, index=False)
+    assert load_book_quotes(path, "Rotowire Compare") == []
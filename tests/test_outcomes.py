@@ -0,0 +1,52 @@
+from __future__ import annotations
+
+from datetime import date
+
+import pandas as pd
+
+from arbitrage_model.backtesting.analytics import label_outcomes
+from arbitrage_model.outcomes import GameRef, OutcomeStore, ingest_games
+
+
+def _box(*players: str) -> pd.DataFrame:
+    return pd.DataFrame({"players": list(players), "minutes": 30.0, "points": 10, "rebounds": 5})
+
+
+def test_name_collision_fails_the_game_instead_of_overwriting(tmp_path):
+    games = [
+        GameRef("1", date(2025, 1, 5), "https://espn.test/1"),
+        GameRef("2", date(2025, 1, 5), "https://espn.test/2"),
+        GameRef("3", date(2025, 1, 5), "https://espn.test/3"),
+    ]
+    boxes = {
+        "https://espn.test/1": _box("J. Williams", "L. James"),
+        "https://espn.test/2": _box("J. Williams", "S. Curry"),
+        "https://espn.test/3": _box("K. Durant", "K. Durant"),
+    }
+    with OutcomeStore(tmp_path / "outcomes.sqlite") as store:
+        summary = ingest_games(store, games, boxes.__getitem__, workers=1)
+        assert summary.ingested == 1
+        assert sorted(game.game_id for game, _ in summary.failed) == ["2", "3"]
+        assert all("IntegrityError" in error for _, error in summary.failed)
+        assert store.stored_games() == {"1"}
+        assert store.frame()["player"].tolist() == ["J. Williams", "L. James"]
+
+        # Re-ingesting a stored game still replaces it.
+        assert store.ingest(_box("J. Williams"), "1", date(2025, 1, 5)) == 1
+        assert store.frame()["player"].tolist() == ["J. Williams"]
+
+
+def test_abbreviated_box_score_names_settle_full_quoted_names(tmp_path):
+    predictions = pd.DataFrame(
+        {"player": ["Jayson Tatum", "Jaylen Brown"], "market": "points", "line": [26.5, 22.5], "prob_over": 0.5}
+    )
+    with OutcomeStore(tmp_path / "outcomes.sqlite") as store:
+        store.ingest(
+            pd.DataFrame({"players": ["J. Tatum", "J. Brown"], "minutes": 36.0, "points": [31, 18]}),
+            "401",
+            date(2025, 1, 5),
+        )
+        assert store.lookup(["Jayson Tatum", "Jaylen Brown"], ["2025-01-05"] * 2, "points").tolist() == [31.0, 18.0]
+        labeled = label_outcomes(predictions, store.outcomes(["points"], game_date="2025-01-05"))
+    rows = labeled[["player", "actual", "over_hit"]].values.tolist()
+    assert rows == [["Jayson Tatum", 31, 1], ["Jaylen Brown", 18, 0]]
@@ -0,0 +1,35 @@
+from __future__ import annotations
+
+import pandas as pd
+
+from arbitrage_model.backtesting.schemas import MarketQuote
+from arbitrage_model.projections import predict_lines, rolling_form
+
+
+def _box(players: list[str], games: int = 5) -> pd.DataFrame:
+    return pd.DataFrame(
+        {
+            "player": [p for p in players for _ in range(games)],
+            "game_date": pd.to_datetime([f"2025-01-{d + 1:02d}" for _ in players for d in range(games)]),
+            "minutes": 32.0,
+            "points": [20 + d for _ in players for d in range(games)],
+        }
+    )
+
+
+def _quote(player: str, book: str = "Draftkings") -> MarketQuote:
+    return MarketQuote(book=book, player=player, market="points", line=21.5, over_odds=-110, under_odds=-110)
+
+
+def test_quoted_names_sharing_a_key_are_skipped():
+    form = rolling_form(_box(["J. Williams", "L. James"]), markets=["points"])
+    quotes = [_quote("Jalen Williams"), _quote("Jaylin Williams", "Fanduel"), _quote("LeBron James")]
+    predictions = predict_lines(quotes, form)
+    assert predictions["player"].tolist() == ["LeBron James"]
+
+
+def test_one_quoted_name_matches_an_abbreviated_form_name():
+    form = rolling_form(_box(["J. Williams"]), markets=["points"])
+    predictions = predict_lines([_quote("Jalen Williams"), _quote("Jalen Williams", "Fanduel")], form)
+    assert predictions["player"].tolist() == ["Jalen Williams"]
+    assert 0 < predictions["prob_over"].iloc[0] < 1
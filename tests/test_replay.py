@@ -0,0 +1,172 @@
+from __future__ import annotations
+
+from datetime import datetime, timedelta, timezone
+
+import numpy as np
+import pytest
+
+from arbitrage_model import replay as replay_module
+from arbitrage_model.replay import (
+    FullRescanScanner,
+    IncrementalScanner,
+    QuoteEvent,
+    Snapshot,
+    bursts,
+    diff_quotes,
+    replay,
+    snapshot_events,
+)
+from arbitrage_model.vectorized import decode_offers, synthetic_board
+
+T0 = datetime(2025, 5, 9, 18, 0, tzinfo=timezone.utc)
+
+
+def test_diff_quotes_emits_changed_new_then_pulled_lines():
+    a, b, c, d = ("A", "points", 20.5), ("B", "points", 8.5), ("C", "assists", 4.5), ("D", "points", 11.5)
+    before = {a: (-110, -110), b: (100, -120), c: (-105, -115)}
+    after = {a: (-110, -110), b: (105, -125), d: (-110, -110)}
+    events = diff_quotes("Draftkings", before, after, at=3.0)
+    assert [(e.player, e.over_odds, e.under_odds, e.removed) for e in events] == [
+        ("B", 105, -125, False),
+        ("D", -110, -110, False),
+        ("C", None, None, True),
+    ]
+    assert {e.at for e in events} == {3.0} and {e.book for e in events} == {"Draftkings"}
+    assert diff_quotes("Draftkings", after, after, at=4.0) == []
+
+
+def test_snapshot_events_diff_each_book_against_its_own_previous_board():
+    line = ("A", "points", 20.5)
+    snapshots = [
+        Snapshot("Fanduel", T0 + timedelta(minutes=1), {line: (-110, -110)}),
+        Snapshot("Draftkings", T0, {line: (100, -120)}),
+        Snapshot("Draftkings", T0 + timedelta(minutes=2), {line: (100, -120)}),
+        Snapshot("Draftkings", T0 + timedelta(minutes=3), {}),
+        Snapshot("Fanduel", T0 + timedelta(minutes=3), {line: (-105, -115)}),
+    ]
+    events = snapshot_events(snapshots)
+    assert [(e.at, e.book, e.over_odds) for e in events] == [
+        (0.0, "Draftkings", 100),  # first board: one burst of inserts
+        (60.0, "Fanduel", -110),
+        # unchanged Draftkings capture at 120s emits nothing
+        (180.0, "Draftkings", None),
+        (180.0, "Fanduel", -105),
+    ]
+    assert [len(b) for b in bursts(events)] == [1, 1, 2]
+    assert snapshot_events([]) == []
+
+
+def _snapshots(steps: int = 6, seed: int = 5) -> list[Snapshot]:
+    """Per-book boards from a synthetic board, then `steps` captures of repriced and pulled lines."""
+    rng = np.random.default_rng(seed)
+    boards: dict[str, dict] = {}
+    for o in decode_offers(synthetic_board(players=80, markets=2, lines=2, books=4, seed=seed)):
+        boards.setdefault(o.book, {})[(o.player, o.market, o.line)] = (o.over_odds, o.under_odds)
+    full = {book: dict(quotes) for book, quotes in boards.items()}
+    snapshots = [Snapshot(book, T0, dict(quotes)) for book, quotes in boards.items()]
+    for step in range(1, steps + 1):
+        for book, quotes in boards.items():
+            for key, odds in full[book].items():
+                roll = rng.random()
+                if roll < 0.05:
+                    quotes.pop(key, None)
+                elif roll < 0.25:
+                    quotes[key] = tuple(int(v) for v in rng.choice([-130, -115, -105, 100, 110, 120], size=2))
+                elif key not in quotes:
+                    quotes[key] = odds
+            snapshots.append(Snapshot(book, T0 + timedelta(seconds=30 * step), dict(quotes)))
+    return snapshots
+
+
+def _state(scanner):
+    return {key: (o.over_book, o.under_book, round(o.edge_pct, 9)) for key, o in scanner.arbs.items()}
+
+
+def test_incremental_and_full_rescan_agree_after_every_burst():
+    incremental, full = IncrementalScanner(250.0), FullRescanScanner(250.0)
+    appeared = [0, 0]
+    for burst in bursts(snapshot_events(_snapshots())):
+        appeared[0] += incremental.apply(burst)
+        appeared[1] += full.apply(burst)
+        assert _state(incremental) == _state(full)
+    assert appeared[0] == appeared[1] > 0
+    assert [o.edge_pct for o in incremental.opportunities] == pytest.approx([o.edge_pct for o in full.opportunities])
+
+
+def test_incremental_scanner_only_rescans_touched_lines(monkeypatch):
+    events = snapshot_events(_snapshots(steps=3))
+    groups = bursts(events)
+    scanner = IncrementalScanner(250.0)
+    scanner.apply(groups[0])
+
+    scanned = []
+    real = replay_module.find_two_way_arbs
+
+    def _counting(offers, bankroll):
+        scanned.append(len(offers))
+        return real(offers, bankroll)
+
+    monkeypatch.setattr(replay_module, "find_two_way_arbs", _counting)
+    for burst in groups[1:]:
+        touched = {(e.player, e.market, e.line) for e in burst}
+        before = len(scanned)
+        scanner.apply(burst)
+        assert len(scanned) - before <= len(touched) < len(scanner.quotes)
+
+
+class _FakeClock:
+    def __init__(self) -> None:
+        self.now = 100.0
+
+    def __call__(self) -> float:
+        return self.now
+
+    def sleep(self, seconds: float) -> None:
+        self.now += seconds
+
+
+class _SlowScanner:
+    """Takes `service` seconds of fake time per apply() call."""
+
+    def __init__(self, clock: _FakeClock, service: float) -> None:
+        self.clock, self.service, self.calls = clock, service, 0
+
+    def apply(self, events) -> int:
+        self.clock.now += self.service
+        self.calls += 1
+        return 1
+
+    @property
+    def opportunities(self):
+        return []
+
+
+def _events(*times: float) -> list[QuoteEvent]:
+    return [QuoteEvent(at, "Draftkings", f"P{i}", "points", 20.5, -110, -110) for i, at in enumerate(times)]
+
+
+def test_replay_latency_includes_queueing_when_the_scanner_falls_behind():
+    clock = _FakeClock()
+    events = _events(0.0, 0.0, 10.0, 40.0)
+    result = replay(events, _SlowScanner(clock, service=15.0), speed=1.0, clock=clock, sleep=clock.sleep)
+    # Bursts arrive at 0, 10 and 40 s; each takes 15 s, so the second waits 5 s behind the first.
+    np.testing.assert_allclose(result.latencies, [15.0, 15.0, 20.0, 15.0])
+    assert (result.events, result.bursts, result.arbs_detected) == (4, 3, 3)
+    assert result.scheduled_s == 40.0 and result.busy_s == 45.0 and result.wall_s == 55.0
+    assert result.throughput == pytest.approx(4 / 45.0)
+    assert result.latency_percentiles([50.0]) == {50.0: pytest.approx(15_000.0)}
+
+
+def test_replay_speed_gap_cap_and_per_event():
+    clock = _FakeClock()
+    events = _events(0.0, 0.0, 3600.0)
+    scanner = _SlowScanner(clock, service=1.0)
+    result = replay(events, scanner, speed=10.0, max_gap=60.0, per_event=True, clock=clock, sleep=clock.sleep)
+    assert result.scheduled_s == pytest.approx(6.0)  # the hour gap is capped at 60 s, then sped up 10x
+    np.testing.assert_allclose(result.latencies, [1.0, 2.0, 1.0])  # per event: the second waits for the first
+    assert scanner.calls == 3
+
+    clock = _FakeClock()
+    flat_out = replay(events, _SlowScanner(clock, service=1.0), speed=0, clock=clock, sleep=clock.sleep)
+    np.testing.assert_allclose(flat_out.latencies, [1.0, 1.0, 1.0])  # pure service time
+    assert flat_out.scheduled_s == 0.0 and flat_out.offered_rate == float("inf")
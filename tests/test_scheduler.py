@@ -0,0 +1,45 @@
+from __future__ import annotations
+
+import threading
+
+import pandas as pd
+
+from arbitrage_model.scheduler import AdaptiveScheduler, PollTarget
+
+
+def test_poll_threads_are_reused_across_runs():
+    # `watch` keeps one browser per poll thread in a threading.local; count how many get built.
+    local = threading.local()
+    browsers = []
+
+    def _scrape() -> pd.DataFrame:
+        if getattr(local, "browser", None) is None:
+            local.browser = object()
+            browsers.append(local.browser)
+        return pd.DataFrame({"players": ["A"], "line": [1.5], "over": [-110], "under": [-110]})
+
+    targets = [PollTarget(book=f"book{i}", scrape=_scrape, min_interval=0.0) for i in range(4)]
+    with AdaptiveScheduler(targets, polls_per_minute=1e6, max_concurrency=2) as scheduler:
+        for _ in range(3):
+            scheduler.run(max_polls=4)
+    assert sum(state.polls for state in scheduler.states.values()) >= 12
+    assert len(browsers) <= 2
+
+
+def test_failing_snapshot_callback_backs_off_that_book_only(caplog):
+    def _scrape() -> pd.DataFrame:
+        return pd.DataFrame({"players": ["A"], "line": [1.5], "over": [-110], "under": [-110]})
+
+    def _on_snapshot(book, frame, captured_at) -> None:
+        if book == "rotowire":
+            raise AttributeError("'NoneType' object has no attribute 'strip'")
+
+    targets = [PollTarget(book=book, scrape=_scrape, min_interval=0.0) for book in ("rotowire", "draftkings")]
+    with AdaptiveScheduler(targets, polls_per_minute=1e6, on_snapshot=_on_snapshot) as scheduler:
+        scheduler.run(max_polls=6)
+    rotowire, draftkings = scheduler.states["rotowire"], scheduler.states["draftkings"]
+    assert rotowire.failures == rotowire.consecutive_failures >= 1
+    assert rotowire.last_error.startswith("AttributeError")
+    assert rotowire.interval > draftkings.interval
+    assert draftkings.polls >= 1 and draftkings.failures == 0
+    assert "on_snapshot failed for rotowire" in caplog.text
@@ -0,0 +1,120 @@
+from __future__ import annotations
+
+import pytest
+
+from arbitrage_model.scrapers import base
+from arbitrage_model.scrapers.base import (
+    DEFAULT_BLOCKING,
+    RESOURCE_PATTERNS,
+    TRACKER_PATTERNS,
+    BlockProfile,
+    apply_blocking,
+    load_page,
+    wait_for_stable_count,
+)
+from arbitrage_model.scrapers.espn_boxscore import BLOCKING as ESPN_BLOCKING
+from arbitrage_model.scrapers.selectors import CLASS_NAME
+
+ROWS = (CLASS_NAME, "sportsbook-row-name")
+
+
+class FakeTime:
+    """Stands in for the `time` module inside scrapers.base: sleeping advances the clock."""
+
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def monotonic(self) -> float:
+        return self.now
+
+    def perf_counter(self) -> float:
+        return self.now
+
+    def sleep(self, seconds: float) -> None:
+        self.now += seconds
+
+
+class FakeDriver:
+    """A page whose element count follows `counts(now)`, with a recording CDP session."""
+
+    def __init__(self, clock: FakeTime, counts=lambda now: 0) -> None:
+        self.clock = clock
+        self.counts = counts
+        self.cdp: list[tuple[str, dict]] = []
+
+    def execute_cdp_cmd(self, cmd: str, params: dict) -> dict:
+        self.cdp.append((cmd, params))
+        return {}
+
+    def find_elements(self, by: str, value: str) -> list[object]:
+        return [object()] * self.counts(self.clock.now)
+
+    def get(self, url: str) -> None:
+        self.clock.now += 0.5
+
+
+@pytest.fixture
+def clock(monkeypatch) -> FakeTime:
+    fake = FakeTime()
+    monkeypatch.setattr(base, "time", fake)
+    return fake
+
+
+def test_default_profile_blocks_heavy_resources_and_trackers():
+    patterns = DEFAULT_BLOCKING.patterns()
+    for kind in ("image", "font", "media"):
+        assert set(RESOURCE_PATTERNS[kind]) <= set(patterns)
+    assert not set(RESOURCE_PATTERNS["stylesheet"]) & set(patterns)  # CSS decides what `.text` returns
+    assert patterns[-len(TRACKER_PATTERNS) :] == list(TRACKER_PATTERNS)
+    assert len(patterns) == len(set(patterns))
+
+    espn = ESPN_BLOCKING.patterns()
+    assert espn[: len(patterns)] == patterns and espn[-1] == "*espncdn.com/combiner/i*"
+    assert BlockProfile(url_patterns=("*.png*",)).patterns().count("*.png*") == 1
+    with pytest.raises(ValueError, match="Unknown resource types"):
+        BlockProfile(resource_types=("video",)).patterns()
+
+
+def test_apply_blocking_only_talks_to_cdp_when_the_profile_changes(clock):
+    driver = FakeDriver(clock)
+    assert apply_blocking(driver, DEFAULT_BLOCKING) == len(DEFAULT_BLOCKING.patterns())
+    assert driver.cdp == [("Network.enable", {}), ("Network.setBlockedURLs", {"urls": DEFAULT_BLOCKING.patterns()})]
+
+    apply_blocking(driver, DEFAULT_BLOCKING)
+    assert len(driver.cdp) == 2  # same profile: free
+
+    apply_blocking(driver, ESPN_BLOCKING)
+    assert driver.cdp[-1] == ("Network.setBlockedURLs", {"urls": ESPN_BLOCKING.patterns()})
+    assert apply_blocking(driver, None) == 0
+    assert driver.cdp[-1] == ("Network.setBlockedURLs", {"urls": []})
+    assert apply_blocking(object(), DEFAULT_BLOCKING) == 0  # no CDP support
+
+
+def test_wait_returns_once_the_count_settles(clock):
+    # Rows render in batches of 10 every 0.3 s until 40 are on the page at t=0.9.
+    driver = FakeDriver(clock, counts=lambda now: min(int(now / 0.3 + 1e-9) + 1, 4) * 10)
+    assert wait_for_stable_count(driver, ROWS, timeout=10.0, settle=0.75) == (40, True)
+    assert 0.9 + 0.75 <= clock.now < 0.9 + 0.75 + 0.2
+
+
+def test_wait_times_out_with_rows_still_changing(clock):
+    driver = FakeDriver(clock, counts=lambda now: int(now * 10) + 1)  # never settles
+    count, stable = wait_for_stable_count(driver, ROWS, timeout=2.0, settle=0.75)
+    assert not stable and count >= 20
+    assert clock.now == pytest.approx(2.0)
+
+
+def test_wait_raises_when_nothing_matches(clock):
+    exceptions = pytest.importorskip("selenium.common.exceptions")
+    with pytest.raises(exceptions.TimeoutException):
+        wait_for_stable_count(FakeDriver(clock), ROWS, timeout=1.0)
+    assert clock.now == pytest.approx(1.0)
+
+
+def test_load_page_times_navigation_and_readiness(clock):
+    driver = FakeDriver(clock, counts=lambda now: 12 if now >= 0.5 else 0)
+    timing = load_page(driver, "draftkings", "https://dk.test", ROWS, wait_time=5.0, blocking=DEFAULT_BLOCKING)
+    assert (timing.book, timing.elements, timing.stable) == ("draftkings", 12, True)
+    assert timing.navigation_s == pytest.approx(0.5)
+    assert timing.ready_s == pytest.approx(0.8, abs=0.11)
+    assert timing.blocked_patterns == len(DEFAULT_BLOCKING.patterns())
@@ -0,0 +1,82 @@
+from __future__ import annotations
+
+import pytest
+
+from arbitrage_model.aggregator import find_two_way_arbs
+from arbitrage_model.markets import CODEBOOK
+from arbitrage_model.models import BookOffer
+from arbitrage_model.sharding import ShardedScanner
+from arbitrage_model.vectorized import decode_offers, encode_offers, find_two_way_arbs_vectorized, synthetic_board
+
+
+def _by_line(opportunities):
+    return {(o.player, o.market, o.line): o for o in opportunities}
+
+
+def _assert_same(expected, actual):
+    assert len(actual) == len(expected)
+    assert [o.edge_pct for o in actual] == pytest.approx([o.edge_pct for o in expected])
+    actual = _by_line(actual)
+    for key, want in _by_line(expected).items():
+        got = actual[key]
+        assert (got.over_book, got.under_book, got.over_odds, got.under_odds) == (
+            want.over_book,
+            want.under_book,
+            want.over_odds,
+            want.under_odds,
+        )
+        assert (got.stake_over, got.stake_under, got.expected_profit) == pytest.approx(
+            (want.stake_over, want.stake_under, want.expected_profit)
+        )
+
+
+@pytest.fixture(scope="module")
+def board():
+    return synthetic_board(players=300, markets=3, lines=2, books=5, seed=11)
+
+
+@pytest.fixture(scope="module")
+def reference(board):
+    opportunities = find_two_way_arbs(decode_offers(board), bankroll=250.0)
+    assert opportunities  # the seeded board must contain arbitrages for the comparison to mean anything
+    return opportunities
+
+
+def test_vectorized_scan_matches_reference(board, reference):
+    _assert_same(reference, find_two_way_arbs_vectorized(decode_offers(board), bankroll=250.0))
+
+
+@pytest.mark.parametrize("shards", [1, 3, 7])
+def test_sharded_scan_matches_reference(board, reference, shards):
+    with ShardedScanner(workers=2, shards=shards) as scanner:
+        _assert_same(reference, scanner.scan(board, bankroll=250.0))
+
+
+def _stamp(offers):
+    return [
+        BookOffer(
+            book=o.book,
+            player=o.player,
+            market=o.market,
+            line=o.line,
+            over_odds=o.over_odds,
+            under_odds=o.under_odds,
+            player_code=CODEBOOK.players.code(o.player),
+            market_code=CODEBOOK.markets.code(o.market),
+            book_code=CODEBOOK.books.code(o.book),
+        )
+        for o in offers
+    ]
+
+
+def test_stamped_offers_share_the_codebook_names_and_survive_a_reset():
+    offers = _stamp(decode_offers(synthetic_board(players=5, markets=2, lines=1, books=3, seed=2)))
+    arrays = encode_offers(offers)
+    assert arrays.players is CODEBOOK.players.names and arrays.books is CODEBOOK.books.names  # no per-call copy
+    assert decode_offers(arrays) == offers
+
+    CODEBOOK.reset()
+    assert decode_offers(arrays) == offers  # the lists it holds were not cleared
+    stale = encode_offers(offers)  # codes predate the reset: encoded locally instead
+    assert stale.players is not CODEBOOK.players.names and decode_offers(stale) == offers
+    assert encode_offers(_stamp(offers)).players is CODEBOOK.players.names